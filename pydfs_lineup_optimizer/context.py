@@ -3,6 +3,7 @@ from itertools import chain
 from pydfs_lineup_optimizer.player import Player
 from pydfs_lineup_optimizer.lineup import Lineup
 from pydfs_lineup_optimizer.exposure_strategy import BaseExposureStrategy, TotalExposureStrategy
+from pydfs_lineup_optimizer.players_table import PlayersTable, LineupsBitset
 
 
 class OptimizationContext:
@@ -26,6 +27,26 @@ class OptimizationContext:
         self.lineups = []  # type: List[Lineup]
         self.players_used_fppg = {}  # type: Dict[Player, float]
         self.exposure_strategy = exposure_strategy
+        self._players_table = None  # type: Optional[PlayersTable]
+        self._lineups_bitset = None  # type: Optional[LineupsBitset]
+
+    @property
+    def players_table(self) -> PlayersTable:
+        if self._players_table is None:
+            # Same order as players variables, duplicated players have single variable
+            self._players_table = PlayersTable(list(dict.fromkeys(self.players)))
+        return self._players_table
+
+    @property
+    def lineups_bitset(self) -> LineupsBitset:
+        """
+        Generated lineups encoded by players in order of players table, new lineups are encoded on access.
+        """
+        if self._lineups_bitset is None:
+            self._lineups_bitset = LineupsBitset(players=self.players_table.players)
+        if len(self._lineups_bitset) < len(self.lineups):
+            self._lineups_bitset.add_lineups(self.lineups[len(self._lineups_bitset):])
+        return self._lineups_bitset
 
     def add_lineup(self, lineup: Lineup) -> None:
         self.lineups.append(lineup)
@@ -1,38 +1,84 @@
-from typing import Dict
-from random import getrandbits, uniform
+from typing import Dict, Optional, Tuple
+import numpy as np
+from pydfs_lineup_optimizer.exceptions import LineupOptimizerException
 from pydfs_lineup_optimizer.player import Player
 from pydfs_lineup_optimizer.lineup import Lineup
+from pydfs_lineup_optimizer.players_table import PlayersTable
 
 
 class BaseFantasyPointsStrategy:
     def get_player_fantasy_points(self, player: Player) -> float:
         raise NotImplementedError
 
+    def get_fantasy_points_vector(self, players_table: PlayersTable) -> np.ndarray:
+        """
+        Return fantasy points for all players in table, can be overridden for using array operations.
+        """
+        return np.array([self.get_player_fantasy_points(player) for player in players_table.players], dtype=float)
+
     def set_previous_lineup(self, lineup: Lineup):
         pass
 
+    @property
+    def is_deterministic(self) -> bool:
+        """
+        True if fantasy points are the same for each lineup.
+        """
+        return False
+
 
 class StandardFantasyPointsStrategy(BaseFantasyPointsStrategy):
     def get_player_fantasy_points(self, player: Player) -> float:
         return player.fppg
 
-    def set_previous_lineup(self, lineup: Lineup):
-        pass
+    @property
+    def is_deterministic(self) -> bool:
+        strategy_class = type(self)
+        return (
+            strategy_class.get_fantasy_points_vector is StandardFantasyPointsStrategy.get_fantasy_points_vector and
+            strategy_class.get_player_fantasy_points is StandardFantasyPointsStrategy.get_player_fantasy_points
+        )
+
+    def get_fantasy_points_vector(self, players_table: PlayersTable) -> np.ndarray:
+        # subclasses overriding only get_player_fantasy_points are calculated by player
+        if type(self).get_player_fantasy_points is not StandardFantasyPointsStrategy.get_player_fantasy_points:
+            return super().get_fantasy_points_vector(players_table)
+        return players_table.fppg
 
 
 class RandomFantasyPointsStrategy(BaseFantasyPointsStrategy):
-    def __init__(self, min_deviation: float = 0.0, max_deviation: float = 0.12):
+    """
+    Randomize players fantasy points using numpy generator,
+    strategies created with the same seed generate the same fantasy points.
+    """
+    def __init__(self, min_deviation: float = 0.0, max_deviation: float = 0.12, seed: Optional[int] = None):
         self.min_deviation = min_deviation
         self.max_deviation = max_deviation
+        self.random_generator = np.random.default_rng(seed)
 
     def get_player_fantasy_points(self, player: Player) -> float:
+        value, sign_value = self.random_generator.random(2).tolist()  # type: float, float
         if player.fppg_floor is not None and player.fppg_ceil is not None:
-            return uniform(player.fppg_floor, player.fppg_ceil)
-        multiplier = uniform(
-            player.min_deviation if player.min_deviation is not None else self.min_deviation,
-            player.max_deviation if player.max_deviation is not None else self.max_deviation
-        )
-        return player.fppg * (1 + (-1 if bool(getrandbits(1)) else 1) * multiplier)
+            return player.fppg_floor + value * (player.fppg_ceil - player.fppg_floor)
+        min_deviation = player.min_deviation if player.min_deviation is not None else self.min_deviation
+        max_deviation = player.max_deviation if player.max_deviation is not None else self.max_deviation
+        multiplier = min_deviation + value * (max_deviation - min_deviation)
+        return player.fppg * (1 + (-1 if sign_value < 0.5 else 1) * multiplier)
+
+    def get_fantasy_points_vector(self, players_table: PlayersTable) -> np.ndarray:
+        # subclasses overriding only get_player_fantasy_points are calculated by player
+        if type(self).get_player_fantasy_points is not RandomFantasyPointsStrategy.get_player_fantasy_points:
+            return super().get_fantasy_points_vector(players_table)
+        values, sign_values = self.random_generator.random((2, len(players_table)))
+        min_deviation = np.where(np.isnan(players_table.min_deviation), self.min_deviation, players_table.min_deviation)
+        max_deviation = np.where(np.isnan(players_table.max_deviation), self.max_deviation, players_table.max_deviation)
+        multiplier = min_deviation + values * (max_deviation - min_deviation)
+        fantasy_points = players_table.fppg * (1 + np.where(sign_values < 0.5, -1, 1) * multiplier)  # type: np.ndarray
+        floor, ceil = players_table.fppg_floor, players_table.fppg_ceil
+        with_range = ~np.isnan(floor) & ~np.isnan(ceil)
+        if with_range.any():
+            fantasy_points = np.where(with_range, floor + values * (ceil - floor), fantasy_points)
+        return fantasy_points
 
 
 class ProgressiveFantasyPointsStrategy(BaseFantasyPointsStrategy):
@@ -53,3 +99,80 @@ class ProgressiveFantasyPointsStrategy(BaseFantasyPointsStrategy):
             else:
                 scale = player.progressive_scale if player.progressive_scale is not None else self.scale
                 self.player_multipliers[player] += scale
+
+
+class CorrelatedFantasyPointsStrategy(BaseFantasyPointsStrategy):
+    """
+    Sample players fantasy points from normal distribution where players from the same team
+    and from the same game are correlated. Floor and ceil are used as two standard deviations
+    from projection if both are set, otherwise deviation is max deviation of projection.
+    Scenarios are sampled by blocks and each lineup uses next scenario from block.
+    """
+    def __init__(
+            self,
+            team_correlation: float = 0.3,
+            game_correlation: float = 0.1,
+            deviation: float = 0.12,
+            scenarios: int = 1000,
+            seed: Optional[int] = None,
+    ):
+        if not 0 <= game_correlation <= team_correlation <= 1:
+            raise LineupOptimizerException('Correlation should be between 0 and 1 and '
+                                           'game correlation can\'t be greater than team correlation')
+        self.team_correlation = team_correlation
+        self.game_correlation = game_correlation
+        self.deviation = deviation
+        self.scenarios = scenarios
+        self.random_generator = np.random.default_rng(seed)
+        self._sampled_scenarios = None  # type: Optional[Tuple[PlayersTable, int, np.ndarray]]
+        self._next_scenario = 0
+
+    def get_player_fantasy_points(self, player: Player) -> float:
+        if player.fppg_floor is not None and player.fppg_ceil is not None:
+            deviation = (player.fppg_ceil - player.fppg_floor) / 4
+        else:
+            max_deviation = player.max_deviation if player.max_deviation is not None else self.deviation
+            deviation = abs(player.fppg) * max_deviation
+        return player.fppg + deviation * float(self.random_generator.standard_normal())
+
+    def get_fantasy_points_vector(self, players_table: PlayersTable) -> np.ndarray:
+        if (
+            self._sampled_scenarios is None or
+            self._sampled_scenarios[0] is not players_table or
+            self._sampled_scenarios[1] != players_table.version or
+            self._next_scenario >= len(self._sampled_scenarios[2])
+        ):
+            self._sampled_scenarios = (
+                players_table, players_table.version, self.sample_scenarios(players_table, self.scenarios))
+            self._next_scenario = 0
+        fantasy_points = self._sampled_scenarios[2][self._next_scenario]  # type: np.ndarray
+        self._next_scenario += 1
+        return fantasy_points
+
+    def get_deviations(self, players_table: PlayersTable) -> np.ndarray:
+        floor, ceil = players_table.fppg_floor, players_table.fppg_ceil
+        max_deviation = np.where(np.isnan(players_table.max_deviation), self.deviation, players_table.max_deviation)
+        deviations = np.where(
+            ~np.isnan(floor) & ~np.isnan(ceil), (ceil - floor) / 4, np.abs(players_table.fppg) * max_deviation,
+        )  # type: np.ndarray
+        return deviations
+
+    def sample_scenarios(self, players_table: PlayersTable, size: int) -> np.ndarray:
+        """
+        Return matrix with fantasy points of all players for each scenario.
+        Correlated normal values are built from common game and team factors and own player factor.
+        """
+        normal = self.random_generator.standard_normal
+        has_game = players_table.game_codes >= 0
+        has_team = players_table.team_codes >= 0
+        game_variance = np.where(has_game, self.game_correlation, 0)
+        team_variance = np.where(has_team, self.team_correlation - game_variance, 0)
+        own_variance = np.where(has_team, 1 - self.team_correlation, 1 - game_variance)
+        game_weights, team_weights, own_weights = np.sqrt(game_variance), np.sqrt(team_variance), np.sqrt(own_variance)
+        values = own_weights * normal((size, len(players_table)))
+        if has_game.any():
+            values += game_weights * normal((size, len(players_table.games)))[:, players_table.game_codes]
+        if has_team.any():
+            values += team_weights * normal((size, len(players_table.teams)))[:, players_table.team_codes]
+        scenarios = players_table.fppg + self.get_deviations(players_table) * values  # type: np.ndarray
+        return scenarios
@@ -1,4 +1,5 @@
-from typing import List, Dict, Any, Optional
+import csv
+from typing import List, Dict, Any, Optional, Callable, Iterator, Sequence, Tuple
 from pydfs_lineup_optimizer.player import Player
 from pydfs_lineup_optimizer.lineup import Lineup
 from pydfs_lineup_optimizer.exceptions import LineupOptimizerIncorrectCSV
@@ -25,20 +26,106 @@ class CSVImporter:
         except ValueError:
             raise LineupOptimizerIncorrectCSV('Can\'t parse percents value, got %s' % value)
 
+    @staticmethod
+    def _get_optional_cell(row: Sequence[str], index: Optional[int]) -> Optional[str]:
+        """
+        Return cell of optional column, rows can omit trailing empty cells.
+        """
+        return row[index] if index is not None and index < len(row) else None
+
+    @staticmethod
+    def _parse_optional_int(value: Optional[str]) -> Optional[int]:
+        return int(value) if value else None
+
+    @staticmethod
+    def _parse_optional_float(value: Optional[str]) -> Optional[float]:
+        return float(value) if value else None
+
+    @classmethod
+    def get_extra_columns(cls) -> List[Tuple[str, str, Callable[[Optional[str]], Any]]]:
+        """
+        Return player attribute, column name and parser for each optional column.
+        """
+        return [
+            ('max_exposure', 'Max Exposure', cls._parse_percents),
+            ('min_exposure', 'Min Exposure', cls._parse_percents),
+            ('roster_order', 'Roster Order', cls._parse_optional_int),
+            ('projected_ownership', 'Projected Ownership', cls._parse_percents),
+            ('min_deviation', 'Min Deviation', cls._parse_percents),
+            ('max_deviation', 'Max Deviation', cls._parse_percents),
+            ('is_confirmed_starter', 'Confirmed Starter', bool),
+            ('fppg_floor', 'Projection Floor', cls._parse_optional_float),
+            ('fppg_ceil', 'Projection Ceil', cls._parse_optional_float),
+            ('progressive_scale', 'Progressive Scale', cls._parse_percents),
+        ]
+
     @classmethod
     def get_player_extra(cls, row: Dict[str, str]) -> Dict[str, Any]:
-        roster_order = row.get('Roster Order')
-        fppg_floor = row.get('Projection Floor')
-        fppg_ceil = row.get('Projection Ceil')
-        return {
-            'max_exposure': cls._parse_percents(row.get('Max Exposure')),
-            'min_exposure': cls._parse_percents(row.get('Min Exposure')),
-            'roster_order': int(roster_order) if roster_order else None,
-            'projected_ownership': cls._parse_percents(row.get('Projected Ownership')),
-            'min_deviation': cls._parse_percents(row.get('Min Deviation')),
-            'max_deviation': cls._parse_percents(row.get('Max Deviation')),
-            'is_confirmed_starter': bool(row.get('Confirmed Starter')),
-            'fppg_floor': float(fppg_floor) if fppg_floor else None,
-            'fppg_ceil': float(fppg_ceil) if fppg_ceil else None,
-            'progressive_scale': cls._parse_percents(row.get('Progressive Scale')),
-        }
+        return {attribute: parse(row.get(column)) for attribute, column, parse in cls.get_extra_columns()}
+
+    @classmethod
+    def get_player_extra_parser(cls, header: Sequence[str]) -> Callable[[Sequence[str]], Dict[str, Any]]:
+        """
+        Return function parsing optional columns of positional row, columns missing in header get
+        default values without parsing, cells missing in row are parsed as None.
+        """
+        defaults = cls.get_player_extra({})
+        parsers = [
+            (attribute, header.index(column), parse)
+            for attribute, column, parse in cls.get_extra_columns() if column in header
+        ]
+        if not parsers:
+            return lambda row: dict(defaults)
+
+        def parse_extra(row: Sequence[str]) -> Dict[str, Any]:
+            extra = dict(defaults)
+            for attribute, index, parse in parsers:
+                extra[attribute] = parse(cls._get_optional_cell(row, index))
+            return extra
+        return parse_extra
+
+
+class StreamingCSVImporter(CSVImporter):
+    """
+    Base class for importers parsing rows positionally. Header is the first line containing HEADER_COLUMN
+    (or the first line if it isn't set), subclasses resolve column indexes from header once in
+    get_row_parser. Players are yielded lazily by iter_players, so big files are parsed in constant memory.
+    """
+    HEADER_COLUMN = None  # type: Optional[str]
+
+    def get_row_parser(self, header: List[str]) -> Callable[[List[str]], Optional[Player]]:  # pragma: no cover
+        """
+        Return function converting row to player, rows converted to None are skipped.
+        """
+        raise NotImplementedError
+
+    @staticmethod
+    def get_column_indexes(header: List[str], *columns: str) -> List[int]:
+        try:
+            return [header.index(column) for column in columns]
+        except ValueError:
+            raise LineupOptimizerIncorrectCSV('Required columns %s not found in header' % ', '.join(
+                column for column in columns if column not in header))
+
+    def _find_header(self, rows: Iterator[List[str]]) -> List[str]:
+        for row in rows:
+            if self.HEADER_COLUMN is None or self.HEADER_COLUMN in row:
+                return row
+        raise LineupOptimizerIncorrectCSV
+
+    def iter_players(self) -> Iterator[Player]:
+        with open(self.filename, 'r', newline='') as csv_file:
+            rows = csv.reader(csv_file, skipinitialspace=True)
+            parse_row = self.get_row_parser(self._find_header(rows))
+            for row in rows:
+                if not row:
+                    continue
+                try:
+                    player = parse_row(row)
+                except IndexError:
+                    raise LineupOptimizerIncorrectCSV('Row %d has no value for required column' % rows.line_num)
+                if player is not None:
+                    yield player
+
+    def import_players(self) -> List[Player]:
+        return list(self.iter_players())
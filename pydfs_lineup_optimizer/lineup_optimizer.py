@@ -1,7 +1,13 @@
+import os
+import pickle
+import warnings
 from collections import OrderedDict
-from itertools import chain
+from contextlib import contextmanager
+from concurrent.futures import ProcessPoolExecutor, Executor
+from itertools import chain, repeat
 from math import ceil
-from typing import FrozenSet, Type, Generator, Tuple, Optional, List, Dict, Set, Iterable
+from typing import FrozenSet, Type, Generator, Tuple, Optional, List, Dict, Set, Iterable, Iterator, Any
+from pydfs_lineup_optimizer.version import __version__
 from pydfs_lineup_optimizer.lineup import Lineup
 from pydfs_lineup_optimizer.solvers import Solver, SolverInfeasibleSolutionException
 from pydfs_lineup_optimizer.exceptions import LineupOptimizerException, LineupOptimizerIncorrectTeamName, \
@@ -9,7 +15,7 @@ from pydfs_lineup_optimizer.exceptions import LineupOptimizerException, LineupOp
 from pydfs_lineup_optimizer.lineup_importer import CSVImporter
 from pydfs_lineup_optimizer.settings import BaseSettings
 from pydfs_lineup_optimizer.player import Player, LineupPlayer, GameInfo
-from pydfs_lineup_optimizer.utils import ratio, link_players_with_positions, get_remaining_positions, \
+from pydfs_lineup_optimizer.utils import link_players_with_positions, get_remaining_positions, \
     show_deprecation_warning
 from pydfs_lineup_optimizer.rules import *
 from pydfs_lineup_optimizer.stacks import BaseGroup, BaseStack, Stack
@@ -19,7 +25,11 @@ from pydfs_lineup_optimizer.exposure_strategy import BaseExposureStrategy, Total
 from pydfs_lineup_optimizer.fantasy_points_strategy import BaseFantasyPointsStrategy, StandardFantasyPointsStrategy, \
     RandomFantasyPointsStrategy
 from pydfs_lineup_optimizer.solvers import get_default_solver
+from pydfs_lineup_optimizer.solvers.recording import RecordingSolver, Operation, apply_operations
 from pydfs_lineup_optimizer.player_pool import PlayerPool
+from pydfs_lineup_optimizer.profiler import OptimizationProfiler, ProfilePhase
+from pydfs_lineup_optimizer.snapshot import get_snapshot_path, load_players_snapshot, save_players_snapshot
+from pydfs_lineup_optimizer.tz import get_timezone
 
 
 BASE_RULES = {
@@ -28,6 +38,47 @@ BASE_RULES = {
 }
 
 
+def _get_class_path(cls: type) -> str:
+    return '%s.%s' % (cls.__module__, cls.__qualname__)
+
+
+def _solve_pool(solver: Solver, size: int) -> List[List[str]]:
+    return [[variable.name for variable in solution] for solution in solver.solve_pool(size)]
+
+
+_worker_model = None  # type: Optional[Tuple[Solver, Dict[str, Any], List[int]]]
+
+
+def _init_worker(model: bytes) -> None:
+    """
+    Load base model dumped by RecordingSolver once when worker process is started.
+    """
+    global _worker_model
+    solver, variables = pickle.loads(model)
+    _worker_model = (solver, variables, [0])
+
+
+def _solve_pool_in_worker(
+        model_operations: List[Operation],
+        iteration_operations: List[Operation],
+        size: int,
+) -> List[List[str]]:
+    """
+    Bring worker base model up to date with operations recorded in base model after it was dumped,
+    then solve iteration with its operations and discard them.
+    """
+    assert _worker_model is not None, 'Worker is not initialized'
+    solver, variables, applied_operations = _worker_model
+    apply_operations(solver, variables, model_operations[applied_operations[0]:])
+    applied_operations[0] = len(model_operations)
+    iteration_solver = solver.start_iteration()  # type: Solver
+    try:
+        apply_operations(iteration_solver, dict(variables), iteration_operations)
+        return _solve_pool(iteration_solver, size)
+    finally:
+        solver.finish_iteration()
+
+
 class LineupOptimizer:
     def __init__(self, settings: Type[BaseSettings], solver: Type[Solver] = get_default_solver()):
         self._settings = settings()
@@ -59,6 +110,7 @@ class LineupOptimizer:
         self.min_starters = None  # type: Optional[int]
         self.last_context = None  # type: Optional[OptimizationContext]
         self.fantasy_points_strategy = StandardFantasyPointsStrategy()  # type: BaseFantasyPointsStrategy
+        self.profiler = None  # type: Optional[OptimizationProfiler]
 
     @property
     def budget(self) -> Optional[float]:
@@ -130,6 +182,12 @@ class LineupOptimizer:
     def set_fantasy_points_strategy(self, strategy: BaseFantasyPointsStrategy):
         self.fantasy_points_strategy = strategy
 
+    def set_profiler(self, profiler: Optional[OptimizationProfiler]):
+        """
+        Record wall time of optimization steps with passed profiler, None disables profiling.
+        """
+        self.profiler = profiler
+
     def set_deviation(self, min_deviation: float, max_deviation: float):
         """
         Set deviation ranges for randomness mode
@@ -151,14 +209,38 @@ class LineupOptimizer:
         self.add_new_rule(MinSalaryCapRule)
         self.min_salary_cap = min_salary
 
-    def load_players_from_csv(self, filename: str):
+    def load_players_from_csv(self, filename: str, snapshot_dir: Optional[str] = None):
         """
         Load player list from CSV file with passed filename.
+        If snapshot directory is passed, parsed players are saved there and next loads of the same file
+        with the same importer read players from snapshot instead of parsing CSV.
+        """
+        csv_importer = self._csv_importer
+        if not csv_importer:
+            csv_importer = self._settings.csv_importer
+        if not snapshot_dir:
+            self.player_pool.extend_players(csv_importer(filename).import_players())
+            return
+        snapshot_path = get_snapshot_path(
+            snapshot_dir, filename, __version__, _get_class_path(csv_importer), _get_class_path(type(self._settings)),
+            get_timezone())
+        if os.path.exists(snapshot_path):
+            players = load_players_snapshot(snapshot_path)
+        else:
+            players = csv_importer(filename).import_players()
+            if all(type(player) is Player for player in players):
+                save_players_snapshot(players, snapshot_path)
+        self.player_pool.extend_players(players)
+
+    def update_players_from_csv(self, filename: str) -> Dict[Player, FrozenSet[str]]:
+        """
+        Update projections, injuries and exposures of loaded players from CSV file without reloading
+        players pool, see PlayerPool.update_players. Running optimization applies updates before next lineup.
         """
         csv_importer = self._csv_importer
         if not csv_importer:
             csv_importer = self._settings.csv_importer
-        self.player_pool.extend_players(csv_importer(filename).import_players())
+        return self.player_pool.update_players(csv_importer(filename).import_players())
 
     def load_lineups_from_csv(self, filename: str) -> List[Lineup]:
         csv_importer = self._csv_importer
@@ -197,11 +279,7 @@ class LineupOptimizer:
         Return list of players with similar name.
         """
         show_deprecation_warning('find_players will be removed in version 3.7')
-        player_pool = self.player_pool
-        possibilities = [(player, ratio(name, player.full_name)) for player in player_pool.all_players]
-        filtered_possibilities = filter(lambda pos: pos[1] >= player_pool.search_threshold, possibilities)
-        players = sorted(filtered_possibilities, key=lambda pos: -pos[1])
-        return list(map(lambda p: p[0], players))
+        return self.player_pool.search_players(name)
 
     def get_player_by_name(self, name: str) -> Optional[Player]:
         show_deprecation_warning('get_player_by_name will be removed in version 3.7, '
@@ -379,6 +457,8 @@ class LineupOptimizer:
             with_injured: Optional[bool] = None,
             exposure_strategy: Type[BaseExposureStrategy] = TotalExposureStrategy,
             exclude_lineups: Optional[Iterable[Lineup]] = None,
+            pool_size: int = 1,
+            workers: int = 1,
     ) -> Generator[Lineup, None, None]:
         if with_injured is not None:
             show_deprecation_warning('with_injured parameter is deprecated, use player_pool.with_injured instead')
@@ -399,50 +479,126 @@ class LineupOptimizer:
                                      'use set_fantasy_points_strategy instead')
             self.set_fantasy_points_strategy(RandomFantasyPointsStrategy(self._min_deviation, self._max_deviation))
         rules.add(Objective)
-        base_solver = self._solver_class()
-        base_solver.setup_solver()
-        players_dict = OrderedDict(
-            [(player, base_solver.add_variable(base_solver.build_player_var_name(player, str(i))))
-             for i, player in enumerate(players)])
-        variables_dict = {v: k for k, v in players_dict.items()}
-        constraints = [constraint(self, players_dict, context) for constraint in rules]
+        if workers > 1 and self.fantasy_points_strategy.is_deterministic:
+            warnings.warn('All workers would solve the same model with deterministic fantasy points strategy, '
+                          'lineups are generated without workers')
+            workers = 1
+        self._set_profiler_iteration(None)
+        with self._measure(ProfilePhase.MODEL, 'players_variables', variables=len(players)):
+            # with workers changes of base model are recorded and sent to workers instead of the whole model
+            base_solver = RecordingSolver(self._solver_class()) if workers > 1 else self._solver_class()
+            base_solver.setup_solver()
+            players_dict = OrderedDict(
+                [(player, base_solver.add_variable(base_solver.build_player_var_name(player, str(i))))
+                 for i, player in enumerate(players)])
+        players_by_name = {v.name: k for k, v in players_dict.items()}
+        constraints = self._create_rules(rules, players_dict, context)
+        objective = next(constraint for constraint in constraints if isinstance(constraint, Objective))
         for constraint in constraints:
-            constraint.apply(base_solver)
+            with self._measure(ProfilePhase.APPLY, type(constraint).__name__):
+                constraint.apply(base_solver)
         previous_lineup = None
-        for _ in range(n):
-            solver = base_solver.copy()  # type: Solver
-            for constraint in constraints:
-                constraint.apply_for_iteration(solver, previous_lineup)
-            try:
-                solved_variables = solver.solve()
-                lineup_players = []
-                variables_names = []
-                for solved_variable in solved_variables:
-                    player = variables_dict.get(solved_variable)
-                    if player:
-                        lineup_players.append(player)
-                    variables_names.append(solved_variable.name)
-                lineup = self._build_lineup(lineup_players, context)
+        pool = []  # type: List[Tuple[Lineup, List[str]]]
+        applied_updates = self.player_pool.total_updates
+        executor = None
+        if isinstance(base_solver, RecordingSolver):
+            executor = ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(base_solver.dump_model(), ))
+        try:
+            for iteration in range(n):
+                self._set_profiler_iteration(iteration)
+                if self.player_pool.total_updates != applied_updates:
+                    applied_updates = self._apply_players_updates(
+                        constraints, base_solver, players_dict, context, applied_updates)
+                    pool = []  # solutions in pool are found with outdated players
+                with self._measure(ProfilePhase.START_ITERATION, type(base_solver).__name__):
+                    solver = base_solver.start_iteration()  # type: Solver
+                try:
+                    self._apply_rules_for_iteration(constraints, solver, previous_lineup)
+                    while pool:
+                        lineup, variables_names = pool.pop(0)
+                        if self._check_lineup(constraints, lineup):
+                            break
+                    else:
+                        pool = self._solve_candidates(
+                            base_solver, solver, objective, players_by_name, context, pool_size, workers, executor)
+                        lineup, variables_names = pool.pop(0)
+                except SolverInfeasibleSolutionException as solver_exception:
+                    raise GenerateLineupException(solver_exception.get_user_defined_constraints())
+                finally:
+                    base_solver.finish_iteration()
                 previous_lineup = lineup
                 context.add_lineup(lineup)
                 yield lineup
                 total_players = self.player_pool.total_players
                 if total_players and len(self.player_pool.locked_players) == total_players:
                     return
-                for constraint in constraints:
-                    constraint.post_optimize(variables_names)
-            except SolverInfeasibleSolutionException as solver_exception:
-                raise GenerateLineupException(solver_exception.get_user_defined_constraints())
+                self._apply_rules_for_lineup(constraints, base_solver, lineup, variables_names)
+        finally:
+            self._set_profiler_iteration(None)
+            if executor:
+                executor.shutdown()
         self.last_context = context
 
+    def _solve_candidates(
+            self,
+            base_solver: Solver,
+            solver: Solver,
+            objective: OptimizerRule,
+            players_by_name: Dict[str, Player],
+            context: OptimizationContext,
+            pool_size: int,
+            workers: int,
+            executor: Optional[Executor],
+    ) -> List[Tuple[Lineup, List[str]]]:
+        """
+        Solve iteration model and return candidate lineups with names of solved variables.
+        With several workers iteration is solved by each worker with its own objective, workers receive
+        only operations recorded in base model and iteration instead of the whole model.
+        Lineups are checked against rules by optimizer before using.
+        """
+        players_fppg = [dict(context.players_used_fppg)]
+        total_solvers = min(workers, context.remaining_lineups)
+        size = min(pool_size, context.remaining_lineups)
+        with self._measure_solve(solver, pool_size=size, workers=total_solvers):
+            if executor and total_solvers > 1 and isinstance(base_solver, RecordingSolver) and \
+                    isinstance(solver, RecordingSolver):
+                iterations_operations = [solver.operations]
+                for _ in range(total_solvers - 1):
+                    objective_solver = RecordingSolver()
+                    objective.apply_for_iteration(objective_solver, None)
+                    iterations_operations.append(solver.operations + objective_solver.operations)
+                    players_fppg.append(dict(context.players_used_fppg))
+                results = list(executor.map(
+                    _solve_pool_in_worker, repeat(base_solver.operations), iterations_operations, repeat(size),
+                ))  # type: List[Any]
+            else:
+                results = [_solve_pool(solver, size)]
+        candidates = []
+        for solutions, fppg in zip(results, players_fppg):
+            context.players_used_fppg = fppg
+            for variables_names in solutions:
+                lineup_players = [players_by_name[name] for name in variables_names if name in players_by_name]
+                with self._measure(ProfilePhase.BUILD_LINEUP, 'build_lineup'):
+                    lineup = self._build_lineup(lineup_players, context)
+                candidates.append((lineup, variables_names))
+        return candidates
+
     def optimize_lineups(
             self,
             lineups: List[Lineup],
             max_exposure: Optional[float] = None,
             randomness: bool = False,
             with_injured: bool = None,
-            exposure_strategy: Type[BaseExposureStrategy] = TotalExposureStrategy
+            exposure_strategy: Type[BaseExposureStrategy] = TotalExposureStrategy,
+            workers: int = 1,
     ):
+        """
+        Re-optimize lineups keeping players with started games on their positions.
+        With several workers lineups are re-optimized by rounds: lineups of round with the same kept players
+        share a single model that is solved for several solutions and models of round are solved in parallel.
+        Solutions are checked against rules in order of lineups, lineup without valid solution is re-optimized
+        separately.
+        """
         if with_injured is not None:
             show_deprecation_warning('with_injured parameter is deprecated, use player_pool.with_injured instead')
             self.player_pool.with_injured = with_injured
@@ -464,43 +620,158 @@ class LineupOptimizer:
         rules.add(Objective)
         rules.add(LateSwapRule)
         rules.remove(PositionsRule)
-        base_solver = self._solver_class()
-        base_solver.setup_solver()
-        players_dict = OrderedDict(
-            [(player, base_solver.add_variable(base_solver.build_player_var_name(player, str(i))))
-             for i, player in enumerate(players)])
-        variables_dict = {v: k for k, v in players_dict.items()}
-        constraints = [constraint(self, players_dict, context) for constraint in rules]
+        self._set_profiler_iteration(None)
+        with self._measure(ProfilePhase.MODEL, 'players_variables', variables=len(players)):
+            # with workers changes of base model are recorded and sent to workers instead of the whole model
+            base_solver = RecordingSolver(self._solver_class()) if workers > 1 else self._solver_class()
+            base_solver.setup_solver()
+            players_dict = OrderedDict(
+                [(player, base_solver.add_variable(base_solver.build_player_var_name(player, str(i))))
+                 for i, player in enumerate(players)])
+        players_by_name = {v.name: k for k, v in players_dict.items()}
+        constraints = self._create_rules(rules, players_dict, context)
+        late_swap_rule = next(constraint for constraint in constraints if isinstance(constraint, LateSwapRule))
+        objective = next(constraint for constraint in constraints if isinstance(constraint, Objective))
         for constraint in constraints:
-            constraint.apply(base_solver)
+            with self._measure(ProfilePhase.APPLY, type(constraint).__name__):
+                constraint.apply(base_solver)
+        total_players = self.player_pool.total_players
         previous_lineup = None
-        for lineup in lineups:
-            if len(lineup.get_unswappable_players()) == self.total_players:
-                yield lineup
-                continue
-            solver = base_solver.copy()  # type: Solver
-            for constraint in constraints:
-                constraint.apply_for_iteration(solver, previous_lineup)
-            try:
-                solved_variables = solver.solve()
-                unswappable_players = lineup.get_unswappable_players()
-                lineup_players = []
-                variables_names = []
-                for solved_variable in solved_variables:
-                    player = variables_dict.get(solved_variable)
-                    if player:
-                        lineup_players.append(player)
-                    variables_names.append(solved_variable.name)
-                generated_lineup = self._build_lineup(lineup_players, context, unswappable_players)
+        candidates = {}  # type: Dict[FrozenSet[Tuple[Player, str]], List[Tuple[List[str], Dict[Player, float]]]]
+        applied_updates = self.player_pool.total_updates
+        # solutions can't be reused if objective depends on previous lineups
+        use_workers = workers > 1 and not objective.uses_previous_lineup
+        executor = None  # type: Optional[Executor]
+        share_models = objective.is_deterministic
+        try:
+            for iteration, lineup in enumerate(lineups):
+                unswappable_players = late_swap_rule.get_unswappable_players(lineup)
+                if len(unswappable_players) == total_players:
+                    yield lineup
+                    continue
+                self._set_profiler_iteration(iteration)
+                if self.player_pool.total_updates != applied_updates:
+                    applied_updates = self._apply_players_updates(
+                        constraints, base_solver, players_dict, context, applied_updates)
+                    candidates = {}  # solutions are found with outdated players
+                lineup_key = late_swap_rule.get_lineup_key(lineup)
+                if use_workers and isinstance(base_solver, RecordingSolver) and lineup_key not in candidates:
+                    if executor is None:
+                        # executor is created when it's needed first time, workers load current base model
+                        executor = ProcessPoolExecutor(
+                            workers, initializer=_init_worker, initargs=(base_solver.dump_model(), ))
+                    candidates.update(self._solve_late_swap_round(
+                        lineups[iteration:], candidates, workers, constraints, base_solver, late_swap_rule,
+                        share_models, context, executor))
+                late_swap_rule.current_lineup = lineup
+                with self._measure(ProfilePhase.START_ITERATION, type(base_solver).__name__):
+                    solver = base_solver.start_iteration()  # type: Solver
+                try:
+                    self._apply_rules_for_iteration(constraints, solver, previous_lineup)
+                    lineup_candidates = candidates.get(lineup_key, [])
+                    while lineup_candidates:
+                        variables_names, players_fppg = lineup_candidates.pop(0)
+                        context.players_used_fppg = players_fppg
+                        generated_lineup = self._build_late_swap_lineup(
+                            variables_names, players_by_name, context, unswappable_players)
+                        if self._check_lineup(constraints, generated_lineup):
+                            break
+                    else:
+                        with self._measure_solve(solver):
+                            variables_names = _solve_pool(solver, 1)[0]
+                        generated_lineup = self._build_late_swap_lineup(
+                            variables_names, players_by_name, context, unswappable_players)
+                except SolverInfeasibleSolutionException as solver_exception:
+                    raise GenerateLineupException(solver_exception.get_user_defined_constraints())
+                finally:
+                    base_solver.finish_iteration()
+                if not lineup_candidates and not share_models:
+                    candidates.pop(lineup_key, None)  # next lineups with these players are solved in new round
                 previous_lineup = generated_lineup
                 context.add_lineup(generated_lineup)
                 yield generated_lineup
-                for constraint in constraints:
-                    constraint.post_optimize(variables_names)
-            except SolverInfeasibleSolutionException as solver_exception:
-                raise GenerateLineupException(solver_exception.get_user_defined_constraints())
+                self._apply_rules_for_lineup(constraints, base_solver, generated_lineup, variables_names)
+        finally:
+            self._set_profiler_iteration(None)
+            if executor:
+                executor.shutdown()
         self.last_context = context
 
+    def _solve_late_swap_round(
+            self,
+            lineups: List[Lineup],
+            candidates: Dict[FrozenSet[Tuple[Player, str]], List[Tuple[List[str], Dict[Player, float]]]],
+            workers: int,
+            constraints: List[OptimizerRule],
+            base_solver: RecordingSolver,
+            late_swap_rule: LateSwapRule,
+            share_models: bool,
+            context: OptimizationContext,
+            executor: Executor,
+    ) -> Dict[FrozenSet[Tuple[Player, str]], List[Tuple[List[str], Dict[Player, float]]]]:
+        """
+        Solve up to workers models for next lineups without candidates in parallel. If models are shared,
+        all next lineups with the same kept players use single model solved for as many solutions as there
+        are lineups, lineups without solution from pool are re-optimized sequentially. Otherwise each lineup
+        has its own model with its own fantasy points. Workers receive only operations recorded in base model
+        and operations of model iteration. Return solutions with fantasy points used in their objective
+        for each kept players.
+        """
+        total_players = self.player_pool.total_players
+        groups = OrderedDict()  # type: Dict[FrozenSet[Tuple[Player, str]], List[List[Lineup]]]
+        total_models = 0
+        for lineup in lineups:
+            if len(late_swap_rule.get_unswappable_players(lineup)) == total_players:
+                continue
+            key = late_swap_rule.get_lineup_key(lineup)
+            if key in candidates:
+                continue
+            models = groups.get(key)
+            if models and share_models:
+                models[0].append(lineup)
+                continue
+            if total_models == workers:
+                if share_models:
+                    continue
+                break
+            groups.setdefault(key, []).append([lineup])
+            total_models += 1
+        keys, iterations_operations, sizes, players_fppg = [], [], [], []
+        for key, models in groups.items():
+            for model_lineups in models:
+                late_swap_rule.current_lineup = model_lineups[0]
+                # iteration is only recorded, it's applied to base model by worker
+                iteration_solver = RecordingSolver()
+                self._apply_rules_for_iteration(constraints, iteration_solver, None)
+                keys.append(key)
+                iterations_operations.append(iteration_solver.operations)
+                sizes.append(len(model_lineups))
+                players_fppg.append(dict(context.players_used_fppg))
+        late_swap_rule.current_lineup = None
+        with self._measure(ProfilePhase.SOLVE, 'late_swap_round', models=len(keys), lineups=sum(sizes)):
+            try:
+                results = list(executor.map(
+                    _solve_pool_in_worker, repeat(base_solver.operations), iterations_operations, sizes,
+                ))  # type: List[List[List[str]]]
+            except SolverInfeasibleSolutionException:
+                # infeasible lineups are reported by sequential solving
+                return {}
+        round_candidates = {}  # type: Dict[FrozenSet[Tuple[Player, str]], List[Tuple[List[str], Dict[Player, float]]]]
+        for key, solutions, fppg in zip(keys, results, players_fppg):
+            round_candidates.setdefault(key, []).extend((variables_names, fppg) for variables_names in solutions)
+        return round_candidates
+
+    def _build_late_swap_lineup(
+            self,
+            variables_names: List[str],
+            players_by_name: Dict[str, Player],
+            context: OptimizationContext,
+            unswappable_players: List[LineupPlayer],
+    ) -> Lineup:
+        lineup_players = [players_by_name[name] for name in variables_names if name in players_by_name]
+        with self._measure(ProfilePhase.BUILD_LINEUP, 'build_lineup'):
+            return self._build_lineup(lineup_players, context, unswappable_players)
+
     def print_statistic(self, with_excluded: bool = True) -> None:
         if self.last_context is None:
             raise LineupOptimizerException('You should generate lineups before printing statistic')
@@ -511,6 +782,91 @@ class LineupOptimizer:
             raise LineupOptimizerException('You should generate lineups before printing statistic')
         self.settings.csv_exporter(self.last_context.get_lineups(with_excluded)).export(filename)
 
+    @contextmanager
+    def _measure(self, phase: str, name: str, **details: Any) -> Iterator[Dict[str, Any]]:
+        if self.profiler is None:
+            yield details
+            return
+        with self.profiler.measure(phase, name, **details) as measured_details:
+            yield measured_details
+
+    def _measure_solve(self, solver: Solver, **details: Any):
+        if self.profiler is not None:
+            # model size is calculated before measuring, it isn't cheap for some solvers
+            details['variables'], details['constraints'] = solver.get_model_size()
+        return self._measure(ProfilePhase.SOLVE, type(solver).__name__, **details)
+
+    def _set_profiler_iteration(self, iteration: Optional[int]) -> None:
+        if self.profiler is not None:
+            self.profiler.iteration = iteration
+
+    def _create_rules(
+            self,
+            rules: Iterable[Type[OptimizerRule]],
+            players_dict: Dict[Player, Any],
+            context: OptimizationContext,
+    ) -> List[OptimizerRule]:
+        constraints = []
+        for rule in rules:
+            with self._measure(ProfilePhase.RULE_INIT, rule.__name__):
+                constraints.append(rule(self, players_dict, context))
+        return constraints
+
+    def _apply_rules_for_iteration(
+            self,
+            constraints: List[OptimizerRule],
+            solver: Solver,
+            previous_lineup: Optional[Lineup],
+    ) -> None:
+        for constraint in constraints:
+            with self._measure(ProfilePhase.APPLY_FOR_ITERATION, type(constraint).__name__):
+                constraint.apply_for_iteration(solver, previous_lineup)
+
+    def _check_lineup(self, constraints: List[OptimizerRule], lineup: Lineup) -> bool:
+        for constraint in constraints:
+            with self._measure(ProfilePhase.CHECK_LINEUP, type(constraint).__name__):
+                if not constraint.check_lineup(lineup):
+                    return False
+        return True
+
+    def _apply_rules_for_lineup(
+            self,
+            constraints: List[OptimizerRule],
+            solver: Solver,
+            lineup: Lineup,
+            variables_names: List[str],
+    ) -> None:
+        for constraint in constraints:
+            name = type(constraint).__name__
+            with self._measure(ProfilePhase.APPLY_FOR_LINEUP, name):
+                constraint.apply_for_lineup(solver, lineup)
+            with self._measure(ProfilePhase.POST_OPTIMIZE, name):
+                constraint.post_optimize(variables_names)
+
+    def _apply_players_updates(
+            self,
+            constraints: List[OptimizerRule],
+            solver: Solver,
+            players_dict: Dict[Player, Any],
+            context: OptimizationContext,
+            applied_updates: int,
+    ) -> int:
+        """
+        Patch running optimization with players updated in pool after already applied updates,
+        return total number of applied updates.
+        """
+        updated_players = {
+            player: attributes
+            for player, attributes in self.player_pool.get_updated_players(applied_updates).items()
+            if player in players_dict
+        }
+        if updated_players:
+            context.players_table.update_players(updated_players)
+            for constraint in constraints:
+                with self._measure(ProfilePhase.APPLY_FOR_PLAYERS_UPDATE, type(constraint).__name__):
+                    constraint.apply_for_players_update(solver, updated_players)
+        return self.player_pool.total_updates
+
     def _build_lineup(
             self,
             players: List[Player],
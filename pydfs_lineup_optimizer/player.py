@@ -1,10 +1,15 @@
 from datetime import datetime
+from copy import copy
+from itertools import chain
+from operator import attrgetter
 from pytz import timezone
 from typing import List, Optional, Tuple, Sequence
 from pydfs_lineup_optimizer.tz import get_timezone
 
 
 class GameInfo:
+    __slots__ = ('home_team', 'away_team', 'starts_at', 'game_started')
+
     def __init__(
             self,
             home_team: Optional[str],
@@ -22,6 +27,12 @@ class GameInfo:
 
 
 class Player:
+    __slots__ = (
+        'id', 'first_name', 'last_name', '_positions', 'team', 'salary', 'fppg', 'is_injured', 'game_info',
+        'roster_order', 'min_exposure', 'max_exposure', 'min_deviation', 'max_deviation', 'projected_ownership',
+        'is_confirmed_starter', 'fppg_floor', 'fppg_ceil', 'progressive_scale', '_original_positions',
+    )
+
     def __init__(self,
                  player_id: str,
                  first_name: str,
@@ -78,6 +89,26 @@ class Player:
     def full_name(self) -> str:
         return '{} {}'.format(self.first_name, self.last_name)
 
+    def copy_for_position(self, position: str, fppg_multiplier: float = 1) -> 'Player':
+        """
+        Return copy of player for single game position with points multiplier (MVP, STAR, CAPTAIN),
+        copy shares game info and other attributes with player, original positions are kept for printing.
+        Attributes of subclasses (slots and instance dict) are copied too.
+        """
+        player_class = type(self)
+        player = object.__new__(player_class)
+        for cls in player_class.__mro__:
+            slots = cls.__dict__.get('__slots__', ())
+            for attribute in (slots, ) if isinstance(slots, str) else slots:
+                if attribute not in ('__dict__', '__weakref__') and hasattr(self, attribute):
+                    setattr(player, attribute, getattr(self, attribute))
+        if hasattr(self, '__dict__'):
+            player.__dict__.update(self.__dict__)
+        player.fppg = self.fppg * fppg_multiplier
+        player.positions = (position, )
+        player._original_positions = self.original_positions
+        return player
+
     @property
     def efficiency(self) -> float:
         return round(self.fppg / self.salary, 6)
@@ -111,12 +142,17 @@ class Player:
 
 
 class LineupPlayer:
+    __slots__ = ('_player', 'lineup_position', 'used_fppg', '_has_own_player', '__dict__')
+
     def __init__(self, player: Player, lineup_position: str, used_fppg: Optional[float] = None):
         self._player = player
         self.lineup_position = lineup_position
         self.used_fppg = used_fppg
+        self._has_own_player = False
 
     def __getattr__(self, attr_name):
+        if attr_name == '_player':  # not initialized yet, e.g. while unpickling
+            raise AttributeError(attr_name)
         return getattr(self._player, attr_name)
 
     def __eq__(self, other):
@@ -131,3 +167,25 @@ class LineupPlayer:
 
     def __repr__(self):
         return repr(self._player)
+
+
+def _delegate_player_attribute(attr_name: str) -> property:
+    """
+    Player attribute is read from player, on assignment lineup player gets its own copy of player,
+    so changes aren't visible in player pool and other lineups.
+    """
+    def setter(self, value):
+        if not self._has_own_player:
+            self._player = copy(self._player)
+            self._has_own_player = True
+        setattr(self._player, attr_name, value)
+
+    return property(attrgetter('_player.%s' % attr_name), setter)
+
+
+# Player attributes are delegated by properties, because __getattr__ is called only after failed lookup
+for _attr_name in chain(
+    (name for name in Player.__slots__ if not name.startswith('_')),
+    (name for name, value in vars(Player).items() if isinstance(value, property)),
+):
+    setattr(LineupPlayer, _attr_name, _delegate_player_attribute(_attr_name))
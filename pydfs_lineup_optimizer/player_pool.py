@@ -1,11 +1,14 @@
-from typing import FrozenSet, List, Optional, Set, Union, Iterable, Dict, DefaultDict
+from typing import Any, FrozenSet, List, Optional, Set, Union, Iterable, Dict, DefaultDict, Tuple
 from collections import defaultdict
+from operator import attrgetter
 from itertools import chain
+import numpy as np
 from pydfs_lineup_optimizer.settings import BaseSettings
 from pydfs_lineup_optimizer.player import Player, GameInfo
 from pydfs_lineup_optimizer.exceptions import LineupOptimizerException
 from pydfs_lineup_optimizer.utils import link_players_with_positions, ratio, list_intersection
 from pydfs_lineup_optimizer.settings import LineupPosition
+from pydfs_lineup_optimizer.players_table import PlayersTable, PlayersNamesIndex
 
 
 DirtyPlayer = Union[Player, str]
@@ -15,6 +18,12 @@ class BaseFilter:
     def filter(self, player: Player, include_not_matched: bool = True) -> bool:
         raise NotImplemented
 
+    def filter_players(self, players_table: PlayersTable, include_not_matched: bool = True) -> np.ndarray:
+        """
+        Return mask of players passed filter, can be overridden for filtering with array operations.
+        """
+        return np.array([self.filter(player, include_not_matched) for player in players_table.players], dtype=bool)
+
 
 class PlayerFilter(BaseFilter):
     def __init__(
@@ -45,20 +54,48 @@ class PlayerFilter(BaseFilter):
             return False
         return True
 
+    def filter_players(self, players_table: PlayersTable, include_not_matched: bool = True) -> np.ndarray:
+        matched = np.ones(len(players_table), dtype=bool)
+        if self.teams:
+            matched &= players_table.get_teams_mask(list(self.teams)).any(axis=0)
+        positions = [position for position in self.positions if position]
+        if positions:
+            matched &= players_table.has_all_positions(positions)
+        values = getattr(players_table, self.filter_by)
+        passed = values >= self.from_value
+        if self.to_value:
+            passed &= values <= self.to_value
+        mask = np.where(matched, passed, include_not_matched)  # type: np.ndarray
+        return mask
+
 
 class PlayerPool:
+    UPDATABLE_ATTRIBUTES = (
+        'fppg', 'fppg_floor', 'fppg_ceil', 'projected_ownership', 'is_injured', 'is_confirmed_starter',
+        'min_exposure', 'max_exposure', 'min_deviation', 'max_deviation', 'progressive_scale',
+    )
+
     def __init__(self, settings: BaseSettings):
         self._settings = settings
         self._remaining_positions = settings.positions[:]
         self._players: List[Player] = []
         self._players_by_name: DefaultDict[str, List[Player]] = defaultdict(list)
         self._players_by_id: Dict[str, Player] = {}
+        self._players_by_team: DefaultDict[str, Dict[Player, None]] = defaultdict(dict)
+        self._players_by_position: DefaultDict[str, Dict[Player, None]] = defaultdict(dict)
+        self._players_by_game: DefaultDict[GameInfo, Dict[Player, None]] = defaultdict(dict)
+        self._players_by_roster_order: DefaultDict[int, Dict[Player, None]] = defaultdict(dict)
+        self._names_index: Optional[PlayersNamesIndex] = None
         self._exclude_teams: Set[str] = set()
         self._locked_players: Dict[Player, Optional[LineupPosition]] = {}
         self._player_filters: List[BaseFilter] = []
         self.with_injured = False
         self.search_threshold = 0.8
         self.removed_players: Set[Player] = set()
+        self._version = 0
+        self._filtered_players_cache: Optional[Tuple[Tuple[int, int], List[Player]]] = None
+        self._players_table: Optional[Tuple[int, PlayersTable]] = None
+        self._updates: List[Dict[Player, FrozenSet[str]]] = []
 
     @property
     def all_players(self) -> List[Player]:
@@ -66,19 +103,41 @@ class PlayerPool:
 
     @property
     def filtered_players(self) -> List[Player]:
-        pool = []
-        for player in self._players:
-            if (
-                (player in self.removed_players) or
-                (player.max_exposure is not None and player.max_exposure <= 0) or
-                (not self.with_injured and player.is_injured) or
-                player.team in self._exclude_teams or
-                (self._player_filters and
-                 not all(filter.filter(player) for filter in self._player_filters))
-            ):
-                continue
-            pool.append(player)
-        return pool
+        """
+        Players filtered by removed players, excluded teams and filters are cached until pool or values
+        used by filters (salary, fppg) are changed, custom filters can use any attributes, so players aren't
+        cached with them. Exposure and injury checks are done on each call because these attributes
+        are often changed in players.
+        """
+        players_table = self.players_table
+        cache_key = (self._version, players_table.version)
+        cacheable = all(type(player_filter) is PlayerFilter for player_filter in self._player_filters)
+        if not cacheable or self._filtered_players_cache is None or self._filtered_players_cache[0] != cache_key:
+            players_mask = np.ones(len(players_table), dtype=bool)
+            if self.removed_players:
+                players_mask &= ~players_table.contains(self.removed_players)
+            if self._exclude_teams:
+                players_mask &= ~players_table.get_teams_mask(list(self._exclude_teams)).any(axis=0)
+            for player_filter in self._player_filters:
+                players_mask &= player_filter.filter_players(players_table)
+            self._filtered_players_cache = (cache_key, players_table.get_players(players_mask))
+        with_injured = self.with_injured
+        return [
+            player for player in self._filtered_players_cache[1]
+            if (player.max_exposure is None or player.max_exposure > 0) and (with_injured or not player.is_injured)
+        ]
+
+    @property
+    def players_table(self) -> PlayersTable:
+        """
+        Columnar view of all players, it's rebuilt after pool is changed or cache is invalidated,
+        salary and fppg changed in players directly are synced on each access.
+        """
+        if self._players_table is None or self._players_table[0] != self._version:
+            self._players_table = (self._version, PlayersTable(self._players))
+        else:
+            self._players_table[1].sync_values()
+        return self._players_table[1]
 
     @property
     def locked_players(self) -> List[Player]:
@@ -135,14 +194,32 @@ class PlayerPool:
             return None
         return self.budget - self.used_budget
 
+    @property
+    def total_updates(self) -> int:
+        return len(self._updates)
+
+    def invalidate_cache(self) -> None:
+        """
+        Should be called after changing teams or positions of players or changing removed_players directly
+        instead of remove_player and restore_player, salary and fppg are synced automatically.
+        """
+        self._version += 1
+
     def reset_players(self) -> None:
+        self.invalidate_cache()
         self._players = []
         self._players_by_name = defaultdict(list)
         self._players_by_id = {}
+        self._players_by_team = defaultdict(dict)
+        self._players_by_position = defaultdict(dict)
+        self._players_by_game = defaultdict(dict)
+        self._players_by_roster_order = defaultdict(dict)
+        self._names_index = None
         self._exclude_teams = set()
         self.removed_players = set()
         self._locked_players = {}
         self._player_filters = []
+        self._updates = []
 
     def reset_locked(self) -> None:
         self._locked_players = {}
@@ -159,6 +236,88 @@ class PlayerPool:
         self._players.append(player)
         self._players_by_name[player.full_name].append(player)
         self._players_by_id[player.id] = player
+        self._players_by_team[player.team][player] = None
+        for position in player.positions:
+            self._players_by_position[position][player] = None
+        if player.game_info:
+            self._players_by_game[player.game_info][player] = None
+        if player.roster_order is not None:
+            self._players_by_roster_order[player.roster_order][player] = None
+        self._names_index = None
+        self.invalidate_cache()
+
+    def update_player(self, player: DirtyPlayer, **attributes: Any) -> FrozenSet[str]:
+        """
+        Set passed attributes of player and return names of changed attributes.
+        """
+        player = self._clean_player(player)
+        self._check_updatable_attributes(attributes)
+        changed_attributes = self._set_attributes(player, attributes)
+        if changed_attributes:
+            self._add_update({player: changed_attributes})
+        return changed_attributes
+
+    def update_players(
+            self,
+            players: Iterable[Player],
+            attributes: Iterable[str] = UPDATABLE_ATTRIBUTES,
+    ) -> Dict[Player, FrozenSet[str]]:
+        """
+        Copy attributes from passed players to pool players with the same id and positions, for example,
+        from players imported again from file with new projections. Players not found in pool are skipped.
+        Return changed attributes of each updated player.
+        """
+        attributes = tuple(attributes)
+        self._check_updatable_attributes(attributes)
+        if not attributes:
+            return {}
+        # all values are compared at once first, usually only small part of players is changed
+        get_values = attrgetter(*attributes)
+        pool_players = {player: player for player in self._players}
+        updated_players = {}  # type: Dict[Player, FrozenSet[str]]
+        for new_player in players:
+            player = pool_players.get(new_player)
+            if player is None:
+                continue
+            values = get_values(new_player)
+            if get_values(player) == values:
+                continue
+            if len(attributes) == 1:
+                values = (values, )
+            changed_attributes = self._set_attributes(player, dict(zip(attributes, values)))
+            if changed_attributes:
+                updated_players[player] = updated_players.get(player, frozenset()) | changed_attributes
+        if updated_players:
+            self._add_update(updated_players)
+        return updated_players
+
+    def get_updated_players(self, since: int = 0) -> Dict[Player, FrozenSet[str]]:
+        """
+        Return players with changed attributes in updates made after passed number of updates.
+        """
+        updated_players = {}  # type: Dict[Player, FrozenSet[str]]
+        for update in self._updates[since:]:
+            for player, attributes in update.items():
+                updated_players[player] = updated_players.get(player, frozenset()) | attributes
+        return updated_players
+
+    def _check_updatable_attributes(self, attributes: Iterable[str]) -> None:
+        for attribute in attributes:
+            if attribute not in self.UPDATABLE_ATTRIBUTES:
+                raise LineupOptimizerException('Attribute %s can\'t be updated' % attribute)
+
+    @staticmethod
+    def _set_attributes(player: Player, attributes: Dict[str, Any]) -> FrozenSet[str]:
+        changed_attributes = []
+        for attribute, value in attributes.items():
+            if getattr(player, attribute) != value:
+                setattr(player, attribute, value)
+                changed_attributes.append(attribute)
+        return frozenset(changed_attributes)
+
+    def _add_update(self, updated_players: Dict[Player, FrozenSet[str]]) -> None:
+        self._updates.append(updated_players)
+        self.invalidate_cache()
 
     def get_player_by_name(
             self, player_name: str, position: Optional[str] = None,
@@ -174,28 +333,59 @@ class PlayerPool:
                 raise LineupOptimizerException('More than 1 player is found for: %s' % player_name)
             return list(players)[0]
         if self.search_threshold:
-            matched_players = self.get_players(PlayerFilter(positions=[position])) if position else self.all_players
-            possibilities = [(player, ratio(player_name, player.full_name)) for player in matched_players]
-            filtered_possibilities = filter(lambda pos: pos[1] >= self.search_threshold, possibilities)
-            if filtered_possibilities:
-                sorted_players = sorted(filtered_possibilities, key=lambda pos: -pos[1])
-                return next(map(lambda player: player[0], sorted_players))  # typing: ignore
+            position_filter = PlayerFilter(positions=[position]) if position else None
+            for player in self.search_players(player_name):
+                if not position_filter or position_filter.filter(player, False):
+                    return player
         return None
 
+    def search_players(self, player_name: str) -> List[Player]:
+        """
+        Return players with similar name sorted by similarity.
+        Candidates are shortlisted by names index built on first search,
+        similarity is calculated only for players that can pass search threshold.
+        """
+        if self._names_index is None:
+            self._names_index = PlayersNamesIndex([player.full_name for player in self._players])
+        candidates = self._names_index.get_candidates(player_name, self.search_threshold)
+        possibilities = []
+        for i in candidates:
+            player = self._players[i]
+            player_ratio = ratio(player_name, player.full_name, self.search_threshold)
+            if player_ratio >= self.search_threshold:
+                possibilities.append((player, player_ratio))
+        possibilities.sort(key=lambda pos: -pos[1])
+        return [player for player, _ in possibilities]
+
     def get_player_by_id(self, player_id: str) -> Optional[Player]:
         return self._players_by_id.get(player_id)
 
+    def get_players_by_team(self, team: str) -> Tuple[Player, ...]:
+        return tuple(self._players_by_team.get(team, ()))
+
+    def get_players_by_position(self, position: str) -> Tuple[Player, ...]:
+        return tuple(self._players_by_position.get(position, ()))
+
+    def get_players_by_game(self, game: GameInfo) -> Tuple[Player, ...]:
+        return tuple(self._players_by_game.get(game, ()))
+
+    def get_players_by_roster_order(self, roster_order: int) -> Tuple[Player, ...]:
+        return tuple(self._players_by_roster_order.get(roster_order, ()))
+
     def exclude_teams(self, teams: Iterable[str]):
         self._exclude_teams = set(teams)
+        self.invalidate_cache()
 
     def remove_player(self, player: DirtyPlayer):
         self.removed_players.add(self._clean_player(player))
+        self.invalidate_cache()
 
     def restore_player(self, player: DirtyPlayer):
         try:
             self.removed_players.remove(self._clean_player(player))
         except KeyError:
             raise LineupOptimizerException('Player not removed!')
+        self.invalidate_cache()
 
     def lock_player(self, player: DirtyPlayer, position: Optional[str] = None):
         player = self._clean_player(player)
@@ -256,10 +446,11 @@ class PlayerPool:
                 players.append(item)
         allowed_players = None
         if filters:
-            allowed_players = {
-                player for player in self.all_players if
-                all(player_filter.filter(player, False) for player_filter in filters)
-            }
+            players_table = self.players_table
+            players_mask = np.ones(len(players_table), dtype=bool)
+            for player_filter in filters:
+                players_mask &= player_filter.filter_players(players_table, False)
+            allowed_players = set(players_table.get_players(players_mask))
         if players:
             result = []
             for player in players:
@@ -271,6 +462,7 @@ class PlayerPool:
 
     def add_filters(self, *filters: BaseFilter):
         self._player_filters.extend(filters)
+        self.invalidate_cache()
 
     def _clean_player(self, player: DirtyPlayer, allowed_players: Optional[Set[Player]] = None) -> Player:
         if not isinstance(player, Player):
@@ -0,0 +1,363 @@
+from typing import List, Dict, FrozenSet, Tuple, Sequence, Iterable, Hashable, TypeVar, Optional
+from operator import attrgetter
+import numpy as np
+from pydfs_lineup_optimizer.player import Player, LineupPlayer
+
+
+T = TypeVar('T', bound=Hashable)
+
+
+def encode_values(values: Iterable[T]) -> Tuple[List[T], np.ndarray]:
+    """
+    Encode values as integer codes in order of first appearance, None values get -1 code.
+    """
+    unique_values = {}  # type: Dict[T, int]
+    codes = []
+    for value in values:
+        if value is None:
+            codes.append(-1)
+            continue
+        code = unique_values.get(value)
+        if code is None:
+            code = unique_values[value] = len(unique_values)
+        codes.append(code)
+    return list(unique_values), np.array(codes, dtype=np.int64)
+
+
+def optional_column(players: Sequence[Player], attribute: str) -> np.ndarray:
+    """
+    Return float column of optional players attribute, None values are stored as NaN.
+    """
+    values = list(map(attrgetter(attribute), players))
+    if None in values:
+        nan = np.nan
+        values = [nan if value is None else value for value in values]
+    return np.array(values, dtype=float)
+
+
+class PlayersTable:
+    """
+    Columnar view of players used for building constraints with array operations.
+    Index of row in each column is index of player in players list.
+    """
+    UPDATABLE_COLUMNS = (
+        'fppg', 'fppg_floor', 'fppg_ceil', 'projected_ownership', 'min_exposure', 'max_exposure',
+        'min_deviation', 'max_deviation', 'progressive_scale', 'is_injured',
+    )
+
+    def __init__(self, players: Sequence[Player]):
+        self.players = list(players)
+        self.version = 0  # incremented after each update of columns
+        self._indices = None  # type: Optional[Dict[Player, int]]
+        self.salary = np.array([player.salary for player in self.players], dtype=float)
+        self.fppg = np.array([player.fppg for player in self.players], dtype=float)
+        self.fppg_floor = optional_column(self.players, 'fppg_floor')
+        self.fppg_ceil = optional_column(self.players, 'fppg_ceil')
+        self.projected_ownership = optional_column(self.players, 'projected_ownership')
+        self.min_exposure = optional_column(self.players, 'min_exposure')
+        self.max_exposure = optional_column(self.players, 'max_exposure')
+        self.min_deviation = optional_column(self.players, 'min_deviation')
+        self.max_deviation = optional_column(self.players, 'max_deviation')
+        self.progressive_scale = optional_column(self.players, 'progressive_scale')
+        with np.errstate(divide='ignore', invalid='ignore'):
+            self.efficiency = np.where(self.salary != 0, np.round(self.fppg / self.salary, 6), np.nan)
+        self.is_injured = np.array([player.is_injured for player in self.players], dtype=bool)
+        self.teams, self.team_codes = encode_values(player.team for player in self.players)
+        self.games, self.game_codes = encode_values(player.game_info for player in self.players)
+        self.positions = sorted({position for player in self.players for position in player.positions})
+        positions_bits = {position: 1 << i for i, position in enumerate(self.positions)}
+        self.positions_mask = np.array([
+            sum(positions_bits[position] for position in set(player.positions)) for player in self.players
+        ], dtype=np.int64)
+
+    def __len__(self) -> int:
+        return len(self.players)
+
+    def update_players(self, updated_players: Dict[Player, FrozenSet[str]]) -> None:
+        """
+        Patch rows of players with updated attributes in place, attributes without column are skipped.
+        """
+        if self._indices is None:
+            self._indices = {player: i for i, player in enumerate(self.players)}
+        for player, attributes in updated_players.items():
+            i = self._indices.get(player)
+            if i is None:
+                continue
+            for attribute in attributes:
+                if attribute in self.UPDATABLE_COLUMNS:
+                    value = getattr(player, attribute)
+                    getattr(self, attribute)[i] = np.nan if value is None else value
+            if 'fppg' in attributes and self.salary[i] != 0:
+                self.efficiency[i] = np.round(self.fppg[i] / self.salary[i], 6)
+        self.version += 1
+
+    def sync_values(self) -> bool:
+        """
+        Re-read salary and fppg of players, these attributes are often changed in players directly.
+        Changed rows are patched in place with efficiency, return True if any row is changed.
+        """
+        salary = np.array([player.salary for player in self.players], dtype=float)
+        fppg = np.array([player.fppg for player in self.players], dtype=float)
+        changed = (salary != self.salary) | (fppg != self.fppg)
+        if not changed.any():
+            return False
+        self.salary[changed] = salary[changed]
+        self.fppg[changed] = fppg[changed]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            self.efficiency[changed] = np.where(
+                salary[changed] != 0, np.round(fppg[changed] / salary[changed], 6), np.nan)
+        self.version += 1
+        return True
+
+    def get_positions_bits(self, positions: Iterable[str]) -> int:
+        return sum(1 << self.positions.index(position) for position in set(positions) if position in self.positions)
+
+    def has_all_positions(self, positions: Iterable[str]) -> np.ndarray:
+        """
+        Return mask of players that can play all positions.
+        """
+        positions = set(positions)
+        if not positions.issubset(self.positions):
+            return np.zeros(len(self.players), dtype=bool)
+        bits = self.get_positions_bits(positions)
+        mask = (self.positions_mask & bits) == bits  # type: np.ndarray
+        return mask
+
+    def has_positions(self, positions: Iterable[str]) -> np.ndarray:
+        """
+        Return mask of players that can play at least one of positions.
+        """
+        mask = (self.positions_mask & self.get_positions_bits(positions)) != 0  # type: np.ndarray
+        return mask
+
+    def get_teams_mask(self, teams: Sequence[str]) -> np.ndarray:
+        """
+        Return matrix with mask of players for each team.
+        """
+        team_codes = np.array([self.teams.index(team) if team in self.teams else -2 for team in teams], dtype=np.int64)
+        mask = self.team_codes == team_codes[:, np.newaxis]  # type: np.ndarray
+        return mask
+
+    @staticmethod
+    def group_by_codes(codes: np.ndarray, players_mask: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Group players with known code (selected by mask if it's passed), return codes of groups
+        in order of first appearance and matrix with mask of players for each group.
+        """
+        selected = codes >= 0
+        if players_mask is not None:
+            selected &= players_mask
+        selected_codes = codes[selected]
+        _, first_indices = np.unique(selected_codes, return_index=True)
+        groups = selected_codes[np.sort(first_indices)]
+        return groups, (codes == groups[:, np.newaxis]) & selected
+
+    def get_players(self, players_mask: np.ndarray) -> List[Player]:
+        return [self.players[i] for i in np.flatnonzero(players_mask)]
+
+    def contains(self, players: Iterable[Player]) -> np.ndarray:
+        """
+        Return mask of players that are in passed players.
+        """
+        players = set(players)
+        return np.array([player in players for player in self.players], dtype=bool)
+
+
+class PlayersNamesIndex:
+    """
+    Matrix with count of each character in lowercase players names. Number of common characters
+    is upper bound for matched characters in utils.ratio, so it's used for shortlisting players
+    without losing any player with ratio above threshold.
+    """
+    def __init__(self, names: Sequence[str]):
+        names = [name.lower() for name in names]
+        self.characters = {}  # type: Dict[str, int]
+        for name in names:
+            for character in name:
+                self.characters.setdefault(character, len(self.characters))
+        self.counts = np.zeros((len(names), len(self.characters)), dtype=np.int32)
+        for i, name in enumerate(names):
+            for character in name:
+                self.counts[i, self.characters[character]] += 1
+        self.lengths = np.array([len(name) for name in names], dtype=np.int64)
+
+    def get_candidates(self, search_string: str, threshold: float) -> np.ndarray:
+        """
+        Return sorted indices of names that can have ratio with search string not less than threshold.
+        """
+        search_string = search_string.lower()
+        search_counts = np.zeros(len(self.characters), dtype=np.int32)
+        for character in search_string:
+            column = self.characters.get(character)
+            if column is not None:
+                search_counts[column] += 1
+        common = np.minimum(self.counts, search_counts).sum(axis=1)
+        # ratio compares search string with parts of the same length if name is longer
+        total_length = len(search_string) + np.minimum(self.lengths, len(search_string))
+        upper_bound = np.ones(len(self.lengths))
+        np.divide(2.0 * common, total_length, out=upper_bound, where=total_length > 0)
+        candidates = np.flatnonzero(upper_bound >= threshold - 1e-9)  # type: np.ndarray
+        return candidates
+
+
+if hasattr(np, 'bitwise_count'):
+    def popcount(bits: np.ndarray) -> np.ndarray:
+        counts = np.bitwise_count(bits)  # type: np.ndarray
+        return counts
+else:  # numpy < 2.0
+    _BYTES_POPCOUNT = np.array([bin(i).count('1') for i in range(256)], dtype=np.uint8)
+
+    def popcount(bits: np.ndarray) -> np.ndarray:
+        bytes_view = bits.view(np.uint8).reshape(bits.shape + (bits.dtype.itemsize, ))
+        counts = _BYTES_POPCOUNT[bytes_view].sum(axis=-1, dtype=np.uint8)  # type: np.ndarray
+        return counts
+
+
+class LineupsBitset:
+    """
+    Lineups encoded as rows of 64-bit words, bit i is set if lineup contains players[i].
+    Players that aren't passed explicitly are indexed in order of first appearance in lineups.
+    """
+    OVERLAPS_CHUNK_SIZE = 2 ** 22
+
+    def __init__(self, lineups: Iterable[Iterable[Player]] = (), players: Optional[Sequence[Player]] = None):
+        self.players_indices = {}  # type: Dict[Player, int]
+        self._indices_by_id = {}  # type: Dict[int, int]
+        for player in players or ():
+            self._get_player_index(player, add_player=True)
+        # lineups are stored in arrays with spare capacity, so adding lineups doesn't copy all stored lineups
+        self._total_lineups = 0
+        self._incidence = np.zeros((0, len(self.players_indices)), dtype=bool)
+        self._bits = self.pack(self._incidence)
+        self._sizes = np.zeros(0, dtype=np.int64)
+        self.add_lineups(lineups)
+
+    def __len__(self) -> int:
+        return self._total_lineups
+
+    @property
+    def incidence(self) -> np.ndarray:
+        return self._incidence[:self._total_lineups, :len(self.players_indices)]
+
+    @property
+    def bits(self) -> np.ndarray:
+        return self._bits[:self._total_lineups]
+
+    @property
+    def sizes(self) -> np.ndarray:
+        return self._sizes[:self._total_lineups]
+
+    @property
+    def players(self) -> List[Player]:
+        return list(self.players_indices)
+
+    def _get_player_index(self, player: Player, add_player: bool) -> Optional[int]:
+        player = player._player if isinstance(player, LineupPlayer) else player
+        # lineups usually share the same Player objects, so indexed objects are looked up by identity first
+        index = self._indices_by_id.get(id(player))
+        if index is None:
+            index = self.players_indices.get(player)
+            if index is None and add_player:
+                index = self.players_indices[player] = len(self.players_indices)
+                self._indices_by_id[id(player)] = index
+        return index
+
+    def encode(self, lineups: Iterable[Iterable[Player]], add_players: bool = False) -> np.ndarray:
+        """
+        Return lineups x players incidence matrix, not indexed players are skipped unless add_players is set.
+        """
+        lineups = list(lineups)
+        rows, columns = [], []
+        for row, lineup in enumerate(lineups):
+            for player in lineup:
+                index = self._get_player_index(player, add_players)
+                if index is not None:
+                    rows.append(row)
+                    columns.append(index)
+        incidence = np.zeros((len(lineups), len(self.players_indices)), dtype=bool)
+        incidence[rows, columns] = True
+        return incidence
+
+    @staticmethod
+    def pack(incidence: np.ndarray) -> np.ndarray:
+        words = -(-incidence.shape[1] // 64) or 1
+        packed = np.packbits(incidence, axis=1, bitorder='little')
+        packed = np.pad(packed, ((0, 0), (0, words * 8 - packed.shape[1])))
+        bits = np.ascontiguousarray(packed).view(np.uint64)  # type: np.ndarray
+        return bits
+
+    def add_lineups(self, lineups: Iterable[Iterable[Player]], add_players: bool = True) -> None:
+        """
+        Encode and append lineups, only passed lineups are packed.
+        """
+        incidence = self.encode(lineups, add_players)
+        if not len(incidence):
+            return
+        bits = self.pack(incidence)
+        start, end = self._total_lineups, self._total_lineups + len(incidence)
+        self._reserve(end, incidence.shape[1], bits.shape[1])
+        self._incidence[start:end, :incidence.shape[1]] = incidence
+        self._bits[start:end] = bits
+        self._sizes[start:end] = incidence.sum(axis=1)
+        self._total_lineups = end
+
+    def _reserve(self, total_lineups: int, total_players: int, words: int) -> None:
+        """
+        Grow arrays capacity by doubling, packed rows are widened only when number of words grows.
+        """
+        rows, columns = self._incidence.shape
+        if total_lineups > rows or total_players > columns:
+            rows = max(total_lineups, 2 * rows) if total_lineups > rows else rows
+            columns = max(total_players, 2 * columns) if total_players > columns else columns
+            incidence = np.zeros((rows, columns), dtype=bool)
+            incidence[:self._total_lineups, :self._incidence.shape[1]] = self._incidence[:self._total_lineups]
+            self._incidence = incidence
+            sizes = np.zeros(rows, dtype=np.int64)
+            sizes[:self._total_lineups] = self._sizes[:self._total_lineups]
+            self._sizes = sizes
+        if rows > len(self._bits) or words > self._bits.shape[1]:
+            bits = np.zeros((rows, max(words, self._bits.shape[1])), dtype=np.uint64)
+            bits[:self._total_lineups, :self._bits.shape[1]] = self._bits[:self._total_lineups]
+            self._bits = bits
+
+    def get_keys(self) -> List[bytes]:
+        """
+        Return hashable key of each lineup, keys are changed when new players are added.
+        """
+        return [row.tobytes() for row in self.bits]
+
+    def get_overlaps(self, index: int) -> np.ndarray:
+        """
+        Return number of players shared by each lineup with lineup at index.
+        """
+        overlaps = popcount(self.bits & self.bits[index]).sum(axis=1, dtype=np.int64)  # type: np.ndarray
+        return overlaps
+
+    def get_overlaps_matrix(self, bits: np.ndarray) -> np.ndarray:
+        """
+        Return matrix with number of players shared by each of encoded lineups (row) with each lineup (column).
+        """
+        overlaps = np.zeros((len(bits), len(self.bits)), dtype=np.int64)
+        step = max(1, self.OVERLAPS_CHUNK_SIZE // max(1, self.bits.size))
+        for start in range(0, len(bits), step):
+            chunk = bits[start:start + step, np.newaxis, :] & self.bits
+            overlaps[start:start + step] = popcount(chunk).sum(axis=2, dtype=np.int64)
+        return overlaps
+
+    def get_indices(self, lineup: Iterable[Player]) -> np.ndarray:
+        """
+        Return sorted indices of indexed players of lineup.
+        """
+        indices = [self._get_player_index(player, add_player=False) for player in lineup]
+        return np.array(sorted(index for index in indices if index is not None), dtype=np.int64)
+
+    def get_max_overlaps(self, lineups: Iterable[Iterable[Player]]) -> np.ndarray:
+        """
+        Return max number of players shared by each of passed lineups with any encoded lineup.
+        """
+        lineups = list(lineups)
+        if not len(self.bits):
+            return np.zeros(len(lineups), dtype=np.int64)
+        # gathering columns of few players is cheaper than packing passed lineups for popcount
+        return np.array([self.incidence[:, self.get_indices(lineup)].sum(axis=1).max() for lineup in lineups],
+                        dtype=np.int64)
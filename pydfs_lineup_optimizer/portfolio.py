@@ -0,0 +1,111 @@
+from typing import List, Optional, Sequence
+import numpy as np
+from pydfs_lineup_optimizer.exceptions import LineupOptimizerException
+from pydfs_lineup_optimizer.lineup import Lineup
+from pydfs_lineup_optimizer.players_table import LineupsBitset
+
+
+class PortfolioSelector:
+    """
+    Select subset of candidate lineups with the best total value under players exposures and overlap limits.
+    By default value of lineup is its projection, values can be replaced with any other lineups metric,
+    for example simulated mean or top finish rate. If scores matrix (simulations x candidates,
+    like LineupsSimulation.scores) is passed, selector maximizes expected best score of selected lineups
+    in each simulation instead, so lineups with outcomes already covered by portfolio lose their value.
+    """
+    LAZY_BATCH_SIZE = 64
+
+    def __init__(
+            self,
+            candidates: Sequence[Lineup],
+            values: Optional[Sequence[float]] = None,
+            scores: Optional[np.ndarray] = None,
+    ):
+        self.candidates = list(candidates)
+        if values is None:
+            values = [lineup.fantasy_points_projection for lineup in self.candidates]
+        self.values = np.asarray(values, dtype=float)
+        if len(self.values) != len(self.candidates):
+            raise LineupOptimizerException('Values should be specified for each candidate lineup')
+        self.scores = None  # type: Optional[np.ndarray]
+        if scores is not None:
+            self.scores = np.atleast_2d(np.asarray(scores, dtype=float))
+            if self.scores.shape[1] != len(self.candidates):
+                raise LineupOptimizerException('Scores matrix should have column for each candidate lineup')
+        self.bitset = LineupsBitset(self.candidates)
+
+    def get_exposure_limits(self, total_lineups: int, max_exposure: Optional[float]) -> np.ndarray:
+        """
+        Return maximum number of selected lineups for each player, -1 for players without limit.
+        """
+        limits = np.full(len(self.bitset.players), -1, dtype=np.int64)
+        for i, player in enumerate(self.bitset.players):
+            exposure = player.max_exposure if player.max_exposure is not None else max_exposure
+            if exposure is not None:
+                limits[i] = int(exposure * total_lineups + 1e-9)
+        return limits
+
+    def select(
+            self,
+            total_lineups: int,
+            max_exposure: Optional[float] = None,
+            max_overlap: Optional[int] = None,
+    ) -> List[Lineup]:
+        """
+        Greedily select up to total_lineups lineups. Player's own max exposure takes precedence over
+        max_exposure, max_overlap limits number of players shared by any pair of selected lineups.
+        Less lineups are returned if limits don't allow to select more.
+        """
+        if total_lineups <= 0:
+            return []
+        bitset = self.bitset
+        limits = self.get_exposure_limits(total_lineups, max_exposure)
+        used = np.zeros(len(limits), dtype=np.int64)
+        blocked = bitset.incidence[:, limits == 0].sum(axis=1) > 0
+        selected = []  # type: List[int]
+        for index in self._iterate_best(blocked):
+            selected.append(index)
+            if len(selected) == total_lineups:
+                break
+            players = bitset.incidence[index]
+            used[players] += 1
+            reached = players & (used == limits)
+            if reached.any():
+                blocked |= bitset.incidence[:, reached].any(axis=1)
+            overlaps = bitset.get_overlaps(index)
+            # don't select the same lineup twice
+            blocked |= (overlaps == bitset.sizes[index]) & (bitset.sizes == bitset.sizes[index])
+            if max_overlap is not None:
+                blocked |= overlaps > max_overlap
+        return [self.candidates[i] for i in selected]
+
+    def _iterate_best(self, blocked: np.ndarray):
+        """
+        Yield not blocked candidates in order of decreasing value, blocked mask is updated by caller
+        between iterations.
+        """
+        if self.scores is None:
+            for index in np.argsort(-self.values, kind='stable'):
+                if not blocked[index]:
+                    yield int(index)
+            return
+        # Expected best score is submodular, so marginal gains can only decrease and stale gains are
+        # upper bounds: best of recalculated candidates is selected if its gain isn't less than any stale
+        # gain (lazy greedy). Gains are recalculated for a batch of candidates with top stale gains at once.
+        scores = np.ascontiguousarray(self.scores.T)
+        best = scores.min(axis=0)
+        bounds = (scores - best).mean(axis=1)
+        while True:
+            bounds[blocked] = -np.inf
+            batch_size = min(self.LAZY_BATCH_SIZE, len(bounds))
+            batch = np.argpartition(-bounds, batch_size - 1)[:batch_size]
+            if bounds[batch].max() == -np.inf:
+                return
+            batch = batch[bounds[batch] > -np.inf]
+            bounds[batch] = np.maximum(scores[batch] - best, 0).mean(axis=1)
+            index = int(batch[np.argmax(bounds[batch])])
+            if bounds.max() > bounds[index]:
+                continue
+            np.maximum(best, scores[index], out=best)
+            blocked[index] = True
+            yield index
@@ -0,0 +1,134 @@
+from collections import OrderedDict
+from contextlib import contextmanager
+from time import perf_counter
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+
+class ProfilePhase:
+    MODEL = 'model'
+    RULE_INIT = 'rule_init'
+    APPLY = 'apply'
+    START_ITERATION = 'start_iteration'
+    APPLY_FOR_ITERATION = 'apply_for_iteration'
+    CHECK_LINEUP = 'check_lineup'
+    SOLVE = 'solve'
+    BUILD_LINEUP = 'build_lineup'
+    APPLY_FOR_LINEUP = 'apply_for_lineup'
+    APPLY_FOR_PLAYERS_UPDATE = 'apply_for_players_update'
+    POST_OPTIMIZE = 'post_optimize'
+
+
+class ProfileEvent:
+    """
+    Wall time of single measured step, iteration is index of generated lineup or None for model setup.
+    """
+    def __init__(
+            self,
+            phase: str,
+            name: str,
+            duration: float,
+            iteration: Optional[int] = None,
+            details: Optional[Dict[str, Any]] = None,
+    ):
+        self.phase = phase
+        self.name = name
+        self.duration = duration
+        self.iteration = iteration
+        self.details = details or {}
+
+    def __repr__(self):
+        return 'ProfileEvent: %s %s %.6fs' % (self.phase, self.name, self.duration)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'phase': self.phase,
+            'name': self.name,
+            'duration': self.duration,
+            'iteration': self.iteration,
+            'details': dict(self.details),
+        }
+
+
+class ProfileStat:
+    def __init__(self, phase: str, name: str):
+        self.phase = phase
+        self.name = name
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def __repr__(self):
+        return 'ProfileStat: %s %s %d calls %.6fs' % (self.phase, self.name, self.count, self.total)
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def add(self, event: ProfileEvent) -> None:
+        self.count += 1
+        self.total += event.duration
+        self.max = max(self.max, event.duration)
+
+
+class ProfileReport:
+    """
+    Events aggregated by phase and name, stats are ordered by total time.
+    """
+    def __init__(self, events: List[ProfileEvent]):
+        stats = OrderedDict()  # type: Dict[Tuple[str, str], ProfileStat]
+        for event in events:
+            key = (event.phase, event.name)
+            if key not in stats:
+                stats[key] = ProfileStat(event.phase, event.name)
+            stats[key].add(event)
+        self.stats = sorted(stats.values(), key=lambda stat: -stat.total)
+        self.total_time = sum(event.duration for event in events)
+        self.model_sizes = [event.details for event in events if event.phase == ProfilePhase.SOLVE]
+
+    def get_phases(self) -> Dict[str, float]:
+        phases = OrderedDict()  # type: Dict[str, float]
+        for stat in self.stats:
+            phases[stat.phase] = phases.get(stat.phase, 0.0) + stat.total
+        return phases
+
+    def __str__(self):
+        lines = ['%-20s %-40s %8s %12s %12s' % ('Phase', 'Name', 'Calls', 'Total, s', 'Max, s')]
+        for stat in self.stats:
+            lines.append('%-20s %-40s %8d %12.6f %12.6f' % (stat.phase, stat.name, stat.count, stat.total, stat.max))
+        lines.append('Total: %.6fs' % self.total_time)
+        return '\n'.join(lines)
+
+
+class OptimizationProfiler:
+    """
+    Collect wall time of optimization steps: model construction, each rule method, solves and
+    lineups assembly. Callback is called with each event as soon as it's measured.
+    Events are accumulated between optimizations until reset is called.
+    """
+    def __init__(self, callback: Optional[Callable[[ProfileEvent], None]] = None):
+        self.callback = callback
+        self.events = []  # type: List[ProfileEvent]
+        self.iteration = None  # type: Optional[int]
+
+    def reset(self) -> None:
+        self.events = []
+        self.iteration = None
+
+    @contextmanager
+    def measure(self, phase: str, name: str, **details: Any) -> Iterator[Dict[str, Any]]:
+        """
+        Measure wall time of block, yielded details can be updated inside block.
+        """
+        start = perf_counter()
+        try:
+            yield details
+        finally:
+            self.add_event(ProfileEvent(phase, name, perf_counter() - start, self.iteration, details))
+
+    def add_event(self, event: ProfileEvent) -> None:
+        self.events.append(event)
+        if self.callback is not None:
+            self.callback(event)
+
+    def get_report(self) -> ProfileReport:
+        return ProfileReport(self.events)
@@ -2,14 +2,17 @@ from uuid import uuid4
 from math import ceil
 from collections import defaultdict, Counter
 from itertools import product, groupby, permutations, chain
-from typing import List, Dict, DefaultDict, Set, Tuple, Any, Optional, TYPE_CHECKING
+from typing import List, Dict, FrozenSet, Set, Tuple, Any, Optional, Iterable, TYPE_CHECKING
 from weakref import proxy
-from pydfs_lineup_optimizer.solvers import Solver, SolverSign
+import numpy as np
+from pydfs_lineup_optimizer.solvers import Solver, SolverSign, ConstraintsMatrix
 from pydfs_lineup_optimizer.utils import list_intersection, get_positions_for_optimizer, get_remaining_positions, \
     get_players_grouped_by_teams
 from pydfs_lineup_optimizer.lineup import Lineup
-from pydfs_lineup_optimizer.player import Player, GameInfo
+from pydfs_lineup_optimizer.player import Player, LineupPlayer
 from pydfs_lineup_optimizer.context import OptimizationContext
+from pydfs_lineup_optimizer.players_table import LineupsBitset
+from pydfs_lineup_optimizer.fantasy_points_strategy import BaseFantasyPointsStrategy
 
 
 if TYPE_CHECKING:  # pragma: no cover
@@ -30,6 +33,31 @@ __all__ = [
 ]
 
 
+def add_groups_constraints(
+        solver: Solver,
+        players_variables: List[Any],
+        groups_variables: List[Any],
+        groups_mask: np.ndarray,
+        total_players: int,
+) -> None:
+    """
+    Link each group variable with players of group: variable is 1 if at least one player from group is selected.
+    """
+    total_groups = len(groups_variables)
+    if not total_groups:
+        return
+    identity = np.eye(total_groups)
+    matrix = ConstraintsMatrix.from_dense(
+        np.vstack([
+            np.hstack([groups_mask, -total_players * identity]),
+            np.hstack([groups_mask, -identity]),
+        ]),
+        [SolverSign.LTE] * total_groups + [SolverSign.GTE] * total_groups,
+        0,
+    )
+    solver.add_constraints_matrix(players_variables + groups_variables, matrix)
+
+
 class OptimizerRule:
     def __init__(self, optimizer: 'LineupOptimizer', players_dict: Dict[Player, Any], context: OptimizationContext):
         self.optimizer = proxy(optimizer)
@@ -40,12 +68,41 @@ class OptimizerRule:
     def player_pool(self):
         return self.optimizer.player_pool
 
+    def get_variables(self, players: Iterable[Player]) -> List[Any]:
+        """
+        Return variables of passed players that are used in optimization.
+        """
+        players_dict = self.players_dict
+        return [players_dict[player] for player in players if player in players_dict]
+
     def apply(self, solver: Solver):
         pass
 
     def apply_for_iteration(self, solver: Solver, result: Optional[Lineup]):
         pass
 
+    def apply_for_lineup(self, solver: Solver, lineup: Lineup):
+        """
+        Called with base solver after each generated lineup, added constraints are kept for all next iterations.
+        """
+        pass
+
+    def apply_for_players_update(self, solver: Solver, updated_players: Dict[Player, FrozenSet[str]]):
+        """
+        Called with base solver when attributes of players are updated in players pool during optimization,
+        updated players contain only players used in optimization with names of changed attributes.
+        """
+        pass
+
+    def check_lineup(self, lineup: Lineup) -> bool:
+        """
+        Check that lineup taken from solution pool satisfies constraints of current iteration.
+        Rules that add constraints for iteration or for each lineup should override it.
+        """
+        rule_class = type(self)
+        return rule_class.apply_for_iteration is OptimizerRule.apply_for_iteration and \
+            rule_class.apply_for_lineup is OptimizerRule.apply_for_lineup
+
     def post_optimize(self, solved_variables: List[str]):
         pass
 
@@ -53,47 +110,66 @@ class OptimizerRule:
 class Objective(OptimizerRule):
     def __init__(self, optimizer, players_dict, context):
         super().__init__(optimizer, players_dict, context)
-        self.fantasy_points_strategy = optimizer.fantasy_points_strategy
+        self.fantasy_points_strategy = optimizer.fantasy_points_strategy  # type: BaseFantasyPointsStrategy
 
     def apply_for_iteration(self, solver, result):
         if result:
             self.fantasy_points_strategy.set_previous_lineup(result)
-        variables = []
-        coefficients = []
-        get_points = self.fantasy_points_strategy.get_player_fantasy_points
-        for player, variable in self.players_dict.items():
-            fantasy_points = get_points(player)
-            variables.append(variable)
-            coefficients.append(fantasy_points)
-            self.context.players_used_fppg[player] = fantasy_points
-        solver.set_objective(variables, coefficients)
+        players_table = self.context.players_table
+        coefficients = self.fantasy_points_strategy.get_fantasy_points_vector(players_table).tolist()
+        self.context.players_used_fppg.update(zip(players_table.players, coefficients))
+        solver.set_objective(list(self.players_dict.values()), coefficients)
 
+    def check_lineup(self, lineup):
+        return not self.uses_previous_lineup
 
-class UniqueLineupRule(OptimizerRule):
-    def __init__(self, optimizer, players_dict, context):
-        super().__init__(optimizer, players_dict, context)
-        self.used_combinations = []  # type: List[Any]
+    @property
+    def uses_previous_lineup(self) -> bool:
+        strategy_class = type(self.fantasy_points_strategy)
+        return strategy_class.set_previous_lineup is not BaseFantasyPointsStrategy.set_previous_lineup
+
+    @property
+    def is_deterministic(self) -> bool:
+        """
+        True if fantasy points are the same in each iteration, so the same model can be used for several lineups.
+        """
+        return self.fantasy_points_strategy.is_deterministic
 
+
+class UniqueLineupRule(OptimizerRule):
     @property
     def max_repeating_players(self):
         optimizer = self.optimizer
         if optimizer.max_repeating_players:
             return optimizer.max_repeating_players
-        return (self.player_pool.total_players or len(self.used_combinations[0])) - 1
+        return (self.player_pool.total_players or int(self.context.lineups_bitset.sizes[0])) - 1
 
     def apply(self, solver: Solver):
-        for i, lineup in enumerate(self.context.exclude_lineups, start=1):
-            variables = [self.players_dict[player] for player in lineup]
-            solver.add_constraint(variables, None, SolverSign.LTE, self.max_repeating_players,
-                                  name='exclude_lineups_%d' % i)
-
-    def apply_for_iteration(self, solver, result):
-        if not result:
+        # Players that aren't in the pool can't be repeated, so they are skipped, duplicated lineups
+        # and lineups with less players than allowed to repeat don't need constraints.
+        exclude_lineups = LineupsBitset(players=self.context.players_table.players)
+        exclude_lineups.add_lineups(self.context.exclude_lineups, add_players=False)
+        if not len(exclude_lineups):
             return
-        self.used_combinations.append([self.players_dict[player] for player in result])
-        for i, variables in enumerate(self.used_combinations, start=1):
-            solver.add_constraint(variables, None, SolverSign.LTE, self.max_repeating_players,
-                                  name='max_repeating_lineup_%d' % i)
+        max_repeating_players = self.max_repeating_players
+        variables = list(self.players_dict.values())
+        lineups = zip(exclude_lineups.get_keys(), exclude_lineups.incidence, exclude_lineups.sizes)
+        used_keys = set()
+        for i, (key, players, size) in enumerate(lineups, start=1):
+            if size <= max_repeating_players or key in used_keys:
+                continue
+            used_keys.add(key)
+            solver.add_constraint([variables[j] for j in np.flatnonzero(players)], None, SolverSign.LTE,
+                                  max_repeating_players, name='exclude_lineups_%d' % i)
+
+    def apply_for_lineup(self, solver, lineup):
+        variables = [self.players_dict[player] for player in lineup]
+        solver.add_constraint(variables, None, SolverSign.LTE, self.max_repeating_players,
+                              name='max_repeating_lineup_%d' % len(self.context.lineups))
+
+    def check_lineup(self, lineup):
+        lineups_bitset = self.context.lineups_bitset
+        return not len(lineups_bitset) or lineups_bitset.get_max_overlaps([lineup])[0] <= self.max_repeating_players
 
 
 class TotalPlayersRule(OptimizerRule):
@@ -108,12 +184,9 @@ class LineupBudgetRule(OptimizerRule):
     def apply(self, solver):
         if not self.optimizer.budget:
             return
-        variables = []
-        coefficients = []
-        for player, variable in self.players_dict.items():
-            variables.append(variable)
-            coefficients.append(player.salary)
-        solver.add_constraint(variables, coefficients, SolverSign.LTE, self.optimizer.budget, name='budget')
+        matrix = ConstraintsMatrix.from_dense(
+            self.context.players_table.salary, SolverSign.LTE, self.optimizer.budget, names=['budget'])
+        solver.add_constraints_matrix(list(self.players_dict.values()), matrix)
 
 
 class LockedPlayersRule(OptimizerRule):
@@ -125,24 +198,43 @@ class LockedPlayersRule(OptimizerRule):
                 else self.context.max_exposure
         self.max_exposure_strategy = context.exposure_strategy(
             exposures, self.context.total_lineups)
+        self.unavailable_players = set()  # type: Set[Player]
+
+    def _get_forced_and_removed_players(self) -> Tuple[List[Player], List[Player]]:
+        removed_players = [player for player, variable in self.players_dict.items()
+                           if player in self.unavailable_players or
+                           self.max_exposure_strategy.is_reached_exposure(variable.name)]
+        forced_players = [player for player in self.player_pool.locked_players if player not in removed_players]
+        return forced_players, removed_players
 
     def apply_for_iteration(self, solver, result):
-        force_variables = []
-        exclude_variables = []
-        removed_players = []
-        for player, variable in self.players_dict.items():
-            if not self.max_exposure_strategy.is_reached_exposure(variable.name):
-                continue
-            removed_players.append(player)
-            exclude_variables.append(variable)
-        for player in self.player_pool.locked_players:
-            if player not in removed_players:
-                force_variables.append(self.players_dict[player])
+        forced_players, removed_players = self._get_forced_and_removed_players()
+        force_variables = [self.players_dict[player] for player in forced_players]
+        exclude_variables = [self.players_dict[player] for player in removed_players]
         if force_variables:
             solver.add_constraint(force_variables, None, SolverSign.EQ, len(force_variables), name='locked_players')
         if exclude_variables:
             solver.add_constraint(exclude_variables, None, SolverSign.EQ, 0, name='exclude_players')
 
+    def check_lineup(self, lineup):
+        forced_players, removed_players = self._get_forced_and_removed_players()
+        lineup_players = set(lineup)
+        return lineup_players.issuperset(forced_players) and lineup_players.isdisjoint(removed_players)
+
+    def apply_for_players_update(self, solver, updated_players):
+        # Players became injured or excluded by exposure are removed in each next iteration,
+        # so they can be used again if update is reverted
+        with_injured = self.player_pool.with_injured
+        exposures = self.max_exposure_strategy.exposures
+        for player, attributes in updated_players.items():
+            if 'max_exposure' in attributes:
+                exposures[self.players_dict[player].name] = player.max_exposure \
+                    if player.max_exposure is not None else self.context.max_exposure
+            if player.max_exposure == 0 or (player.is_injured and not with_injured):
+                self.unavailable_players.add(player)
+            else:
+                self.unavailable_players.discard(player)
+
     def post_optimize(self, solved_variables: List[str]):
         self.max_exposure_strategy.set_used(solved_variables)
 
@@ -156,27 +248,27 @@ class PositionsRule(OptimizerRule):
         positions_combinations = set([tuple(sorted(player.positions)) for player in self.players_dict.keys()
                                       if len(player.positions) > 1])
         positions = get_positions_for_optimizer(self.player_pool.remaining_positions, positions_combinations)
-        unique_positions = self.player_pool.available_positions
-        players_by_positions = {
-            position: {variable for player, variable in self.players_dict.items()
-                       if position in player.positions and player not in self.player_pool.locked_players_with_positions
-                       } for position in unique_positions
-        }
+        players_table = self.context.players_table
+        available_players = ~players_table.contains(self.player_pool.locked_players_with_positions)
+        rows = []
+        rhs = []
+        names = []
         for position, places in positions.items():
             extra = 0
             if len(position) == 1:
                 extra = extra_positions.get(position[0], 0)
-            players_with_position = set()
-            for pos in position:
-                players_with_position.update(players_by_positions[pos])
-            solver.add_constraint(players_with_position, None, SolverSign.GTE, places + extra,
-                                  name='positions_%s' % '_'.join(position))
+            rows.append(players_table.has_positions(position) & available_players)
+            rhs.append(places + extra)
+            names.append('positions_%s' % '_'.join(position))
+        if rows:
+            matrix = ConstraintsMatrix.from_dense(np.array(rows), SolverSign.GTE, rhs, names)
+            solver.add_constraints_matrix(list(self.players_dict.values()), matrix)
 
 
 class TeamMatesRule(OptimizerRule):
     def apply(self, solver):
         for team, quantity in self.optimizer.players_from_one_team.items():
-            players_from_same_team = [variable for player, variable in self.players_dict.items() if player.team == team]
+            players_from_same_team = self.get_variables(self.player_pool.get_players_by_team(team))
             solver.add_constraint(players_from_same_team, None, SolverSign.EQ, quantity,
                                   name='players_from_one_team_%s' % team)
 
@@ -185,21 +277,21 @@ class MaxFromOneTeamRule(OptimizerRule):
     def apply(self, solver):
         if not self.optimizer.max_from_one_team:
             return
-        for team in self.player_pool.available_teams:
-            players_from_team = [variable for player, variable in self.players_dict.items() if player.team == team]
-            solver.add_constraint(players_from_team, None, SolverSign.LTE, self.optimizer.max_from_one_team,
-                                  name='max_from_one_team_%s' % team)
+        teams = list(self.player_pool.available_teams)
+        matrix = ConstraintsMatrix.from_dense(
+            self.context.players_table.get_teams_mask(teams),
+            SolverSign.LTE,
+            self.optimizer.max_from_one_team,
+            ['max_from_one_team_%s' % team for team in teams],
+        )
+        solver.add_constraints_matrix(list(self.players_dict.values()), matrix)
 
 
 class MinSalaryCapRule(OptimizerRule):
     def apply(self, solver):
-        variables = []
-        coefficients = []
-        for player, variable in self.players_dict.items():
-            variables.append(variable)
-            coefficients.append(player.salary)
-        min_salary_cap = self.optimizer.min_salary_cap
-        solver.add_constraint(variables, coefficients, SolverSign.GTE, min_salary_cap, name='min_salary_cap')
+        matrix = ConstraintsMatrix.from_dense(
+            self.context.players_table.salary, SolverSign.GTE, self.optimizer.min_salary_cap, names=['min_salary_cap'])
+        solver.add_constraints_matrix(list(self.players_dict.values()), matrix)
 
 
 class ProjectedOwnershipRule(OptimizerRule):
@@ -241,36 +333,88 @@ class UniquePlayerRule(OptimizerRule):
 
 
 class LateSwapRule(OptimizerRule):
+    """
+    Re-optimize current lineup keeping players with started games on their positions.
+    Game status is checked once when rule is created, so all lineups are re-optimized with the same
+    started games. Constraints depend only on kept players, so they are built once for lineups with
+    the same kept players.
+    """
     def __init__(self, optimizer, players_dict, context):
         super().__init__(optimizer, players_dict, context)
-        self.current_iteration = 0
         self.lineups = context.existed_lineups
-
-    def apply_for_iteration(self, solver, result):
-        current_lineup = self.lineups[self.current_iteration]
-        unswappable_players = current_lineup.get_unswappable_players()
-        remaining_positions = get_remaining_positions(self.optimizer.settings.positions, unswappable_players)
+        self.current_lineup = None  # type: Optional[Lineup]
+        lineups_players = chain.from_iterable(lineup.players for lineup in self.lineups)
+        self.started_players = frozenset(
+            player for player in chain(players_dict, lineups_players) if player.is_game_started)
+        self.positions_combinations = {
+            tuple(sorted(player.positions)) for player in players_dict if len(player.positions) > 1}
+        self.variables = list(players_dict.values())
+        players_table = context.players_table
+        self._started_mask = players_table.contains(self.started_players)
+        self._positions_masks = {}  # type: Dict[Tuple[str, ...], np.ndarray]
+        self._constraints = {}  # type: Dict[FrozenSet[Tuple[Player, str]], List[Tuple[List[Any], str, int]]]
+
+    def get_unswappable_players(self, lineup: Lineup) -> List[LineupPlayer]:
+        return [player for player in lineup.players if player in self.started_players]
+
+    def get_lineup_key(self, lineup: Lineup) -> FrozenSet[Tuple[Player, str]]:
+        """
+        Return kept players with their positions, lineups with the same key have the same constraints.
+        """
+        return frozenset(
+            (player._player, player.lineup_position) for player in self.get_unswappable_players(lineup))
+
+    def _get_positions_mask(self, positions: Tuple[str, ...]) -> np.ndarray:
+        mask = self._positions_masks.get(positions)
+        if mask is None:
+            mask = self._positions_masks[positions] = self.context.players_table.has_positions(positions)
+        return mask
+
+    def _build_constraints(self, unswappable_players: List[LineupPlayer]) -> List[Tuple[List[Any], str, int]]:
+        variables = self.variables
+        constraints = []  # type: List[Tuple[List[Any], str, int]]
         # lock selected players
-        for player in unswappable_players:
-            solver.add_constraint([self.players_dict[player]], None, SolverSign.EQ, 1)
-        # set remaining positions
-        positions_combinations = set([tuple(sorted(player.positions)) for player in self.players_dict.keys()
-                                      if len(player.positions) > 1])
-        positions = get_positions_for_optimizer(remaining_positions, positions_combinations)
-        players_for_optimization = set()
+        if unswappable_players:
+            locked_variables = [self.players_dict[player._player] for player in unswappable_players]
+            constraints.append((locked_variables, SolverSign.EQ, len(locked_variables)))
+        # set remaining positions, players with started games can't be used in them
+        remaining_positions = get_remaining_positions(self.optimizer.settings.positions, unswappable_players)
+        positions = get_positions_for_optimizer(remaining_positions, self.positions_combinations)
+        available_mask = ~self._started_mask
+        players_for_optimization = np.zeros(len(variables), dtype=bool)
         for position, places in positions.items():
-            players_with_position = [variable for player, variable in self.players_dict.items()
-                                     if list_intersection(position, player.positions) and
-                                     player not in unswappable_players]
-            players_for_optimization.update(players_with_position)
-            solver.add_constraint(players_with_position, None, SolverSign.GTE, places)
-        # Set total players for optimization
-        solver.add_constraint(players_for_optimization, None, SolverSign.EQ, len(remaining_positions))
-        # Exclude players with active games
-        for player, variable in self.players_dict.items():
-            if player not in unswappable_players and player.is_game_started:
-                solver.add_constraint([self.players_dict[player]], None, SolverSign.EQ, 0)
-        self.current_iteration += 1
+            position_mask = self._get_positions_mask(position) & available_mask
+            players_for_optimization |= position_mask
+            constraints.append(([variables[i] for i in np.flatnonzero(position_mask)], SolverSign.GTE, places))
+        # set total players for optimization
+        constraints.append((
+            [variables[i] for i in np.flatnonzero(players_for_optimization)], SolverSign.EQ, len(remaining_positions)))
+        # exclude players with active games
+        unswappable_variables = {self.players_dict[player._player] for player in unswappable_players}
+        excluded_variables = [variables[i] for i in np.flatnonzero(self._started_mask)
+                              if variables[i] not in unswappable_variables]
+        if excluded_variables:
+            constraints.append((excluded_variables, SolverSign.EQ, 0))
+        return constraints
+
+    def apply_for_iteration(self, solver, result):
+        if self.current_lineup is None:
+            return
+        unswappable_players = self.get_unswappable_players(self.current_lineup)
+        key = self.get_lineup_key(self.current_lineup)
+        constraints = self._constraints.get(key)
+        if constraints is None:
+            constraints = self._constraints[key] = self._build_constraints(unswappable_players)
+        for variables, sign, rhs in constraints:
+            solver.add_constraint(variables, None, sign, rhs)
+
+    def check_lineup(self, lineup):
+        if self.current_lineup is None:
+            return True
+        positions = {player: player.lineup_position for player in lineup.players}
+        unswappable_players = self.get_unswappable_players(self.current_lineup)
+        return all(positions.get(player) == player.lineup_position for player in unswappable_players) and \
+            len(self.get_unswappable_players(lineup)) == len(unswappable_players)
 
 
 class GenericStacksRule(OptimizerRule):
@@ -296,6 +440,9 @@ class GenericStacksRule(OptimizerRule):
         if self.with_exposures:
             self._create_constraints(solver)
 
+    def check_lineup(self, lineup):
+        return not self.with_exposures
+
     @staticmethod
     def _build_group_name(group: 'BaseGroup'):
         return 'stack_%s' % group.uuid.hex
@@ -374,15 +521,33 @@ class MinExposureRule(OptimizerRule):
     def apply_for_iteration(self, solver, result):
         if not self.min_exposure_players:
             return
-        if result:
-            for player in result:
-                if player not in self.min_exposure_players:
-                    continue
-                self.min_exposure_players[player] -= 1
-                if self.min_exposure_players[player] == 0:
-                    del self.min_exposure_players[player]
         self._create_constraints(solver)
 
+    def apply_for_lineup(self, solver, lineup):
+        for player in lineup:
+            if player not in self.min_exposure_players:
+                continue
+            self.min_exposure_players[player] -= 1
+            if self.min_exposure_players[player] == 0:
+                del self.min_exposure_players[player]
+
+    def apply_for_players_update(self, solver, updated_players):
+        total_lineups = self.context.total_lineups
+        for player, attributes in updated_players.items():
+            if 'min_exposure' not in attributes:
+                continue
+            used = sum(1 for lineup in self.context.lineups if player in lineup.players)
+            remaining = round((player.min_exposure or 0) * total_lineups) - used
+            if remaining > 0:
+                self.min_exposure_players[player] = remaining
+            else:
+                self.min_exposure_players.pop(player, None)
+        if self.min_exposure_players and not self.positions:
+            self.positions = get_positions_for_optimizer(self.optimizer.settings.positions, None)
+
+    def check_lineup(self, lineup):
+        return not self.min_exposure_players
+
     def _create_constraints(self, solver: Solver) -> None:
         remaining_lineups = self.context.remaining_lineups
         for positions, total_for_positions in self.positions.items():
@@ -406,11 +571,14 @@ class RestrictPositionsForOpposingTeam(OptimizerRule):
     def apply(self, solver):
         if not self.optimizer.opposing_teams_position_restriction:
             return
-        for game in self.optimizer.player_pool.games:
-            home_team_players = {player: variable for player, variable in self.players_dict.items()
-                                  if player.team == game.home_team}
-            away_team_players = {player: variable for player, variable in self.players_dict.items()
-                                   if player.team == game.away_team}
+        player_pool = self.optimizer.player_pool
+        for game in player_pool.games:
+            home_team_players = {player: self.players_dict[player]
+                                 for player in player_pool.get_players_by_team(game.home_team)
+                                 if player in self.players_dict}
+            away_team_players = {player: self.players_dict[player]
+                                 for player in player_pool.get_players_by_team(game.away_team)
+                                 if player in self.players_dict}
             first_team_positions, second_team_positions = self.optimizer.opposing_teams_position_restriction
             for first_team_players, second_team_players in permutations([home_team_players, away_team_players], 2):
                 first_team_variables = [variable for player, variable in first_team_players.items()
@@ -453,10 +621,12 @@ class ForcePositionsForOpposingTeamRule(OptimizerRule):
             positions_vars = []
             combinations_count = 0
             for game in self.player_pool.games:
-                first_team_players = {player: variable for player, variable in self.players_dict.items()
-                                      if player.team == game.home_team}
-                second_team_players = {player: variable for player, variable in self.players_dict.items()
-                                       if player.team == game.away_team}
+                first_team_players = {player: self.players_dict[player]
+                                      for player in self.player_pool.get_players_by_team(game.home_team)
+                                      if player in self.players_dict}
+                second_team_players = {player: self.players_dict[player]
+                                       for player in self.player_pool.get_players_by_team(game.away_team)
+                                       if player in self.players_dict}
                 for first_team_positions, second_team_positions in permutations(positions, 2):
                     first_team_variables = [variable for player, variable in first_team_players.items()
                                             if first_team_positions in player.positions]
@@ -499,10 +669,10 @@ class FanduelBaseballRosterRule(OptimizerRule):
     MAXIMUM_HITTERS_FROM_ONE_TEAM = 4
 
     def apply(self, solver):
-        players_dict = {player: variable for player, variable in self.players_dict.items() if
-                        list_intersection(player.positions, self.HITTERS)}
         for team in self.optimizer.player_pool.available_teams:
-            players_from_team = [variable for player, variable in players_dict.items() if player.team == team]
+            players_from_team = self.get_variables(
+                player for player in self.player_pool.get_players_by_team(team)
+                if list_intersection(player.positions, self.HITTERS))
             solver.add_constraint(players_from_team, None, SolverSign.LTE, self.MAXIMUM_HITTERS_FROM_ONE_TEAM,
                                   name='fanduel_max_hitters_%s' % team)
 
@@ -515,17 +685,13 @@ class TotalTeamsRule(OptimizerRule):
         if not min_teams and not max_teams:
             return
         total_players = self.optimizer.settings.get_total_players()
-        players_by_teams = get_players_grouped_by_teams(self.players_dict.keys(), for_positions=[
+        players_table = self.context.players_table
+        teams_codes, teams_mask = players_table.group_by_codes(players_table.team_codes, players_table.has_positions([
             position for position in self.optimizer.player_pool.available_positions
             if position not in settings.total_teams_exclude_positions
-        ])
-        teams_variables = []
-        for team, team_players in players_by_teams.items():
-            variable = solver.add_variable('total_teams_%s' % team)
-            teams_variables.append(variable)
-            variables = [self.players_dict[player] for player in team_players]
-            solver.add_constraint(variables, None, SolverSign.LTE, variable * total_players)
-            solver.add_constraint(variables, None, SolverSign.GTE, variable)
+        ]))
+        teams_variables = [solver.add_variable('total_teams_%s' % players_table.teams[code]) for code in teams_codes]
+        add_groups_constraints(solver, list(self.players_dict.values()), teams_variables, teams_mask, total_players)
         if min_teams == max_teams:
             solver.add_constraint(teams_variables, None, SolverSign.EQ, min_teams, name='exact_teams')
         if min_teams:
@@ -555,17 +721,13 @@ class MinGamesRule(OptimizerRule):
         if not min_games:
             return
         total_players = self.optimizer.settings.get_total_players() or 100
-        players_by_games = defaultdict(list)  # type: DefaultDict[GameInfo, List[Player]]
-        for player in self.player_pool.filtered_players:
-            if player.game_info:
-                players_by_games[player.game_info].append(player)
+        players_table = self.context.players_table
+        games_codes, games_mask = players_table.group_by_codes(players_table.game_codes)
         game_variables = []
-        for game, game_players in players_by_games.items():
-            variable = solver.add_variable('total_game_%s_%s' % (game.home_team, game.away_team))
-            game_variables.append(variable)
-            variables = [self.players_dict[player] for player in game_players]
-            solver.add_constraint(variables, None, SolverSign.LTE, variable * total_players)
-            solver.add_constraint(variables, None, SolverSign.GTE, variable)
+        for code in games_codes:
+            game = players_table.games[code]
+            game_variables.append(solver.add_variable('total_game_%s_%s' % (game.home_team, game.away_team)))
+        add_groups_constraints(solver, list(self.players_dict.values()), game_variables, games_mask, total_players)
         if len(game_variables) >= min_games:
             solver.add_constraint(game_variables, None, SolverSign.GTE, min_games, name='min_games')
 
@@ -575,10 +737,10 @@ class DraftKingsBaseballRosterRule(OptimizerRule):
     MAXIMUM_HITTERS_FROM_ONE_TEAM = 5
 
     def apply(self, solver):
-        players_dict = {player: variable for player, variable in self.players_dict.items() if
-                        list_intersection(player.positions, self.HITTERS)}
         for team in self.player_pool.available_teams:
-            players_from_team = [variable for player, variable in players_dict.items() if player.team == team]
+            players_from_team = self.get_variables(
+                player for player in self.player_pool.get_players_by_team(team)
+                if list_intersection(player.positions, self.HITTERS))
             solver.add_constraint(players_from_team, None, SolverSign.LTE, self.MAXIMUM_HITTERS_FROM_ONE_TEAM,
                                   name='dk_max_hitters_%s' % team)
 
@@ -621,3 +783,6 @@ class TeamsExposureRule(OptimizerRule):
             if not team_variables:
                 continue
             solver.add_constraint(team_variables, None, SolverSign.EQ, 0)
+
+    def check_lineup(self, lineup):
+        return not any(self.max_exposure_strategy.is_reached_exposure(team) for team in {p.team for p in lineup})
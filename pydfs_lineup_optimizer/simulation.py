@@ -0,0 +1,110 @@
+from math import ceil
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence
+import numpy as np
+from pydfs_lineup_optimizer.exceptions import LineupOptimizerException
+from pydfs_lineup_optimizer.lineup import Lineup
+from pydfs_lineup_optimizer.player import Player
+
+
+if TYPE_CHECKING:
+    from pydfs_lineup_optimizer.context import OptimizationContext
+
+
+class LineupsSimulation:
+    """
+    Score lineups against simulated outcomes. Scenarios matrix contains fantasy points of players
+    in each simulation, column j contains points of players[j]. Lineups are scored by single multiply
+    of scenarios matrix by lineups incidence matrix. Field lineups are used only for calculating
+    finish rates, for example these can be expected lineups of opponents.
+    """
+    def __init__(
+            self,
+            lineups: Sequence[Lineup],
+            players: Sequence[Player],
+            scenarios: np.ndarray,
+            field_lineups: Optional[Sequence[Lineup]] = None,
+    ):
+        scenarios = np.atleast_2d(np.asarray(scenarios, dtype=float))
+        if scenarios.shape[1] != len(players):
+            raise LineupOptimizerException('Scenarios matrix should have column for each player')
+        self.lineups = list(lineups)
+        self.field_lineups = list(field_lineups or [])
+        self.players = list(players)
+        self.scenarios = scenarios
+        all_scores = scenarios @ self.get_incidence_matrix(self.lineups + self.field_lineups)
+        self.scores = all_scores[:, :len(self.lineups)]  # type: np.ndarray
+        self._all_scores = all_scores
+
+    @classmethod
+    def from_context(
+            cls,
+            context: 'OptimizationContext',
+            scenarios: np.ndarray,
+            field_lineups: Optional[Sequence[Lineup]] = None,
+    ) -> 'LineupsSimulation':
+        """
+        Simulate lineups generated in context, scenarios columns are in order of context players table.
+        """
+        return cls(context.lineups, context.players_table.players, scenarios, field_lineups)
+
+    @property
+    def total_simulations(self) -> int:
+        return len(self.scenarios)
+
+    def get_incidence_matrix(self, lineups: Sequence[Lineup]) -> np.ndarray:
+        """
+        Return players x lineups matrix, cell is 1 if player is in lineup.
+        """
+        players_indices = {}  # type: Dict[Player, int]
+        for i, player in enumerate(self.players):
+            players_indices.setdefault(player, i)
+        rows, columns = [], []
+        for column, lineup in enumerate(lineups):
+            for player in lineup:
+                if player not in players_indices:
+                    raise LineupOptimizerException('%s is not found in simulated players' % player)
+                rows.append(players_indices[player])
+                columns.append(column)
+        matrix = np.zeros((len(self.players), len(lineups)))
+        np.add.at(matrix, (rows, columns), 1)
+        return matrix
+
+    def get_mean(self) -> np.ndarray:
+        mean = self.scores.mean(axis=0)  # type: np.ndarray
+        return mean
+
+    def get_std(self) -> np.ndarray:
+        std = self.scores.std(axis=0)  # type: np.ndarray
+        return std
+
+    def get_percentiles(self, percentiles: Sequence[float]) -> np.ndarray:
+        """
+        Return matrix with score of each lineup (column) for each percentile (row).
+        """
+        result = np.percentile(self.scores, percentiles, axis=0)  # type: np.ndarray
+        return result
+
+    def get_top_rate(self, top: float) -> np.ndarray:
+        """
+        Return part of simulations where lineup finished in top share of all lineups including field lineups.
+        """
+        total = self._all_scores.shape[1]
+        places = min(total, max(1, ceil(top * total)))
+        cutoff = np.partition(self._all_scores, total - places, axis=1)[:, total - places]
+        rate = (self.scores >= cutoff[:, np.newaxis]).mean(axis=0)  # type: np.ndarray
+        return rate
+
+    def get_report(
+            self,
+            percentiles: Sequence[float] = (10, 50, 90),
+            tops: Sequence[float] = (0.01, 0.1),
+    ) -> List[Dict[str, float]]:
+        """
+        Return dict with mean, std, percentiles and top finish rates for each lineup.
+        """
+        columns = {'mean': self.get_mean(), 'std': self.get_std()}
+        for percentile, values in zip(percentiles, self.get_percentiles(percentiles)):
+            columns['p%g' % percentile] = values
+        for top in tops:
+            columns['top %g%%' % (top * 100)] = self.get_top_rate(top)
+        return [{key: float(values[i]) for key, values in columns.items()} for i in range(len(self.lineups))]
@@ -1,24 +1,26 @@
-from pydfs_lineup_optimizer.exceptions import LineupOptimizerIncorrectCSV
 from pydfs_lineup_optimizer.player import Player
 from pydfs_lineup_optimizer.sites.draftkings.classic.importer import DraftKingsCSVImporter
 
 
 class DraftKingsCaptainModeCSVImporter(DraftKingsCSVImporter):  # pragma: nocover
-    def _row_to_player(self, row):
-        try:
-            fppg_multiplier = 1.5 if row['Roster Position'] == 'CPT' else 1
-            name = row['Name'].split(maxsplit=1)
-            player = Player(
-                row['ID'],
-                name[0],
-                name[1] if len(name) > 1 else '',
-                row['Roster Position'].split('/'),
-                row['TeamAbbrev'],
-                float(row['Salary']),
-                float(row['AvgPointsPerGame']) * fppg_multiplier,
-                game_info=self._parse_game_info(row),
-                **self.get_player_extra(row)
+    def get_row_parser(self, header):
+        player_id, name, roster_positions, team, salary, fppg = self.get_column_indexes(
+            header, 'ID', 'Name', 'Roster Position', 'TeamAbbrev', 'Salary', 'AvgPointsPerGame')
+        parse_game_info = self._get_game_info_parser(header)
+        parse_extra = self.get_player_extra_parser(header)
+
+        def parse_row(row):
+            fppg_multiplier = 1.5 if row[roster_positions] == 'CPT' else 1
+            names = row[name].split(maxsplit=1)
+            return Player(
+                row[player_id],
+                names[0],
+                names[1] if len(names) > 1 else '',
+                row[roster_positions].split('/'),
+                row[team],
+                float(row[salary]),
+                float(row[fppg]) * fppg_multiplier,
+                game_info=parse_game_info(row),
+                **parse_extra(row)
             )
-        except KeyError:
-            raise LineupOptimizerIncorrectCSV
-        return player
+        return parse_row
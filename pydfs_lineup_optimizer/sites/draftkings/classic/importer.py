@@ -1,27 +1,34 @@
 import re
 import csv
-from itertools import islice
 from datetime import datetime
 from pytz import timezone
-from typing import Dict, Optional, Tuple
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
 from pydfs_lineup_optimizer.exceptions import LineupOptimizerIncorrectCSV
-from pydfs_lineup_optimizer.lineup_importer import CSVImporter
+from pydfs_lineup_optimizer.lineup_importer import StreamingCSVImporter
 from pydfs_lineup_optimizer.player import Player, LineupPlayer, GameInfo
 from pydfs_lineup_optimizer.lineup import Lineup
 from pydfs_lineup_optimizer.tz import get_timezone
 
 
-class DraftKingsCSVImporter(CSVImporter):  # pragma: nocover
+class DraftKingsCSVImporter(StreamingCSVImporter):  # pragma: nocover
     LINEUP_PLAYER_ID_REGEX = r'.+\((?P<id>\d+)\)'
+    HEADER_COLUMN = 'TeamAbbrev'
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self._games = {}  # type: Dict[Tuple[Optional[str], Optional[str]], GameInfo]
+        self._parsed_games = {}  # type: Dict[str, Optional[GameInfo]]
 
-    def _parse_game_info(self, row: Dict) -> Optional[GameInfo]:
-        raw_game_info = row.get('Game Info')
+    def _parse_game_info(self, raw_game_info: Optional[str]) -> Optional[GameInfo]:
         if not raw_game_info:
             return None
+        try:
+            return self._parsed_games[raw_game_info]
+        except KeyError:
+            game_info = self._parsed_games[raw_game_info] = self._create_game_info(raw_game_info)
+            return game_info
+
+    def _create_game_info(self, raw_game_info: str) -> Optional[GameInfo]:
         if raw_game_info in ('In Progress', 'Final'):
             game_info = self._games.get((None, None))
             if not game_info:
@@ -51,39 +58,37 @@ class DraftKingsCSVImporter(CSVImporter):  # pragma: nocover
         except ValueError:
             return None
 
-    def _row_to_player(self, row: Dict) -> Player:
-        try:
-            name = row['Name'].split(maxsplit=1)
-            player = Player(
-                row['ID'],
-                name[0],
-                name[1] if len(name) > 1 else '',
-                row['Position'].split('/'),
-                row['TeamAbbrev'],
-                float(row['Salary']),
-                float(row['AvgPointsPerGame']),
-                game_info=self._parse_game_info(row),
-                **self.get_player_extra(row)
+    def _get_game_info_parser(self, header: List[str]) -> Callable[[List[str]], Optional[GameInfo]]:
+        if 'Game Info' not in header:
+            return lambda row: None
+        index = header.index('Game Info')
+        return lambda row: self._parse_game_info(self._get_optional_cell(row, index))
+
+    def get_row_parser(self, header: List[str]) -> Callable[[List[str]], Optional[Player]]:
+        player_id, name, positions, team, salary, fppg = self.get_column_indexes(
+            header, 'ID', 'Name', 'Position', 'TeamAbbrev', 'Salary', 'AvgPointsPerGame')
+        parse_game_info = self._get_game_info_parser(header)
+        parse_extra = self.get_player_extra_parser(header)
+
+        def parse_row(row: List[str]) -> Player:
+            names = row[name].split(maxsplit=1)
+            return Player(
+                row[player_id],
+                names[0],
+                names[1] if len(names) > 1 else '',
+                row[positions].split('/'),
+                row[team],
+                float(row[salary]),
+                float(row[fppg]),
+                game_info=parse_game_info(row),
+                **parse_extra(row)
             )
-        except KeyError:
-            raise LineupOptimizerIncorrectCSV
-        return player
+        return parse_row
 
-    def import_players(self):
+    def iter_players(self) -> Iterator[Player]:
         self._games = {}
-        with open(self.filename, 'r') as csv_file:
-            start_line = 0  # Find line with 'TeamAbbrev', that's where players data starts
-            while True:
-                line = csv_file.readline()
-                if 'TeamAbbrev' in line:
-                    csv_file.seek(0)
-                    csv_data = csv.DictReader(islice(csv_file, start_line, None),
-                                              skipinitialspace=True)
-                    return [self._row_to_player(row) for row in csv_data]
-                elif line == '':
-                    raise LineupOptimizerIncorrectCSV
-                else:
-                    start_line += 1
+        self._parsed_games = {}
+        return super().iter_players()
 
     def import_lineups(self, players):
         with open(self.filename, 'r') as csv_file:
@@ -1,24 +1,26 @@
-from pydfs_lineup_optimizer.exceptions import LineupOptimizerIncorrectCSV
 from pydfs_lineup_optimizer.player import Player
 from pydfs_lineup_optimizer.sites.draftkings.classic.importer import DraftKingsCSVImporter
 
 
 class DraftKingsTiersCSVImporter(DraftKingsCSVImporter):  # pragma: nocover
-    def _row_to_player(self, row):
-        try:
-            name = row['Name'].split(maxsplit=1)
-            player = Player(
-                row['ID'],
-                name[0],
-                name[1] if len(name) > 1 else '',
-                row['Roster Position'].split('/'),
-                row['TeamAbbrev'],
+    def get_row_parser(self, header):
+        player_id, name, positions, roster_positions, team, fppg = self.get_column_indexes(
+            header, 'ID', 'Name', 'Position', 'Roster Position', 'TeamAbbrev', 'AvgPointsPerGame')
+        parse_game_info = self._get_game_info_parser(header)
+        parse_extra = self.get_player_extra_parser(header)
+
+        def parse_row(row):
+            names = row[name].split(maxsplit=1)
+            return Player(
+                row[player_id],
+                names[0],
+                names[1] if len(names) > 1 else '',
+                row[roster_positions].split('/'),
+                row[team],
                 0,
-                float(row['AvgPointsPerGame']),
-                game_info=self._parse_game_info(row),
-                original_positions=row['Position'].split('/'),
-                **self.get_player_extra(row)
+                float(row[fppg]),
+                game_info=parse_game_info(row),
+                original_positions=row[positions].split('/'),
+                **parse_extra(row)
             )
-        except KeyError:
-            raise LineupOptimizerIncorrectCSV
-        return player
+        return parse_row
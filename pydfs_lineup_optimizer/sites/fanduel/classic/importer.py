@@ -1,59 +1,55 @@
 import csv
-from copy import deepcopy
-from itertools import islice
-from typing import List, Dict
+from typing import Callable, Dict, Iterator, List, Optional
 from pydfs_lineup_optimizer.exceptions import LineupOptimizerIncorrectCSV
-from pydfs_lineup_optimizer.lineup_importer import CSVImporter
+from pydfs_lineup_optimizer.lineup_importer import StreamingCSVImporter
 from pydfs_lineup_optimizer.player import Player, GameInfo
 from pydfs_lineup_optimizer.lineup import Lineup, LineupPlayer
 
 
-class FanDuelCSVImporter(CSVImporter):  # pragma: nocover
+class FanDuelCSVImporter(StreamingCSVImporter):  # pragma: nocover
+    HEADER_COLUMN = 'FPPG'
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self._games = {}
+        self._games = {}  # type: Dict[str, Optional[GameInfo]]
 
-    def _row_to_player(self, row: Dict) -> Player:
+    def _parse_game_info(self, raw_game_info: str) -> Optional[GameInfo]:
         try:
-            away_team, home_team = row.get('Game', '').split('@')
-            game_info = self._games.get((home_team, away_team))
-            if not game_info:
-                game_info = GameInfo(home_team, away_team, None)
-                self._games[(home_team, away_team)] = game_info
+            return self._games[raw_game_info]
+        except KeyError:
+            pass
+        try:
+            away_team, home_team = raw_game_info.split('@')
+            game_info = GameInfo(home_team, away_team, None)  # type: Optional[GameInfo]
         except ValueError:
             game_info = None
-        try:
-            player = Player(
-                row['Id'],
-                row['First Name'],
-                row['Last Name'],
-                row['Position'].split('/'),
-                row['Team'],
-                float(row['Salary']),
-                float(row['FPPG'] or 0),
-                is_injured=True if row['Injury Indicator'].strip() else False,
-                game_info=game_info,
-                **self.get_player_extra(row)
+        self._games[raw_game_info] = game_info
+        return game_info
+
+    def get_row_parser(self, header: List[str]) -> Callable[[List[str]], Optional[Player]]:
+        player_id, first_name, last_name, positions, team, salary, fppg, injury = self.get_column_indexes(
+            header, 'Id', 'First Name', 'Last Name', 'Position', 'Team', 'Salary', 'FPPG', 'Injury Indicator')
+        game = header.index('Game') if 'Game' in header else None
+        parse_extra = self.get_player_extra_parser(header)
+
+        def parse_row(row: List[str]) -> Player:
+            return Player(
+                row[player_id],
+                row[first_name],
+                row[last_name],
+                row[positions].split('/'),
+                row[team],
+                float(row[salary]),
+                float(row[fppg] or 0),
+                is_injured=True if row[injury].strip() else False,
+                game_info=self._parse_game_info(self._get_optional_cell(row, game) or ''),
+                **parse_extra(row)
             )
-        except KeyError:
-            raise LineupOptimizerIncorrectCSV
-        return player
+        return parse_row
 
-    def import_players(self) -> List[Player]:
+    def iter_players(self) -> Iterator[Player]:
         self._games = {}
-        with open(self.filename, 'r') as csv_file:
-            start_line = 0  # Find line with 'FPPG', that's where players data starts
-            while True:
-                line = csv_file.readline()
-                if 'FPPG' in line:
-                    csv_file.seek(0)
-                    csv_data = csv.DictReader(islice(csv_file, start_line, None),
-                                              skipinitialspace=True)
-                    return [self._row_to_player(row) for row in csv_data]
-                elif line == '':
-                    raise LineupOptimizerIncorrectCSV
-                else:
-                    start_line += 1
+        return super().iter_players()
 
     def import_lineups(self, players):
         with open(self.filename, 'r') as csv_file:
@@ -85,28 +81,12 @@ class FanDuelCSVImporter(CSVImporter):  # pragma: nocover
 class FanDuelMVPCSVImporter(FanDuelCSVImporter):
     def import_players(self):
         players = super().import_players()
-        mvps = []
-        for player in players:
-            mvp_player = deepcopy(player)
-            mvp_player.fppg *= 1.5
-            mvp_player._original_positions = player.positions
-            mvp_player.positions = ('MVP', )
-            mvps.append(mvp_player)
-        players.extend(mvps)
+        players.extend([player.copy_for_position('MVP', 1.5) for player in players])
         return players
 
 
 class FanDuelLOLCSVImporter(FanDuelCSVImporter):
     def import_players(self):
         players = super().import_players()
-        stars = []
-        for player in players:
-            if 'TEAM' in player.positions:
-                continue
-            star_player = deepcopy(player)
-            star_player.fppg *= 1.5
-            star_player._original_positions = player.positions
-            star_player.positions = ('STAR', )
-            stars.append(star_player)
-        players.extend(stars)
+        players.extend([player.copy_for_position('STAR', 1.5) for player in players if 'TEAM' not in player.positions])
         return players
@@ -1,4 +1,3 @@
-from copy import deepcopy
 from typing import Type
 from pydfs_lineup_optimizer.sites.fanduel.classic.importer import FanDuelCSVImporter
 
@@ -10,23 +9,11 @@ def build_fanduel_single_game_importer(mvp=True, star=False, pro=False) -> Type[
             extra_players = []
             for player in players:
                 if mvp:
-                    mvp_player = deepcopy(player)
-                    mvp_player.fppg *= 2
-                    mvp_player._original_positions = player.positions
-                    mvp_player.positions = ('MVP', )
-                    extra_players.append(mvp_player)
+                    extra_players.append(player.copy_for_position('MVP', 2))
                 if star:
-                    star_player = deepcopy(player)
-                    star_player.fppg *= 1.5
-                    star_player._original_positions = player.positions
-                    star_player.positions = ('STAR', )
-                    extra_players.append(star_player)
+                    extra_players.append(player.copy_for_position('STAR', 1.5))
                 if pro:
-                    pro_player = deepcopy(player)
-                    pro_player.fppg *= 1.2
-                    pro_player._original_positions = player.positions
-                    pro_player.positions = ('PRO', )
-                    extra_players.append(pro_player)
+                    extra_players.append(player.copy_for_position('PRO', 1.2))
             players.extend(extra_players)
             return players
     return FanDuelSingleGameCSVImporter
@@ -35,12 +22,5 @@ def build_fanduel_single_game_importer(mvp=True, star=False, pro=False) -> Type[
 class FanDuelSingleGameHockeyCSVImporter(FanDuelCSVImporter):  # pragma: nocover
     def import_players(self):
         players = super().import_players()
-        extra_players = []
-        for player in players:
-            captain_player = deepcopy(player)
-            captain_player.fppg *= 1.5
-            captain_player._original_positions = player.positions
-            captain_player.positions = ('CAPTAIN', )
-            extra_players.append(captain_player)
-        players.extend(extra_players)
+        players.extend([player.copy_for_position('CAPTAIN', 1.5) for player in players])
         return players
@@ -0,0 +1,168 @@
+import os
+from datetime import datetime, timedelta, timezone as dt_timezone
+from hashlib import sha1
+from tempfile import NamedTemporaryFile
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+import numpy as np
+from pytz import timezone
+from pydfs_lineup_optimizer.player import Player, GameInfo
+from pydfs_lineup_optimizer.players_table import encode_values, optional_column
+
+
+SNAPSHOT_VERSION = 2
+GAME_START_FORMAT = '%Y-%m-%d %H:%M:%S.%f'  # without timezone, it's stored separately
+
+
+def get_snapshot_path(directory: str, filename: str, *keys: Any) -> str:
+    """
+    Return path of snapshot for file content, keys distinguish different ways of parsing the same file
+    (importer class, settings).
+    """
+    digest = sha1(('%d:%s' % (SNAPSHOT_VERSION, ':'.join(map(str, keys)))).encode())
+    with open(filename, 'rb') as file:
+        for chunk in iter(lambda: file.read(1 << 20), b''):
+            digest.update(chunk)
+    return os.path.join(directory, '%s.npz' % digest.hexdigest())
+
+
+def _encode_strings(values: Sequence[Optional[str]]) -> Dict[str, np.ndarray]:
+    unique_values, codes = encode_values(values)
+    return {'values': np.array(unique_values, dtype=str), 'codes': codes}
+
+
+def _decode_strings(values: np.ndarray, codes: np.ndarray) -> List[Optional[str]]:
+    decoded = values.tolist()  # type: List[Optional[str]]
+    decoded.append(None)  # code -1 is None
+    return [decoded[code] for code in codes.tolist()]
+
+
+def _decode_optional_floats(values: np.ndarray) -> List[Optional[float]]:
+    return [None if value != value else value for value in values.tolist()]
+
+
+def _get_game_start(game_info: GameInfo) -> Optional[str]:
+    """
+    Pytz timezones can't be restored from offset, so zone name is stored separately if it's known,
+    other timezones are stored as offset in seconds.
+    """
+    starts_at = game_info.starts_at
+    if starts_at is None:
+        return None
+    value = starts_at.strftime(GAME_START_FORMAT)
+    zone = getattr(starts_at.tzinfo, 'zone', None)
+    if zone:
+        return '%s|%s' % (value, zone)
+    offset = starts_at.utcoffset()
+    if offset is not None:
+        return '%s|%d' % (value, offset.total_seconds())
+    return value
+
+
+def _parse_game_start(value: Optional[str]) -> Optional[datetime]:
+    if value is None:
+        return None
+    if '|' not in value:
+        return datetime.strptime(value, GAME_START_FORMAT)
+    value, zone = value.split('|')
+    starts_at = datetime.strptime(value, GAME_START_FORMAT)
+    if zone.lstrip('-').isdigit():
+        return starts_at.replace(tzinfo=dt_timezone(timedelta(seconds=int(zone))))
+    return starts_at.replace(tzinfo=timezone(zone))
+
+
+def save_players_snapshot(players: Sequence[Player], path: str) -> None:
+    """
+    Save players as columns of uncompressed npz file, shared game info objects are saved once.
+    File is written atomically, so concurrent processes never read partially written snapshot.
+    """
+    unique_games, game_codes = encode_values(player.game_info for player in players)
+    games = [game for game in unique_games if game is not None]
+    columns = {
+        'game_codes': game_codes,
+        'game_started': np.array([game.game_started for game in games], dtype=np.bool_),
+        'salary': np.array([player.salary for player in players], dtype=float),
+        'fppg': np.array([player.fppg for player in players], dtype=float),
+        'is_injured': np.array([player.is_injured for player in players], dtype=np.bool_),
+        'is_confirmed_starter': np.array([
+            -1 if player.is_confirmed_starter is None else player.is_confirmed_starter for player in players
+        ], dtype=np.int8),
+    }
+    for attribute in ('roster_order', 'min_exposure', 'max_exposure', 'min_deviation', 'max_deviation',
+                      'projected_ownership', 'fppg_floor', 'fppg_ceil', 'progressive_scale'):
+        columns[attribute] = optional_column(players, attribute)
+    string_columns = {
+        'id': [player.id for player in players],
+        'first_name': [player.first_name for player in players],
+        'last_name': [player.last_name for player in players],
+        'positions': ['/'.join(player.positions) for player in players],
+        'original_positions': [
+            '/'.join(player._original_positions) if player._original_positions else None for player in players
+        ],
+        'team': [player.team for player in players],
+        'home_team': [game.home_team for game in games],
+        'away_team': [game.away_team for game in games],
+        'starts_at': [_get_game_start(game) for game in games],
+    }  # type: Dict[str, List[Optional[str]]]
+    for name, values in string_columns.items():
+        for key, column in _encode_strings(values).items():
+            columns['%s_%s' % (name, key)] = column
+    directory = os.path.dirname(path) or '.'
+    os.makedirs(directory, exist_ok=True)
+    with NamedTemporaryFile(dir=directory, suffix='.tmp', delete=False) as file:
+        np.savez(file, **columns)  # type: ignore
+    os.replace(file.name, path)
+
+
+def load_players_snapshot(path: str) -> List[Player]:
+    with np.load(path, allow_pickle=False) as data:
+        columns = {name: data[name] for name in data.files}
+    strings = {}  # type: Dict[str, List[Optional[str]]]
+    for name in ('id', 'first_name', 'last_name', 'positions', 'original_positions', 'team',
+                 'home_team', 'away_team', 'starts_at'):
+        strings[name] = _decode_strings(columns['%s_values' % name], columns['%s_codes' % name])
+    games = [
+        GameInfo(home_team, away_team, _parse_game_start(starts_at), game_started)
+        for home_team, away_team, starts_at, game_started in zip(
+            strings['home_team'], strings['away_team'], strings['starts_at'], columns['game_started'].tolist())
+    ]  # type: List[Optional[GameInfo]]
+    games.append(None)  # code -1 is None
+    positions = {
+        value: tuple(value.split('/')) for value in set(strings['positions']) if value
+    }  # type: Dict[Optional[str], Tuple[str, ...]]
+    original_positions = {
+        value: tuple(value.split('/')) if value else None for value in set(strings['original_positions'])
+    }
+    rows = zip(
+        strings['id'],
+        strings['first_name'],
+        strings['last_name'],
+        [positions[value] for value in strings['positions']],
+        strings['team'],
+        columns['salary'].tolist(),
+        columns['fppg'].tolist(),
+        columns['is_injured'].tolist(),
+        [games[code] for code in columns['game_codes'].tolist()],
+        [None if value != value else int(value) for value in columns['roster_order'].tolist()],
+        _decode_optional_floats(columns['min_exposure']),
+        _decode_optional_floats(columns['max_exposure']),
+        _decode_optional_floats(columns['min_deviation']),
+        _decode_optional_floats(columns['max_deviation']),
+        _decode_optional_floats(columns['projected_ownership']),
+        [None if value < 0 else bool(value) for value in columns['is_confirmed_starter'].tolist()],
+        _decode_optional_floats(columns['fppg_floor']),
+        _decode_optional_floats(columns['fppg_ceil']),
+        _decode_optional_floats(columns['progressive_scale']),
+        [original_positions[value] for value in strings['original_positions']],
+    )
+    players = []
+    new = object.__new__
+    # Slots are assigned directly, constructor normalizes values that are already normalized in snapshot
+    for row in rows:
+        player = new(Player)
+        player.id, player.first_name, player.last_name, player._positions, player.team, player.salary, \
+            player.fppg, player.is_injured, player.game_info, player.roster_order, player.min_exposure, \
+            player.max_exposure, player.min_deviation, player.max_deviation, player.projected_ownership, \
+            player.is_confirmed_starter, player.fppg_floor, player.fppg_ceil, player.progressive_scale, \
+            player._original_positions = row
+        players.append(player)
+    return players
@@ -3,11 +3,12 @@ from typing import Type
 from pydfs_lineup_optimizer.solvers.base import Solver
 from pydfs_lineup_optimizer.solvers.pulp_solver import PuLPSolver
 from pydfs_lineup_optimizer.solvers.constants import SolverSign
+from pydfs_lineup_optimizer.solvers.matrix import ConstraintsMatrix
 from pydfs_lineup_optimizer.solvers.exceptions import SolverException, SolverInfeasibleSolutionException
 
 
 __all__ = ['Solver', 'PuLPSolver', 'SolverSign', 'SolverException', 'SolverInfeasibleSolutionException',
-           'get_default_solver']
+           'ConstraintsMatrix', 'get_default_solver']
 
 
 def get_default_solver() -> Type[Solver]:
@@ -20,4 +21,10 @@ def get_default_solver() -> Type[Solver]:
     elif solver_backend_name == 'mip':
         from pydfs_lineup_optimizer.solvers.mip_solver import MIPSolver
         return MIPSolver
+    elif solver_backend_name == 'highs':
+        from pydfs_lineup_optimizer.solvers.highs_solver import HighsSolver
+        return HighsSolver
+    elif solver_backend_name == 'cp_sat':
+        from pydfs_lineup_optimizer.solvers.cp_sat_solver import CPSATSolver
+        return CPSATSolver
     raise ValueError('Unknown solver backend: %s' % solver_backend)
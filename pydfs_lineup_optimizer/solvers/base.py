@@ -1,4 +1,5 @@
-from typing import TypeVar, Any, List, Iterable, Optional, TYPE_CHECKING
+from typing import TypeVar, Any, List, Iterable, Optional, Sequence, Tuple, TYPE_CHECKING
+from pydfs_lineup_optimizer.solvers.matrix import ConstraintsMatrix
 
 
 if TYPE_CHECKING:
@@ -9,6 +10,8 @@ Self = TypeVar('Self', bound='Solver')
 
 
 class Solver:  # pragma: no cover
+    SOLUTION_POOL_GAP = 0.01
+
     def setup_solver(self) -> None:
         raise NotImplementedError
 
@@ -22,12 +25,45 @@ class Solver:  # pragma: no cover
                        name: Optional[str] = None):
         raise NotImplementedError
 
+    def add_constraints_matrix(self, variables: Sequence[Any], matrix: ConstraintsMatrix) -> None:
+        """
+        Add block of constraints, matrix indices point to passed variables.
+        Solvers that can consume sparse rows directly should override it.
+        """
+        for indices, coefficients, sign, rhs, name in matrix:
+            self.add_constraint([variables[i] for i in indices], coefficients, sign, rhs, name)
+
     def solve(self) -> List[Any]:
         raise NotImplementedError
 
+    def solve_pool(self, size: int) -> List[List[Any]]:
+        """
+        Return up to size distinct solutions ordered by objective value, first solution is optimal.
+        Solutions with objective worse than optimal by more than SOLUTION_POOL_GAP (relative) are dropped.
+        Solvers without solution pool return only optimal solution.
+        """
+        return [self.solve()]
+
     def copy(self) -> Self:
         raise NotImplementedError
 
+    def get_model_size(self) -> Tuple[int, int]:
+        """
+        Return number of variables and constraints in current model.
+        """
+        raise NotImplementedError
+
+    def start_iteration(self: Self) -> Self:
+        """
+        Return solver used for a single optimization iteration.
+        By default base model is copied, solvers with persistent model return self and
+        discard all variables and constraints added during iteration in finish_iteration.
+        """
+        return self.copy()
+
+    def finish_iteration(self) -> None:
+        pass
+
     @staticmethod
     def build_player_var_name(player: 'Player', postfix: Optional[str] = None):
         parts = ['Player', player.full_name, *player.positions]
@@ -0,0 +1,215 @@
+from math import ceil, floor
+from copy import copy
+from typing import Optional, List, Union, Iterable, Tuple, Dict
+from pydfs_lineup_optimizer.solvers.base import Solver
+from pydfs_lineup_optimizer.solvers.constants import SolverSign
+from pydfs_lineup_optimizer.solvers.exceptions import SolverException, SolverInfeasibleSolutionException
+try:
+    from ortools.sat.python.cp_model import (
+        CpModel, CpSolver, CpSolverSolutionCallback, LinearExpr, OPTIMAL, FEASIBLE, INT_MIN, INT_MAX, INT32_MAX, IntVar,
+    )
+except ImportError:
+    raise ImportError('You should install ortools library before using this backend')
+
+
+class CPSATVariable:
+    def __init__(
+            self,
+            name: str,
+            index: int,
+            min_value: Optional[int] = None,
+            max_value: Optional[int] = None,
+            multiplier: float = 1,
+    ):
+        self.name = name
+        self.index = index
+        self.min_value = min_value
+        self.max_value = max_value
+        self.multiplier = multiplier
+
+    @property
+    def bounds(self) -> Tuple[int, int]:
+        if any([self.min_value, self.max_value]):
+            return (
+                self.min_value if self.min_value is not None else -INT32_MAX,
+                self.max_value if self.max_value is not None else INT32_MAX,
+            )
+        return 0, 1
+
+    def __mul__(self, other: float) -> 'CPSATVariable':
+        return CPSATVariable(self.name, self.index, self.min_value, self.max_value, self.multiplier * other)
+
+    def __rmul__(self, other: float) -> 'CPSATVariable':
+        return self * other
+
+
+class CPSATConstraint:
+    """
+    Linear constraint with integer coefficients, rows with fractional coefficients are multiplied by scale.
+    """
+    def __init__(
+            self,
+            variables: Iterable[CPSATVariable],
+            coefficients: Optional[Iterable[float]],
+            sign: str,
+            rhs: Union[float, CPSATVariable],
+            scale: int,
+            name: Optional[str] = None,
+    ):
+        row = {}  # type: Dict[int, float]
+        variables = list(variables)
+        if not coefficients:
+            coefficients = [1] * len(variables)
+        for variable, coefficient in zip(variables, coefficients):
+            row[variable.index] = row.get(variable.index, 0) + variable.multiplier * coefficient
+        if isinstance(rhs, CPSATVariable):
+            row[rhs.index] = row.get(rhs.index, 0) - rhs.multiplier
+            rhs = 0
+        if all(float(value).is_integer() for value in row.values()) and float(rhs).is_integer():
+            scale = 1
+        self.row = {index: round(value * scale) for index, value in row.items()}
+        if sign == SolverSign.EQ:
+            self.lower, self.upper = round(rhs * scale), round(rhs * scale)
+        elif sign == SolverSign.GTE:
+            self.lower, self.upper = ceil(rhs * scale), INT_MAX
+        elif sign == SolverSign.LTE:
+            self.lower, self.upper = INT_MIN, floor(rhs * scale)
+        else:
+            raise SolverException('Incorrect constraint sign')
+        self.name = name
+
+
+class CPSATSolutionCollector(CpSolverSolutionCallback):
+    """
+    Collects values of all improving solutions found during search.
+    """
+    def __init__(self, model_vars: List[IntVar]):
+        super().__init__()
+        self.model_vars = model_vars
+        self.solutions = []  # type: List[Tuple[float, List[int]]]
+
+    def on_solution_callback(self) -> None:
+        self.solutions.append((self.objective_value, [self.value(model_var) for model_var in self.model_vars]))
+
+
+class CPSATSolver(Solver):
+    """
+    OR-Tools CP-SAT backend. CP-SAT works only with integer coefficients, so fantasy points and fractional
+    coefficients of constraints are multiplied by 10 ** PRECISION and rounded.
+    NUM_WORKERS sets number of parallel search workers, 0 means all available cores.
+    """
+    NUM_WORKERS = 0
+    PRECISION = 3
+
+    def __init__(self):
+        self._vars = []  # type: List[CPSATVariable]
+        self._constraints = []  # type: List[CPSATConstraint]
+        self._objective = None  # type: Optional[Tuple[List[CPSATVariable], List[float]]]
+        self._iteration_state = None  # type: Optional[Tuple[int, int]]
+
+    def setup_solver(self) -> None:
+        pass
+
+    @property
+    def scale(self) -> int:
+        return int(10 ** self.PRECISION)
+
+    def add_variable(self, name, min_value=None, max_value=None):
+        var = CPSATVariable(name, len(self._vars), min_value, max_value)
+        self._vars.append(var)
+        return var
+
+    def set_objective(self, variables, coefficients):
+        self._objective = (list(variables), list(coefficients))
+
+    def add_constraint(self, variables, coefficients, sign, rhs, name=None):
+        self._constraints.append(CPSATConstraint(variables, coefficients, sign, rhs, self.scale, name))
+
+    def copy(self):
+        new_solver = type(self)()
+        new_solver._vars = copy(self._vars)
+        new_solver._constraints = copy(self._constraints)
+        new_solver._objective = self._objective
+        return new_solver
+
+    def get_model_size(self):
+        return len(self._vars), len(self._constraints)
+
+    def start_iteration(self):
+        self._iteration_state = (len(self._vars), len(self._constraints))
+        return self
+
+    def finish_iteration(self):
+        if self._iteration_state is None:
+            return
+        total_vars, total_constraints = self._iteration_state
+        del self._vars[total_vars:]
+        del self._constraints[total_constraints:]
+        self._objective = None
+        self._iteration_state = None
+
+    def solve(self):
+        return self.solve_pool(1)[0]
+
+    def solve_pool(self, size: int) -> List[List[CPSATVariable]]:
+        """
+        Improving solutions found by search are used as pool.
+        """
+        model, model_vars = self._build_model()
+        if self._objective:
+            variables, coefficients = self._objective
+            model.maximize(LinearExpr.weighted_sum(
+                [model_vars[variable.index] for variable in variables],
+                [round(coefficient * variable.multiplier * self.scale)
+                 for variable, coefficient in zip(variables, coefficients)],
+            ))
+        solver = self._get_solver()
+        collector = CPSATSolutionCollector(model_vars)
+        status = solver.solve(model, collector if size > 1 else None)
+        if status not in (OPTIMAL, FEASIBLE):
+            raise SolverInfeasibleSolutionException(self._get_invalid_constraints())
+        pool = [[solver.value(model_var) for model_var in model_vars]]
+        min_objective = solver.objective_value - self.SOLUTION_POOL_GAP * abs(solver.objective_value)
+        pool.extend(values for objective, values in reversed(collector.solutions) if objective >= min_objective)
+        solutions = []  # type: List[List[CPSATVariable]]
+        for values in pool:
+            result = [variable for variable, value in zip(self._vars, values) if value >= 1]
+            if result not in solutions:
+                solutions.append(result)
+        return solutions[:size]
+
+    def _get_solver(self) -> CpSolver:
+        solver = CpSolver()
+        solver.parameters.num_workers = self.NUM_WORKERS
+        return solver
+
+    def _build_model(self, enforced_constraints: Optional[Dict[int, str]] = None) -> Tuple[CpModel, List[IntVar]]:
+        """
+        Build CP-SAT model, if enforced_constraints is passed named constraints are enforced by assumption
+        literals and indices of these literals are mapped to constraints names.
+        """
+        model = CpModel()
+        model_vars = [model.new_int_var(*variable.bounds, variable.name) for variable in self._vars]
+        for constraint in self._constraints:
+            model_constraint = model.add_linear_constraint(
+                LinearExpr.weighted_sum([model_vars[index] for index in constraint.row], list(constraint.row.values())),
+                constraint.lower,
+                constraint.upper,
+            )
+            if enforced_constraints is not None and constraint.name:
+                literal = model.new_bool_var(constraint.name)
+                model_constraint.only_enforce_if(literal)
+                model.add_assumption(literal)
+                enforced_constraints[literal.index] = constraint.name
+        return model, model_vars
+
+    def _get_invalid_constraints(self) -> List[str]:
+        """
+        Find names of constraints that together make model infeasible using assumptions.
+        """
+        enforced_constraints = {}  # type: Dict[int, str]
+        model, _ = self._build_model(enforced_constraints)
+        solver = self._get_solver()
+        solver.solve(model)
+        return [enforced_constraints[index] for index in solver.sufficient_assumptions_for_infeasibility()
+                if index in enforced_constraints]
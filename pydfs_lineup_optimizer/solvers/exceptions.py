@@ -7,6 +7,7 @@ class SolverException(Exception):
 
 class SolverInfeasibleSolutionException(SolverException):
     def __init__(self, invalid_constraints: List[str]):
+        super().__init__(invalid_constraints)
         self.invalid_constraints = invalid_constraints
 
     def get_user_defined_constraints(self) -> List[str]:
@@ -0,0 +1,243 @@
+from collections import defaultdict
+from copy import copy
+from typing import cast, Optional, List, Union, Iterable, Tuple, Dict, DefaultDict
+from pydfs_lineup_optimizer.solvers.base import Solver
+from pydfs_lineup_optimizer.solvers.constants import SolverSign
+from pydfs_lineup_optimizer.solvers.exceptions import SolverException, SolverInfeasibleSolutionException
+try:
+    from highspy import Highs, HighsVarType, HighsModelStatus, ObjSense, kHighsInf
+except ImportError:
+    raise ImportError('You should install highspy library before using this backend')
+
+
+class HighsVariable:
+    def __init__(
+            self,
+            name: str,
+            index: int,
+            min_value: Optional[int] = None,
+            max_value: Optional[int] = None,
+            multiplier: float = 1,
+    ):
+        self.name = name
+        self.index = index
+        self.min_value = min_value
+        self.max_value = max_value
+        self.multiplier = multiplier
+
+    @property
+    def bounds(self) -> Tuple[float, float]:
+        if any([self.min_value, self.max_value]):
+            return (
+                self.min_value if self.min_value is not None else -kHighsInf,
+                self.max_value if self.max_value is not None else kHighsInf,
+            )
+        return 0, 1
+
+    def __mul__(self, other: float) -> 'HighsVariable':
+        return HighsVariable(self.name, self.index, self.min_value, self.max_value, self.multiplier * other)
+
+    def __rmul__(self, other: float) -> 'HighsVariable':
+        return self * other
+
+
+class HighsConstraint:
+    def __init__(
+            self,
+            variables: Iterable[HighsVariable],
+            coefficients: Optional[Iterable[float]],
+            sign: str,
+            rhs: Union[float, HighsVariable],
+            name: Optional[str] = None
+    ):
+        row = defaultdict(float)  # type: DefaultDict[int, float]
+        if coefficients:
+            for variable, coefficient in zip(variables, coefficients):
+                row[variable.index] += variable.multiplier * coefficient
+        else:
+            for variable in variables:
+                row[variable.index] += variable.multiplier
+        if isinstance(rhs, HighsVariable):
+            row[rhs.index] -= rhs.multiplier
+            rhs = 0
+        if sign == SolverSign.EQ:
+            self.lower, self.upper = rhs, rhs
+        elif sign == SolverSign.GTE:
+            self.lower, self.upper = rhs, kHighsInf
+        elif sign == SolverSign.LTE:
+            self.lower, self.upper = -kHighsInf, rhs
+        else:
+            raise SolverException('Incorrect constraint sign')
+        self.row = row  # type: Dict[int, float]
+        self.name = name
+
+
+class HighsSolver(Solver):
+    """
+    In-process HiGHS backend, avoids running external solver binary and writing model files for each lineup.
+    """
+    def __init__(self):
+        self.model = None  # type: Optional[Highs]
+        self._vars = []  # type: List[HighsVariable]
+        self._constraints = []  # type: List[HighsConstraint]
+        self._objective = None  # type: Optional[Tuple[List[HighsVariable], List[float]]]
+        self._total_model_vars = 0
+        self._total_model_constraints = 0
+        self._iteration_state = None  # type: Optional[Tuple[int, int]]
+
+    def setup_solver(self) -> None:
+        model = Highs()  # type: ignore
+        model.setOptionValue('output_flag', False)
+        model.setOptionValue('mip_rel_gap', 0)
+        model.changeObjectiveSense(ObjSense.kMaximize)
+        self.model = model
+
+    def __getstate__(self):
+        """
+        Model isn't picklable, it's created again from variables and constraints after unpickling.
+        """
+        state = self.__dict__.copy()
+        state.update(model=None, _total_model_vars=0, _total_model_constraints=0, _iteration_state=None)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.setup_solver()
+
+    def add_variable(self, name, min_value=None, max_value=None):
+        var = HighsVariable(name, len(self._vars), min_value, max_value)
+        self._vars.append(var)
+        return var
+
+    def set_objective(self, variables, coefficients):
+        self._objective = (list(variables), list(coefficients))
+
+    def add_constraint(self, variables, coefficients, sign, rhs, name=None):
+        self._constraints.append(HighsConstraint(variables, coefficients, sign, rhs, name))
+
+    def copy(self):
+        new_solver = type(self)()
+        new_solver.setup_solver()
+        new_solver._vars = copy(self._vars)
+        new_solver._constraints = copy(self._constraints)
+        new_solver._objective = self._objective
+        return new_solver
+
+    def get_model_size(self):
+        return len(self._vars), len(self._constraints)
+
+    def start_iteration(self):
+        self._update_model()
+        self._iteration_state = (len(self._vars), len(self._constraints))
+        return self
+
+    def finish_iteration(self):
+        if self._iteration_state is None:
+            return
+        total_vars, total_constraints = self._iteration_state
+        model = cast(Highs, self.model)
+        if self._total_model_constraints > total_constraints:
+            model.deleteRows(self._total_model_constraints - total_constraints,
+                             list(range(total_constraints, self._total_model_constraints)))
+        if self._total_model_vars > total_vars:
+            model.deleteCols(self._total_model_vars - total_vars, list(range(total_vars, self._total_model_vars)))
+        del self._vars[total_vars:]
+        del self._constraints[total_constraints:]
+        self._total_model_vars = min(self._total_model_vars, total_vars)
+        self._total_model_constraints = min(self._total_model_constraints, total_constraints)
+        self._objective = None
+        self._iteration_state = None
+
+    def _update_model(self) -> None:
+        """
+        Pass variables and constraints that aren't added to model yet in one batch.
+        """
+        model = cast(Highs, self.model)
+        new_vars = self._vars[self._total_model_vars:]
+        if new_vars:
+            bounds = [var.bounds for var in new_vars]
+            model.addCols(len(new_vars), [0] * len(new_vars), [lower for lower, _ in bounds],
+                          [upper for _, upper in bounds], 0, [], [], [])
+            model.changeColsIntegrality(len(new_vars), [var.index for var in new_vars],
+                                        [HighsVarType.kInteger] * len(new_vars))  # type: ignore
+            self._total_model_vars += len(new_vars)
+        new_constraints = self._constraints[self._total_model_constraints:]
+        if new_constraints:
+            starts, indices, values = [], [], []  # type: List[int], List[int], List[float]
+            for constraint in new_constraints:
+                starts.append(len(indices))
+                indices.extend(constraint.row.keys())
+                values.extend(constraint.row.values())
+            model.addRows(
+                len(new_constraints),
+                [constraint.lower for constraint in new_constraints],
+                [constraint.upper for constraint in new_constraints],
+                len(indices), starts, indices, values,
+            )
+            self._total_model_constraints += len(new_constraints)
+
+    def solve(self):
+        return self.solve_pool(1)[0]
+
+    def solve_pool(self, size: int) -> List[List[HighsVariable]]:
+        """
+        HiGHS saves every improving solution found during branch and bound, these solutions are used as pool.
+        """
+        model = cast(Highs, self.model)
+        self._update_model()
+        costs = [0.0] * len(self._vars)
+        if self._objective:
+            for variable, coefficient in zip(*self._objective):
+                costs[variable.index] += coefficient
+        model.changeColsCost(len(costs), list(range(len(costs))), costs)
+        model.setOptionValue('mip_improving_solution_save', size > 1)
+        model.run()
+        if model.getModelStatus() != HighsModelStatus.kOptimal:
+            raise SolverInfeasibleSolutionException(self._get_invalid_constraints())
+        pool = [model.getSolution().col_value]
+        if size > 1:
+            objective = model.getInfo().objective_function_value
+            min_objective = objective - self.SOLUTION_POOL_GAP * abs(objective)
+            saved_solutions = sorted(model.getSavedMipSolutions(), key=lambda s: s.objective, reverse=True)
+            pool.extend(solution.col_value for solution in saved_solutions if solution.objective >= min_objective)
+        solutions = []  # type: List[List[HighsVariable]]
+        for values in pool:
+            result = [variable for variable, value in zip(self._vars, values) if round(value) >= 1.0]
+            if result not in solutions:
+                solutions.append(result)
+        return solutions[:size]
+
+    def _get_invalid_constraints(self) -> List[str]:
+        """
+        Solve elastic model where named constraints can be violated with penalty for violation,
+        names of constraints violated in its solution are returned.
+        """
+        model = Highs()  # type: ignore
+        model.setOptionValue('output_flag', False)
+        bounds = [var.bounds for var in self._vars]
+        model.addCols(len(self._vars), [0] * len(self._vars), [lower for lower, _ in bounds],
+                      [upper for _, upper in bounds], 0, [], [], [])
+        model.changeColsIntegrality(len(self._vars), list(range(len(self._vars))),
+                                    [HighsVarType.kInteger] * len(self._vars))  # type: ignore
+        elastic_constraints = []  # type: List[Tuple[str, List[int]]]
+        total_cols = len(self._vars)
+        for constraint in self._constraints:
+            indices, values = list(constraint.row.keys()), list(constraint.row.values())
+            if constraint.name:
+                # violation is measured in units of the largest coefficient of constraint
+                penalty = 1 / max([abs(value) for value in values] + [1])
+                slacks = []
+                for coefficient, bound in ((1, constraint.lower), (-1, constraint.upper)):
+                    if abs(bound) != kHighsInf:
+                        model.addCol(penalty, 0, kHighsInf, 0, [], [])
+                        slacks.append(total_cols)
+                        indices.append(total_cols)
+                        values.append(coefficient)
+                        total_cols += 1
+                elastic_constraints.append((constraint.name, slacks))
+            model.addRow(constraint.lower, constraint.upper, len(indices), indices, values)
+        model.run()
+        if model.getModelStatus() != HighsModelStatus.kOptimal:
+            return []
+        values = model.getSolution().col_value
+        return [name for name, slacks in elastic_constraints if any(values[slack] > 1e-6 for slack in slacks)]
@@ -0,0 +1,50 @@
+from typing import Optional, List, Union, Sequence, Iterator, Tuple
+import numpy as np
+
+
+class ConstraintsMatrix:
+    """
+    Block of linear constraints in CSR format. Row i has coefficients data[indptr[i]:indptr[i + 1]]
+    for variables with indices indices[indptr[i]:indptr[i + 1]] in variables list passed to solver with matrix.
+    """
+    def __init__(
+            self,
+            indptr: np.ndarray,
+            indices: np.ndarray,
+            data: np.ndarray,
+            signs: Union[str, Sequence[str]],
+            rhs: Union[float, Sequence[float], np.ndarray],
+            names: Optional[Sequence[Optional[str]]] = None,
+    ):
+        total_rows = len(indptr) - 1
+        self.indptr = indptr
+        self.indices = indices
+        self.data = data
+        self.signs = [signs] * total_rows if isinstance(signs, str) else list(signs)  # type: List[str]
+        self.rhs = np.broadcast_to(np.asarray(rhs, dtype=float), (total_rows, ))
+        self.names = list(names) if names is not None else [None] * total_rows  # type: List[Optional[str]]
+
+    @classmethod
+    def from_dense(
+            cls,
+            matrix: np.ndarray,
+            signs: Union[str, Sequence[str]],
+            rhs: Union[float, Sequence[float], np.ndarray],
+            names: Optional[Sequence[Optional[str]]] = None,
+    ) -> 'ConstraintsMatrix':
+        matrix = np.atleast_2d(matrix)
+        rows, columns = np.nonzero(matrix)
+        indptr = np.zeros(matrix.shape[0] + 1, dtype=np.int64)
+        np.cumsum(np.bincount(rows, minlength=matrix.shape[0]), out=indptr[1:])
+        return cls(indptr, columns, matrix[rows, columns].astype(float), signs, rhs, names)
+
+    def __len__(self) -> int:
+        return len(self.indptr) - 1
+
+    def __iter__(self) -> Iterator[Tuple[List[int], List[float], str, float, Optional[str]]]:
+        indptr = self.indptr.tolist()
+        indices = self.indices.tolist()
+        data = self.data.tolist()
+        for i, (sign, rhs, name) in enumerate(zip(self.signs, self.rhs.tolist(), self.names)):
+            start, end = indptr[i], indptr[i + 1]
+            yield indices[start:end], data[start:end], sign, rhs, name
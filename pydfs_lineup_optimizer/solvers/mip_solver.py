@@ -1,10 +1,10 @@
 from copy import copy
-from typing import cast, Optional, List, Union, Iterable
+from typing import cast, Optional, List, Union, Iterable, Tuple
 from pydfs_lineup_optimizer.solvers.base import Solver
 from pydfs_lineup_optimizer.solvers.constants import SolverSign
 from pydfs_lineup_optimizer.solvers.exceptions import SolverException, SolverInfeasibleSolutionException
 try:
-    from mip import Model, maximize, xsum, Var
+    from mip import Model, maximize, xsum, Var, Constr
     from mip.constants import MAXIMIZE, BINARY, INTEGER, OptimizationStatus
 except ImportError:
     raise ImportError('You should install mip library before using this backend')
@@ -24,12 +24,13 @@ class MIPVariable:
         self.multiplier = multiplier
         self.__cache = None
 
-    def setup(self, solver: Model):
+    def setup(self, solver: Model) -> Var:
         if any([self.min_value, self.max_value]):
             var = solver.add_var(name=self.name, lb=self.min_value, ub=self.max_value, var_type=INTEGER)
         else:
             var = solver.add_var(name=self.name, var_type=BINARY)
         self.__cache = var
+        return var
 
     def get_var(self, solver: Model) -> Var:
         if self.__cache:
@@ -41,6 +42,11 @@ class MIPVariable:
             return self.multiplier * var
         return var
 
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_MIPVariable__cache'] = None
+        return state
+
     def __mul__(self, other: int) -> 'MIPVariable':
         return MIPVariable(self.name, self.min_value, self.max_value, other)
 
@@ -57,7 +63,7 @@ class MIPConstraint:
             rhs: Union[float, MIPVariable],
             name: Optional[str] = None
     ):
-        self.variables = variables
+        self.variables = list(variables)
         self.coefficients = coefficients
         self.sign = sign
         self.rhs = rhs
@@ -66,7 +72,7 @@ class MIPConstraint:
     def __str__(self):
         return f'{[var.name for var in self.variables]} {self.sign} {self.rhs}'
 
-    def setup(self, solver):
+    def setup(self, solver: Model) -> Constr:
         variables = self.variables
         coefficients = self.coefficients
         sign = self.sign
@@ -79,15 +85,14 @@ class MIPConstraint:
         if isinstance(rhs, MIPVariable):
             rhs = rhs.get_var(solver)
         if sign == SolverSign.EQ:
-            solver += (lhs == rhs, name) if name else lhs == rhs
+            return solver.add_constr(lhs == rhs, name=name or '')
         elif sign == SolverSign.NOT_EQ:
-            solver += (lhs != rhs, name) if name else lhs != rhs
+            return solver.add_constr(lhs != rhs, name=name or '')
         elif sign == SolverSign.GTE:
-            solver += (lhs >= rhs, name) if name else lhs >= rhs
+            return solver.add_constr(lhs >= rhs, name=name or '')
         elif sign == SolverSign.LTE:
-            solver += (lhs <= rhs, name) if name else lhs <= rhs
-        else:
-            raise SolverException('Incorrect constraint sign')
+            return solver.add_constr(lhs <= rhs, name=name or '')
+        raise SolverException('Incorrect constraint sign')
 
 
 class MIPObjective:
@@ -106,11 +111,26 @@ class MIPSolver(Solver):
         self._vars = {}
         self._constraints = []
         self._objective = None
+        self._model_vars = []  # type: List[Var]
+        self._model_constraints = []  # type: List[Constr]
+        self._iteration_state = None  # type: Optional[Tuple[int, int]]
 
     def setup_solver(self) -> None:
         self.model = Model(name='pydfs_lineup_optimizer', sense=MAXIMIZE)
         self.model.solver.set_verbose(0)
 
+    def __getstate__(self):
+        """
+        Model isn't picklable, it's created again from variables and constraints after unpickling.
+        """
+        state = self.__dict__.copy()
+        state.update(model=None, _model_vars=[], _model_constraints=[], _iteration_state=None)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.setup_solver()
+
     def add_variable(self, name, min_value=None, max_value=None):
         var = MIPVariable(name, min_value, max_value)
         if name in self._vars:
@@ -138,19 +158,62 @@ class MIPSolver(Solver):
         new_solver._objective = self._objective
         return new_solver
 
+    def get_model_size(self):
+        return len(self._vars), len(self._constraints)
+
+    def start_iteration(self):
+        self._update_model()
+        self._iteration_state = (len(self._vars), len(self._constraints))
+        return self
+
+    def finish_iteration(self):
+        if self._iteration_state is None:
+            return
+        total_vars, total_constraints = self._iteration_state
+        model = cast(Model, self.model)
+        iteration_objects = [*self._model_constraints[total_constraints:], *self._model_vars[total_vars:]]
+        if iteration_objects:
+            model.remove(iteration_objects)
+        for name in list(self._vars)[total_vars:]:
+            del self._vars[name]
+        del self._constraints[total_constraints:]
+        del self._model_constraints[total_constraints:]
+        del self._model_vars[total_vars:]
+        self._iteration_state = None
+
+    def _update_model(self) -> None:
+        """
+        Add variables and constraints that aren't added to model yet.
+        """
+        model = cast(Model, self.model)
+        for var in list(self._vars.values())[len(self._model_vars):]:
+            self._model_vars.append(var.setup(model))
+        for constraint in self._constraints[len(self._model_constraints):]:
+            self._model_constraints.append(constraint.setup(model))
+
     def solve(self):
+        return self.solve_pool(1)[0]
+
+    def solve_pool(self, size: int) -> List[List[MIPVariable]]:
         model = cast(Model, self.model)
-        for var in self._vars.values():
-            var.setup(model)
-        for constraint in self._constraints:
-            constraint.setup(model)
+        self._update_model()
         cast(MIPObjective, self._objective).setup(model)
+        model.sol_pool_size = size
         status = model.optimize()
         if status not in (OptimizationStatus.OPTIMAL, OptimizationStatus.FEASIBLE):
             raise SolverInfeasibleSolutionException([])
-        result = []
-        for variable in model.vars:  # type: ignore
-            val = variable.x
-            if val is not None and round(val) >= 1.0:
-                result.append(self._vars[variable.name])
-        return result
+        model_vars = model.vars
+        objective_values = model.objective_values
+        min_objective = objective_values[0] - self.SOLUTION_POOL_GAP * abs(objective_values[0])
+        solutions = []
+        for i in range(min(size, model.num_solutions)):
+            if objective_values[i] < min_objective:
+                break
+            result = []
+            for variable in model_vars:  # type: ignore
+                val = variable.xi(i) if i else variable.x
+                if val is not None and round(val) >= 1.0:
+                    result.append(self._vars[variable.name])
+            if result not in solutions:
+                solutions.append(result)
+        return solutions
@@ -1,4 +1,6 @@
-from pulp import LpProblem, LpMaximize, LpVariable, lpSum, LpStatusOptimal, LpBinary, LpInteger, PULP_CBC_CMD
+from typing import Optional, Any
+from pulp import LpProblem, LpMaximize, LpVariable, LpAffineExpression, lpSum, LpStatusOptimal, LpBinary, \
+    LpInteger, PULP_CBC_CMD
 from pydfs_lineup_optimizer.solvers.base import Solver
 from pydfs_lineup_optimizer.solvers.constants import SolverSign
 from pydfs_lineup_optimizer.solvers.exceptions import SolverException, SolverInfeasibleSolutionException
@@ -9,6 +11,7 @@ class PuLPSolver(Solver):
 
     def __init__(self):
         self.prob = LpProblem('pydfs_lineup_optimizer', LpMaximize)
+        self._base_prob = None  # type: Optional[LpProblem]
 
     def setup_solver(self):
         pass
@@ -20,21 +23,30 @@ class PuLPSolver(Solver):
         return LpVariable(name, cat=LpBinary)
 
     def set_objective(self, variables, coefficients):
-        self.prob += lpSum([variable * coefficient for variable, coefficient in zip(variables, coefficients)])
+        self.prob.setObjective(lpSum([variable * coefficient for variable, coefficient in zip(variables, coefficients)]))
 
     def add_constraint(self, variables, coefficients, sign, rhs, name=None):
         if coefficients:
             lhs = [variable * coefficient for variable, coefficient in zip(variables, coefficients)]
         else:
             lhs = variables
+        self._add_expression_constraint(lpSum(lhs), sign, rhs, name)
+
+    def add_constraints_matrix(self, variables, matrix):
+        for indices, coefficients, sign, rhs, name in matrix:
+            expression = LpAffineExpression(zip([variables[i] for i in indices], coefficients))
+            self._add_expression_constraint(expression, sign, rhs, name)
+
+    def _add_expression_constraint(self, lhs: LpAffineExpression, sign: str, rhs: Any, name: Optional[str]) -> None:
+        name = name or self.prob.unusedConstraintName()
         if sign == SolverSign.EQ:
-            self.prob += lpSum(lhs) == rhs, name
+            self.prob += lhs == rhs, name
         elif sign == SolverSign.NOT_EQ:
-            self.prob += lpSum(lhs) != rhs, name
+            self.prob += lhs != rhs, name
         elif sign == SolverSign.GTE:
-            self.prob += lpSum(lhs) >= rhs, name
+            self.prob += lhs >= rhs, name
         elif sign == SolverSign.LTE:
-            self.prob += lpSum(lhs) <= rhs, name
+            self.prob += lhs <= rhs, name
         else:
             raise SolverException('Incorrect constraint sign')
 
@@ -43,6 +55,24 @@ class PuLPSolver(Solver):
         new_solver.prob = self.prob.copy()
         return new_solver
 
+    def get_model_size(self):
+        return len(self.prob.variables()), len(self.prob.constraints)
+
+    def start_iteration(self):
+        # PuLP can't remove constraints from model and CBC is run on model written to file for each solve
+        # without warm start, so iteration is built on shallow copy of base model, its constraints
+        # and variables are discarded with the copy and base model is kept untouched.
+        # Cost of copy grows with number of constraints in base model.
+        self._base_prob = self.prob
+        self.prob = self.prob.copy()
+        return self
+
+    def finish_iteration(self):
+        if self._base_prob is None:
+            return
+        self.prob = self._base_prob
+        self._base_prob = None
+
     def solve(self):
         self.prob.solve(self.LP_SOLVER)
         if self.prob.status == LpStatusOptimal:
@@ -0,0 +1,142 @@
+import pickle
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+from pydfs_lineup_optimizer.solvers.base import Solver
+from pydfs_lineup_optimizer.solvers.matrix import ConstraintsMatrix
+
+
+ADD_VARIABLE = 'variable'
+ADD_CONSTRAINT = 'constraint'
+ADD_CONSTRAINTS_MATRIX = 'matrix'
+SET_OBJECTIVE = 'objective'
+
+
+Operation = Tuple[Any, ...]
+
+
+class RecordedVariable:
+    """
+    Variable of recording solver, it's referenced by name in recorded operations.
+    Wrapped solver variable is None if solver doesn't have model.
+    """
+    __slots__ = ('name', 'variable', 'multiplier')
+
+    def __init__(self, name: str, variable: Any = None, multiplier: float = 1):
+        self.name = name
+        self.variable = variable
+        self.multiplier = multiplier
+
+    def __mul__(self, other: float) -> 'RecordedVariable':
+        return RecordedVariable(self.name, self.variable, self.multiplier * other)
+
+    def __rmul__(self, other: float) -> 'RecordedVariable':
+        return self * other
+
+    def get_expression(self) -> Any:
+        return self.variable if self.multiplier == 1 else self.variable * self.multiplier
+
+
+class RecordingSolver(Solver):
+    """
+    Proxy recording changes of wrapped solver model with variables referenced by names, so recorded
+    operations can be applied to copy of the model in another process with apply_operations.
+    Operations of iteration are recorded separately by solver returned from start_iteration.
+    Without wrapped solver operations are only recorded.
+    """
+    def __init__(self, solver: Optional[Solver] = None):
+        self.solver = solver
+        self.operations = []  # type: List[Operation]
+        self.variables = {}  # type: Dict[str, Any]
+
+    def setup_solver(self) -> None:
+        if self.solver is not None:
+            self.solver.setup_solver()
+
+    def add_variable(self, name: str, min_value: Optional[int] = None, max_value: Optional[int] = None) -> Any:
+        variable = self.solver.add_variable(name, min_value, max_value) if self.solver is not None else None
+        name = variable.name if variable is not None else name
+        self.variables[name] = variable
+        self.operations.append((ADD_VARIABLE, name, min_value, max_value))
+        return RecordedVariable(name, variable)
+
+    def set_objective(self, variables: Iterable[Any], coefficients: Iterable[float]):
+        variables, coefficients = list(variables), list(coefficients)
+        if self.solver is not None:
+            self.solver.set_objective([variable.variable for variable in variables], coefficients)
+        self.operations.append((SET_OBJECTIVE, [variable.name for variable in variables], coefficients))
+
+    def add_constraint(self, variables: Iterable[Any], coefficients: Optional[Iterable[float]], sign: str, rhs: Any,
+                       name: Optional[str] = None):
+        variables = list(variables)
+        # multipliers of variables are moved to coefficients
+        if coefficients or any(variable.multiplier != 1 for variable in variables):
+            coefficients = [variable.multiplier * coefficient for variable, coefficient in
+                            zip(variables, coefficients or [1] * len(variables))]
+        else:
+            coefficients = None
+        if self.solver is not None:
+            self.solver.add_constraint(
+                [variable.variable for variable in variables], coefficients, sign,
+                rhs.get_expression() if isinstance(rhs, RecordedVariable) else rhs, name,
+            )
+        recorded_rhs = (rhs.name, rhs.multiplier) if isinstance(rhs, RecordedVariable) else rhs
+        self.operations.append(
+            (ADD_CONSTRAINT, [variable.name for variable in variables], coefficients, sign, recorded_rhs, name))
+
+    def add_constraints_matrix(self, variables: Sequence[Any], matrix: ConstraintsMatrix) -> None:
+        if self.solver is not None:
+            self.solver.add_constraints_matrix([variable.variable for variable in variables], matrix)
+        self.operations.append((ADD_CONSTRAINTS_MATRIX, [variable.name for variable in variables], matrix))
+
+    def solve(self) -> List[Any]:
+        return self._get_solver().solve()
+
+    def solve_pool(self, size: int) -> List[List[Any]]:
+        return self._get_solver().solve_pool(size)
+
+    def get_model_size(self) -> Tuple[int, int]:
+        return self._get_solver().get_model_size()
+
+    def start_iteration(self) -> 'RecordingSolver':
+        iteration_solver = RecordingSolver(self._get_solver().start_iteration())
+        iteration_solver.variables = dict(self.variables)
+        return iteration_solver
+
+    def finish_iteration(self) -> None:
+        self._get_solver().finish_iteration()
+
+    def dump_model(self) -> bytes:
+        """
+        Return pickled wrapped solver with its variables, operations recorded before are included
+        in dumped model, so they are cleared.
+        """
+        self.operations = []
+        return pickle.dumps((self._get_solver(), self.variables))
+
+    def _get_solver(self) -> Solver:
+        if self.solver is None:
+            raise ValueError('Solver without model can only record operations')
+        return self.solver
+
+
+def apply_operations(solver: Solver, variables: Dict[str, Any], operations: Iterable[Operation]) -> None:
+    """
+    Apply recorded operations to solver, variables are mapping of names to variables of solver model,
+    added variables are added to this mapping.
+    """
+    for operation in operations:
+        kind = operation[0]
+        if kind == ADD_VARIABLE:
+            _, name, min_value, max_value = operation
+            variables[name] = solver.add_variable(name, min_value, max_value)
+        elif kind == ADD_CONSTRAINT:
+            _, names, coefficients, sign, rhs, name = operation
+            if isinstance(rhs, tuple):
+                rhs_name, multiplier = rhs
+                rhs = variables[rhs_name] if multiplier == 1 else variables[rhs_name] * multiplier
+            solver.add_constraint([variables[variable_name] for variable_name in names], coefficients, sign, rhs, name)
+        elif kind == ADD_CONSTRAINTS_MATRIX:
+            _, names, matrix = operation
+            solver.add_constraints_matrix([variables[variable_name] for variable_name in names], matrix)
+        elif kind == SET_OBJECTIVE:
+            _, names, coefficients = operation
+            solver.set_objective([variables[variable_name] for variable_name in names], coefficients)
@@ -1,7 +1,8 @@
-from typing import TYPE_CHECKING, DefaultDict, Dict
+from typing import TYPE_CHECKING, DefaultDict, Dict, List
 from collections import Counter, defaultdict, OrderedDict
-from itertools import chain
-from pydfs_lineup_optimizer.player import LineupPlayer
+import numpy as np
+from pydfs_lineup_optimizer.player import Player
+from pydfs_lineup_optimizer.players_table import LineupsBitset, encode_values
 
 
 if TYPE_CHECKING:
@@ -15,20 +16,33 @@ class Statistic:
             self.lineups = self.optimizer.last_context.get_lineups(with_excluded)
         else:
             self.lineups = []
+        self.lineups_bitset = LineupsBitset(self.lineups)
 
     def get_top_teams(self) -> Dict[str, int]:
-        teams_dict = defaultdict(int)  # type: DefaultDict[str, int]
-        for lineup in self.lineups:
-            lineup_teams = {p.team for p in lineup}
-            for team in lineup_teams:
-                teams_dict[team] += 1
-        return OrderedDict(sorted(teams_dict.items(), key=lambda t: -t[1]))
-
-    def get_top_players(self) -> Dict[str, Dict[LineupPlayer, int]]:
-        players = defaultdict(lambda: defaultdict(int))  # type: DefaultDict[str, DefaultDict[LineupPlayer, int]]
-        for player in chain.from_iterable(self.lineups):
-            players[player.full_name][player] += 1
-        return OrderedDict(sorted(players.items(), key=lambda t: -sum(t[1].values())))  # type: ignore
+        teams, team_codes = encode_values(player.team for player in self.lineups_bitset.players)
+        teams_mask = team_codes == np.arange(len(teams))[:, np.newaxis]
+        # boolean product marks lineups with at least one player of team
+        appearances = (self.lineups_bitset.incidence @ teams_mask.T).sum(axis=0)
+        return OrderedDict(sorted(zip(teams, appearances.tolist()), key=lambda t: -t[1]))
+
+    def get_top_players(self) -> Dict[str, Dict[Player, int]]:
+        players = defaultdict(dict)  # type: DefaultDict[str, Dict[Player, int]]
+        appearances = self.lineups_bitset.incidence.sum(axis=0).tolist()
+        for player, total in zip(self.lineups_bitset.players, appearances):
+            players[player.full_name][player] = total
+        return OrderedDict(sorted(players.items(), key=lambda t: -sum(t[1].values())))
+
+    def get_max_shared_players(self) -> List[int]:
+        """
+        Return max number of players shared by each lineup with any other lineup.
+        """
+        bitset = self.lineups_bitset
+        if len(bitset) < 2:
+            return [0] * len(bitset)
+        overlaps = bitset.get_overlaps_matrix(bitset.bits)
+        np.fill_diagonal(overlaps, -1)
+        max_shared_players = overlaps.max(axis=1).tolist()  # type: List[int]
+        return max_shared_players
 
     def print_report(self) -> None:
         top_teams = self.get_top_teams()
@@ -37,6 +51,10 @@ class Statistic:
             for team, appearance in top_teams.items():
                 print('  %s - %d' % (team, appearance))
             print('Used %d/%d\n' % (len(top_teams), len(self.optimizer.player_pool.available_teams)))
+        if len(self.lineups_bitset) > 1:
+            max_shared_players = self.get_max_shared_players()
+            print('Max Shared Players')
+            print('  max %d, average %.1f\n' % (max(max_shared_players), np.mean(max_shared_players)))
         print('Top Players')
         players_per_team = defaultdict(dict)  # type: DefaultDict[str, Dict[str, int]]
         top_players = self.get_top_players()
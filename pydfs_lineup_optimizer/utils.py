@@ -1,8 +1,9 @@
 import warnings
-from typing import Dict, Tuple, List, Iterable, Set, Any, DefaultDict, Optional, TYPE_CHECKING
+from typing import Dict, Tuple, List, Iterable, Set, Any, DefaultDict, Optional, FrozenSet, TYPE_CHECKING
 from collections import Counter, defaultdict
 from difflib import SequenceMatcher
-from itertools import combinations, chain, permutations
+from functools import lru_cache
+from itertools import combinations, chain
 from pydfs_lineup_optimizer.settings import LineupPosition
 from pydfs_lineup_optimizer.exceptions import LineupOptimizerException
 
@@ -18,16 +19,41 @@ def list_intersection(first_list: Iterable[Any], second_list: Iterable[Any]) ->
     return False
 
 
-def ratio(search_string: str, possible_match: str) -> float:
+def ratio(search_string: str, possible_match: str, threshold: float = 0) -> float:
+    """
+    Return max similarity between search string and parts of possible match with the same length.
+    Parts that can't reach threshold are skipped, so result is exact only if it isn't less than threshold.
+    """
     search_string = search_string.lower()
     possible_match = possible_match.lower()
     if len(search_string) >= len(possible_match):
-        parts = [possible_match]
-    else:
-        shorter_length = len(search_string)
-        num_of_parts = len(possible_match) - shorter_length
-        parts = [possible_match[i:i + shorter_length] for i in range(num_of_parts + 1)]
-    return max([SequenceMatcher(None, search_string, part).ratio() for part in parts])
+        return SequenceMatcher(None, search_string, possible_match).ratio()
+    shorter_length = len(search_string)
+    if not shorter_length:
+        return 1.0
+    # Number of common characters is upper bound of matched characters, it's updated for each part
+    required = Counter(search_string)
+    in_part = Counter(possible_match[:shorter_length])  # type: Counter
+    common = sum(min(total, in_part[character]) for character, total in required.items())
+    best_ratio = 0.0
+    matcher = SequenceMatcher(None, search_string)
+    for i in range(len(possible_match) - shorter_length + 1):
+        if i:
+            removed, added = possible_match[i - 1], possible_match[i + shorter_length - 1]
+            in_part[removed] -= 1
+            if in_part[removed] < required[removed]:
+                common -= 1
+            if in_part[added] < required[added]:
+                common += 1
+            in_part[added] += 1
+        upper_bound = common / shorter_length
+        if upper_bound <= best_ratio or upper_bound < threshold:
+            continue
+        matcher.set_seq2(possible_match[i:i + shorter_length])
+        best_ratio = max(best_ratio, matcher.ratio())
+        if best_ratio == 1:
+            break
+    return best_ratio
 
 
 def get_positions_for_optimizer(
@@ -36,13 +62,22 @@ def get_positions_for_optimizer(
 ) -> Dict[Tuple[str, ...], int]:
     """
     Convert positions list into dict for using in optimizer.
+    Result is cached by slots positions and multi-positions combinations, a copy is returned.
     """
+    positions_key = tuple(p.positions for p in positions_list)
+    combinations_key = frozenset(multi_positions_combinations or ())
+    return dict(_get_positions_for_optimizer(positions_key, combinations_key))
+
+
+@lru_cache(maxsize=256)
+def _get_positions_for_optimizer(
+        positions_list: Tuple[Tuple[str, ...], ...],
+        multi_positions_combinations: FrozenSet[Tuple[str, ...]],
+) -> Dict[Tuple[str, ...], int]:
     positions = {}
-    positions_counter = Counter(p.positions for p in positions_list)
+    positions_counter = Counter(positions_list)
     for key, total in positions_counter.items():
-        min_value = total + len(list(filter(
-            lambda p: len(p.positions) < len(key) and list_intersection(key, p.positions), positions_list
-        )))
+        min_value = total + len([p for p in positions_list if len(p) < len(key) and list_intersection(key, p)])
         positions[key] = min_value
     if not multi_positions_combinations:
         return positions
@@ -53,16 +88,11 @@ def get_positions_for_optimizer(
             if position not in min_positions or len(min_positions[position]) > len(positions_tuple):
                 min_positions[position] = positions_tuple
     #  Create list of required combinations for consistency of multi-positions
-    possible_combinations = set()
+    base_combinations = set()
     for multi_positions in multi_positions_combinations:
-        possible_combinations.add(tuple(chain.from_iterable(min_positions.get(pos, (pos, )) for pos in multi_positions)))
-    for i in range(2, len(possible_combinations) + 1):
-        total_combinations = len(possible_combinations)
-        for combo in combinations(possible_combinations, i):
-            flatten_positions = tuple(sorted(set(chain.from_iterable(combo))))
-            possible_combinations.add(flatten_positions)
-        if total_combinations == len(possible_combinations):
-            break
+        base_combinations.add(tuple(chain.from_iterable(min_positions.get(pos, (pos, )) for pos in multi_positions)))
+    possible_combinations = set(base_combinations)  # type: Set[Tuple[str, ...]]
+    possible_combinations.update(_get_combinations_unions(base_combinations))
     # Calculate min required players for each position
     possible_combinations.update(positions.keys())
     for i in range(2, len(positions)):
@@ -75,39 +105,65 @@ def get_positions_for_optimizer(
     return positions
 
 
+def _get_combinations_unions(base_combinations: Set[Tuple[str, ...]]) -> Set[Tuple[str, ...]]:
+    """
+    Return sorted unions of two or more combinations from given set.
+    Closure is built by extending only unions found on previous step, so every union is built once.
+    """
+    base = {frozenset(combo) for combo in base_combinations}
+    closure = set(base)
+    frontier = set(base)
+    while frontier:
+        frontier = {item | other for item in frontier for other in base} - closure
+        closure.update(frontier)
+    unions = set()
+    for union in closure:
+        if sum(1 for combo in base_combinations if union.issuperset(combo)) > 1:
+            unions.add(tuple(sorted(union)))
+    return unions
+
+
 def link_players_with_positions(
         players: Iterable['Player'],
         positions: List[LineupPosition]
 ) -> Dict['Player', LineupPosition]:
     """
     This method tries to set positions for given players, and raise error if can't.
+    Players are processed in priority order and take the first free suitable position,
+    other players are moved along augmenting paths only if there is no free position left.
     """
-    positions = positions.copy()
-    players_with_positions = {}  # type: Dict['Player', LineupPosition]
     players = sorted(players, key=get_player_priority)
-    for position in positions:
-        players_for_position = [p for p in players if list_intersection(position.positions, p.positions)]
-        if len(players_for_position) == 1:
-            players_with_positions[players_for_position[0]] = position
-            positions.remove(position)
-            players.remove(players_for_position[0])
-    for players_permutation in permutations(players):
-        is_correct = True
-        remaining_positions = positions[:]
-        for player in players_permutation:
-            for position in remaining_positions:
-                if list_intersection(player.positions, position.positions):
-                    players_with_positions[player] = position
-                    remaining_positions.remove(position)
-                    break
-            else:
-                is_correct = False
-                break
-        if is_correct:
-            break
-    else:
+    if len(players) > len(positions):
         raise LineupOptimizerException('Unable to build lineup')
-    return players_with_positions
+    suitable_positions = [
+        [i for i, position in enumerate(positions) if list_intersection(player.positions, position.positions)]
+        for player in players
+    ]
+    position_owners = [None] * len(positions)  # type: List[Optional[int]]
+
+    def assign(player_index: int, visited: Set[int]) -> bool:
+        candidates = suitable_positions[player_index]
+        for position_index in candidates:
+            if position_owners[position_index] is None:
+                position_owners[position_index] = player_index
+                return True
+        for position_index in candidates:
+            if position_index in visited:
+                continue
+            visited.add(position_index)
+            owner = position_owners[position_index]
+            if owner is not None and assign(owner, visited):
+                position_owners[position_index] = player_index
+                return True
+        return False
+
+    for player_index in range(len(players)):
+        if not assign(player_index, set()):
+            raise LineupOptimizerException('Unable to build lineup')
+    return {
+        players[player_index]: positions[position_index]
+        for position_index, player_index in enumerate(position_owners) if player_index is not None
+    }
 
 
 def get_remaining_positions(
@@ -18,7 +18,12 @@ setup(
     author_email='dimakudosh@gmail.com',
     description='Tool for creating optimal lineups for daily fantasy sports',
     keywords=['dfs', 'fantasy', 'sport', 'lineup', 'optimize', 'optimizer', 'nba', 'nfl', 'nhl', 'mlb'],
-    install_requires=['PuLP==2.4', 'pytz>=2020.5'],
+    install_requires=['PuLP==2.4', 'pytz>=2020.5', 'numpy'],
+    extras_require={
+        'mip': ['mip==1.13.0'],
+        'highs': ['highspy==1.15.1; python_version >= "3.9"'],
+        'cpsat': ['ortools>=9.8; python_version >= "3.8"'],
+    },
     long_description=read('README.md'),
     long_description_content_type='text/markdown',
     classifiers=[
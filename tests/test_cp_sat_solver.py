@@ -0,0 +1,50 @@
+import unittest
+from pydfs_lineup_optimizer.solvers import SolverSign
+try:
+    from pydfs_lineup_optimizer.solvers.cp_sat_solver import CPSATSolver, CPSATConstraint
+except ImportError:
+    CPSATSolver = None
+
+
+@unittest.skipIf(CPSATSolver is None, 'ortools is not installed')
+class CPSATSolverTestCase(unittest.TestCase):
+    def create_solver(self, **attributes):
+        solver_class = type('TestCPSATSolver', (CPSATSolver, ), attributes)
+        solver = solver_class()
+        solver.setup_solver()
+        return solver
+
+    def solve_pair_or_single(self, solver):
+        # selects either first two variables or the last one
+        variables = [solver.add_variable('var_%d' % i) for i in range(3)]
+        solver.add_constraint([variables[0], variables[2]], None, SolverSign.LTE, 1)
+        solver.add_constraint([variables[1], variables[2]], None, SolverSign.LTE, 1)
+        solver.set_objective(variables, [0.4, 0.4, 0.7])
+        return {variable.name for variable in solver.solve()}
+
+    def test_fractional_objective_is_scaled_with_precision(self):
+        self.assertEqual(self.solve_pair_or_single(self.create_solver()), {'var_0', 'var_1'})
+
+    def test_fractional_objective_is_rounded(self):
+        self.assertEqual(self.solve_pair_or_single(self.create_solver(PRECISION=0)), {'var_2'})
+
+    def test_constraint_scaling(self):
+        solver = self.create_solver()
+        variables = [solver.add_variable('var_%d' % i) for i in range(2)]
+        integer_constraint = CPSATConstraint(variables, [1, 2], SolverSign.LTE, 3, solver.scale)
+        self.assertEqual(integer_constraint.row, {0: 1, 1: 2})
+        self.assertEqual(integer_constraint.upper, 3)
+        fractional_constraint = CPSATConstraint(variables, [0.5, 0.25], SolverSign.GTE, 0.3, solver.scale)
+        self.assertEqual(fractional_constraint.row, {0: 500, 1: 250})
+        self.assertEqual(fractional_constraint.lower, 300)
+
+    def test_fractional_constraint(self):
+        solver = self.create_solver()
+        variables = [solver.add_variable('var_%d' % i) for i in range(3)]
+        solver.add_constraint(variables, [0.35, 0.35, 0.35], SolverSign.LTE, 0.7)
+        solver.set_objective(variables, [1, 1, 1])
+        self.assertEqual(len(solver.solve()), 2)
+
+    def test_num_workers(self):
+        self.assertEqual(self.create_solver()._get_solver().parameters.num_workers, 0)
+        self.assertEqual(self.create_solver(NUM_WORKERS=1)._get_solver().parameters.num_workers, 1)
@@ -1,8 +1,15 @@
 import unittest
-from pydfs_lineup_optimizer.player import Player
+import numpy as np
+from pydfs_lineup_optimizer import get_optimizer
+from pydfs_lineup_optimizer.constants import Site, Sport
+from pydfs_lineup_optimizer.rules import Objective
+from pydfs_lineup_optimizer.player import Player, GameInfo
+from pydfs_lineup_optimizer.players_table import PlayersTable
+from pydfs_lineup_optimizer.exceptions import LineupOptimizerException
 from pydfs_lineup_optimizer.lineup import Lineup, LineupPlayer
 from pydfs_lineup_optimizer.fantasy_points_strategy import StandardFantasyPointsStrategy, \
-    RandomFantasyPointsStrategy, ProgressiveFantasyPointsStrategy
+    RandomFantasyPointsStrategy, ProgressiveFantasyPointsStrategy, CorrelatedFantasyPointsStrategy
+from tests.utils import load_players
 
 
 class FantasyPointsStrategyTestCase(unittest.TestCase):
@@ -16,6 +23,27 @@ class FantasyPointsStrategyTestCase(unittest.TestCase):
         self.assertEqual(strategy.get_player_fantasy_points(player1), 20)
         self.assertEqual(strategy.get_player_fantasy_points(player2), 30)
 
+    def test_standard_strategy_subclass_with_player_fantasy_points(self):
+        class BoostedFantasyPointsStrategy(StandardFantasyPointsStrategy):
+            def __init__(self, boosted_player):
+                self.boosted_player = boosted_player
+
+            def get_player_fantasy_points(self, player):
+                return player.fppg * 100 if player == self.boosted_player else player.fppg
+
+        player1 = Player('1', '1', '1', ['P'], 'test', 5000, 2)
+        player2 = Player('2', '2', '2', ['P'], 'test', 8000, 30)
+        strategy = BoostedFantasyPointsStrategy(player1)
+        self.assertEqual(strategy.get_fantasy_points_vector(PlayersTable([player1, player2])).tolist(), [200, 30])
+        optimizer = get_optimizer(Site.DRAFTKINGS, Sport.BASKETBALL)
+        players = load_players()
+        optimizer.player_pool.load_players(players)
+        self.assertTrue(Objective(optimizer, {}, None).is_deterministic)
+        worst_player = min(players, key=lambda player: player.fppg)
+        optimizer.set_fantasy_points_strategy(BoostedFantasyPointsStrategy(worst_player))
+        self.assertFalse(Objective(optimizer, {}, None).is_deterministic)
+        self.assertIn(worst_player, next(optimizer.optimize(1)).players)
+
     def test_random_strategy(self):
         player1 = Player('1', '1', '1', ['P'], 'test', 5000, 20, min_deviation=0.1, max_deviation=0.2)
         player2 = Player('2', '2', '2', ['P'], 'test', 8000, 40)
@@ -34,6 +62,41 @@ class FantasyPointsStrategyTestCase(unittest.TestCase):
         if player2_fppg < 36 or 38 < player2_fppg < 42 or player2_fppg > 44:
             self.fail('Incorrect generated points')
 
+    def test_random_strategy_vector(self):
+        players = [
+            Player('1', '1', '1', ['P'], 'test', 5000, 20, min_deviation=0.1, max_deviation=0.2),
+            Player('2', '2', '2', ['P'], 'test', 8000, 40),
+            Player('3', '3', '3', ['P'], 'test', 8000, 40, fppg_floor=30, fppg_ceil=35),
+        ]
+        players_table = PlayersTable(players)
+        strategy = RandomFantasyPointsStrategy(0.05, 0.1, seed=42)
+        for _ in range(100):
+            player1_fppg, player2_fppg, player3_fppg = strategy.get_fantasy_points_vector(players_table)
+            if player1_fppg < 16 or 18 < player1_fppg < 22 or player1_fppg > 24:
+                self.fail('Incorrect generated points')
+            if player2_fppg < 36 or 38 < player2_fppg < 42 or player2_fppg > 44:
+                self.fail('Incorrect generated points')
+            if player3_fppg < 30 or player3_fppg > 35:
+                self.fail('Incorrect generated points')
+
+    def test_random_strategy_subclass_with_player_fantasy_points(self):
+        class FixedFantasyPointsStrategy(RandomFantasyPointsStrategy):
+            def get_player_fantasy_points(self, player):
+                return player.fppg + 1
+
+        players_table = PlayersTable([Player(str(i), '1', '1', ['P'], 'test', 5000, 20) for i in range(3)])
+        self.assertEqual(FixedFantasyPointsStrategy().get_fantasy_points_vector(players_table).tolist(), [21] * 3)
+
+    def test_random_strategy_seed(self):
+        players_table = PlayersTable([Player(str(i), '1', '1', ['P'], 'test', 5000, 20) for i in range(10)])
+        first_strategy = RandomFantasyPointsStrategy(seed=1)
+        second_strategy = RandomFantasyPointsStrategy(seed=1)
+        for _ in range(3):
+            first_points = first_strategy.get_fantasy_points_vector(players_table)
+            np.testing.assert_array_equal(first_points, second_strategy.get_fantasy_points_vector(players_table))
+        self.assertFalse(np.array_equal(
+            first_points, RandomFantasyPointsStrategy(seed=2).get_fantasy_points_vector(players_table)))
+
     def test_progressive_strategy(self):
         player1 = Player('1', '1', '1', ['P'], 'test', 5000, 20)
         player2 = Player('2', '2', '2', ['P'], 'test', 8000, 30, progressive_scale=0.2)
@@ -49,3 +112,30 @@ class FantasyPointsStrategyTestCase(unittest.TestCase):
         strategy.set_previous_lineup(Lineup([LineupPlayer(player2, 'P')]))
         self.assertEqual(strategy.get_player_fantasy_points(player1), 22)
         self.assertEqual(strategy.get_player_fantasy_points(player2), 30)
+
+    def test_correlated_strategy(self):
+        game_info = GameInfo('A', 'B', None)
+        players = [
+            Player('1', '1', '1', ['P'], 'A', 5000, 20, game_info=game_info),
+            Player('2', '2', '2', ['P'], 'A', 5000, 10, game_info=game_info),
+            Player('3', '3', '3', ['P'], 'B', 5000, 30, game_info=game_info, fppg_floor=20, fppg_ceil=40),
+            Player('4', '4', '4', ['P'], 'C', 5000, 15),
+        ]
+        players_table = PlayersTable(players)
+        strategy = CorrelatedFantasyPointsStrategy(team_correlation=0.4, game_correlation=0.1, seed=1)
+        scenarios = strategy.sample_scenarios(players_table, 50000)
+        np.testing.assert_allclose(scenarios.mean(axis=0), [20, 10, 30, 15], rtol=0.01)
+        np.testing.assert_allclose(scenarios.std(axis=0), [2.4, 1.2, 5, 1.8], rtol=0.02)
+        correlation = np.corrcoef(scenarios.T)
+        np.testing.assert_allclose([correlation[0, 1], correlation[0, 2], correlation[0, 3]], [0.4, 0.1, 0], atol=0.02)
+
+    def test_correlated_strategy_scenarios(self):
+        players_table = PlayersTable([Player(str(i), '1', '1', ['P'], str(i % 3), 5000, 20) for i in range(10)])
+        strategy = CorrelatedFantasyPointsStrategy(scenarios=3, seed=5)
+        same_seed_strategy = CorrelatedFantasyPointsStrategy(scenarios=3, seed=5)
+        vectors = [strategy.get_fantasy_points_vector(players_table) for _ in range(4)]
+        for vector in vectors:
+            np.testing.assert_array_equal(vector, same_seed_strategy.get_fantasy_points_vector(players_table))
+        self.assertEqual(len({tuple(vector) for vector in vectors}), 4)
+        with self.assertRaises(LineupOptimizerException):
+            CorrelatedFantasyPointsStrategy(team_correlation=0.1, game_correlation=0.2)
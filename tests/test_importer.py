@@ -0,0 +1,91 @@
+import os
+import unittest
+from tempfile import TemporaryDirectory
+from types import GeneratorType
+from pydfs_lineup_optimizer.exceptions import LineupOptimizerIncorrectCSV
+from pydfs_lineup_optimizer.sites.draftkings.classic.importer import DraftKingsCSVImporter
+from pydfs_lineup_optimizer.sites.fanduel.classic.importer import FanDuelCSVImporter
+
+
+DRAFTKINGS_ENTRIES_CSV = '''Entry ID,Contest Name,Contest ID,Entry Fee,QB,Instructions
+1,Contest,2,$1,,
+,,,,,,Position,Name + ID,Name,ID,Roster Position,Salary,Game Info,TeamAbbrev,AvgPointsPerGame,Max Exposure,Roster Order
+,,,,,,QB,Tom Brady (1),Tom Brady,1,QB,7000,TB@DAL 09/09/2021 08:20PM ET,TB,25.5,50%,1
+
+,,,,,,RB,Ezekiel Elliott (3),Ezekiel Elliott,3,RB/FLEX,7500,TB@DAL 09/09/2021 08:20PM ET,DAL,16,,
+,,,,,,DST,Falcons (4),Falcons,4,DST,2500,In Progress,ATL,0,0.3,
+'''
+
+FANDUEL_CSV = '''Id,Position,First Name,Last Name,FPPG,Salary,Game,Team,Injury Indicator
+1-1,PG,First,Player,20.5,5000,A@B,A,
+1-2,SG/SF,Second,Player,,4000,A@B,B,O
+1-3,C,Third,Player,10,3000,,C,
+'''
+
+
+class StreamingCSVImporterTestCase(unittest.TestCase):
+    def setUp(self):
+        self.directory = TemporaryDirectory()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def write_csv(self, content: str) -> str:
+        filename = os.path.join(self.directory.name, 'players.csv')
+        with open(filename, 'w') as csv_file:
+            csv_file.write(content)
+        return filename
+
+    def test_draftkings_importer(self):
+        importer = DraftKingsCSVImporter(self.write_csv(DRAFTKINGS_ENTRIES_CSV))
+        self.assertIsInstance(importer.iter_players(), GeneratorType)
+        players = importer.import_players()
+        self.assertEqual([player.id for player in players], ['1', '3', '4'])
+        brady, elliott, falcons = players
+        self.assertEqual((brady.first_name, brady.last_name, brady.team), ('Tom', 'Brady', 'TB'))
+        self.assertEqual(elliott.positions, ('RB', ))
+        self.assertEqual((brady.salary, brady.fppg), (7000, 25.5))
+        self.assertEqual((brady.max_exposure, brady.roster_order), (0.5, 1))
+        self.assertEqual((elliott.max_exposure, elliott.roster_order), (None, None))
+        self.assertEqual(falcons.max_exposure, 0.3)
+        self.assertIs(brady.game_info, elliott.game_info)
+        self.assertEqual((brady.game_info.home_team, brady.game_info.away_team), ('DAL', 'TB'))
+        self.assertTrue(falcons.game_info.game_started)
+        self.assertIsNone(brady.projected_ownership)
+
+    def test_fanduel_importer(self):
+        players = FanDuelCSVImporter(self.write_csv(FANDUEL_CSV)).import_players()
+        first, second, third = players
+        self.assertEqual(set(second.positions), {'SG', 'SF'})
+        self.assertEqual(second.fppg, 0)
+        self.assertEqual([player.is_injured for player in players], [False, True, False])
+        self.assertIs(first.game_info, second.game_info)
+        self.assertIsNone(third.game_info)
+
+    def test_missing_header(self):
+        with self.assertRaises(LineupOptimizerIncorrectCSV):
+            DraftKingsCSVImporter(self.write_csv(FANDUEL_CSV)).import_players()
+
+    def test_missing_required_column(self):
+        content = DRAFTKINGS_ENTRIES_CSV.replace('AvgPointsPerGame', 'Points')
+        with self.assertRaises(LineupOptimizerIncorrectCSV):
+            DraftKingsCSVImporter(self.write_csv(content)).import_players()
+
+    def test_short_row(self):
+        content = DRAFTKINGS_ENTRIES_CSV + ',,,,,,QB,Player (5),Player,5\n'
+        with self.assertRaises(LineupOptimizerIncorrectCSV):
+            DraftKingsCSVImporter(self.write_csv(content)).import_players()
+
+    def test_row_without_optional_cells(self):
+        content = DRAFTKINGS_ENTRIES_CSV + ',,,,,,QB,Player (5),Player,5,QB,5000,TB@DAL 09/09/2021 08:20PM ET,TB,10\n'
+        players = DraftKingsCSVImporter(self.write_csv(content)).import_players()
+        player = players[-1]
+        self.assertEqual((player.id, player.fppg), ('5', 10))
+        self.assertEqual((player.max_exposure, player.roster_order), (None, None))
+        self.assertIs(player.game_info, players[0].game_info)
+
+    def test_row_without_optional_game_cell(self):
+        content = 'Position,Name,ID,Salary,TeamAbbrev,AvgPointsPerGame,Game Info\nQB,Tom Brady,1,7000,TB,25.5\n'
+        player = DraftKingsCSVImporter(self.write_csv(content)).import_players()[0]
+        self.assertEqual((player.team, player.fppg), ('TB', 25.5))
+        self.assertIsNone(player.game_info)
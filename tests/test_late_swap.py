@@ -3,10 +3,11 @@ import unittest
 from datetime import datetime, timedelta
 from pytz import timezone
 from unittest.mock import patch, PropertyMock
-from pydfs_lineup_optimizer import get_optimizer
+from pydfs_lineup_optimizer import get_optimizer, RandomFantasyPointsStrategy, PlayersGroup, Stack
 from pydfs_lineup_optimizer.constants import Site, Sport
 from pydfs_lineup_optimizer.lineup import Lineup
 from pydfs_lineup_optimizer.player import LineupPlayer, GameInfo
+from pydfs_lineup_optimizer.profiler import OptimizationProfiler
 from .utils import create_players
 
 
@@ -58,3 +59,104 @@ class LateSwapTestCase(unittest.TestCase):
             lineup = next(self.lineup_optimizer.optimize_lineups([self.lineup]))
             for player, new_lineup_player in zip(self.lineup, lineup):
                 self.assertEqual(player, new_lineup_player)
+
+    def _load_extra_players(self):
+        extra_players = create_players(
+            ['PG', 'SG', 'SF', 'PF', 'C', 'PG/SG', 'SF/PF', 'C'], game_info=self.future_game_info, salary=5000, fppg=15)
+        for player in extra_players:
+            player.first_name = 'Extra'
+        self.lineup_optimizer.player_pool.extend_players(extra_players)
+
+    def _assert_players_kept(self, original_lineup, lineup):
+        players_in_action = {
+            player: player.lineup_position for player in original_lineup if player.is_game_started}
+        self.assertEqual(len(lineup.players), len(original_lineup.players))
+        for player in lineup:
+            if player.is_game_started:
+                self.assertEqual(players_in_action.get(player), player.lineup_position)
+        self.assertEqual(len([player for player in lineup if player.is_game_started]), len(players_in_action))
+
+    def test_late_swap_optimize_with_workers(self):
+        other_lineup = Lineup([
+            LineupPlayer(self.inactive_players[0], 'PG'),
+            LineupPlayer(self.active_players[1], 'SG'),
+            LineupPlayer(self.inactive_players[2], 'SF'),
+            LineupPlayer(self.active_players[3], 'PF'),
+            LineupPlayer(self.inactive_players[4], 'C'),
+            LineupPlayer(self.active_players[5], 'G'),
+            LineupPlayer(self.inactive_players[6], 'F'),
+            LineupPlayer(self.active_players[7], 'UTIL'),
+        ])
+        self._load_extra_players()
+        lineups = [self.lineup, other_lineup, self.lineup, self.lineup]
+        sequential_lineups = list(self.lineup_optimizer.optimize_lineups(lineups))
+        parallel_lineups = list(self.lineup_optimizer.optimize_lineups(lineups, workers=2))
+        self.assertEqual(len(parallel_lineups), len(lineups))
+        for original_lineup, lineup in zip(lineups, parallel_lineups):
+            self._assert_players_kept(original_lineup, lineup)
+        self.assertEqual(
+            [lineup.fantasy_points_projection for lineup in sequential_lineups],
+            [lineup.fantasy_points_projection for lineup in parallel_lineups],
+        )
+
+    def test_late_swap_optimize_with_workers_and_started_lineup(self):
+        self._load_extra_players()
+        started_lineup = Lineup([
+            LineupPlayer(self.inactive_players[0], 'PG'),
+            LineupPlayer(self.inactive_players[1], 'SG'),
+            LineupPlayer(self.inactive_players[2], 'SF'),
+            LineupPlayer(self.inactive_players[3], 'PF'),
+            LineupPlayer(self.inactive_players[4], 'C'),
+            LineupPlayer(self.inactive_players[5], 'G'),
+            LineupPlayer(self.inactive_players[6], 'F'),
+            LineupPlayer(self.inactive_players[7], 'UTIL'),
+        ])
+        lineups = [started_lineup, self.lineup, started_lineup, self.lineup]
+        generated_lineups = list(self.lineup_optimizer.optimize_lineups(lineups, workers=2))
+        self.assertIs(generated_lineups[0], started_lineup)
+        self.assertIs(generated_lineups[2], started_lineup)
+        for lineup in generated_lineups[1::2]:
+            self._assert_players_kept(self.lineup, lineup)
+        self.assertNotEqual(set(generated_lineups[1]), set(generated_lineups[3]))
+
+    def _get_late_swap_rounds(self, lineups, **kwargs):
+        profiler = OptimizationProfiler()
+        self.lineup_optimizer.set_profiler(profiler)
+        generated_lineups = list(self.lineup_optimizer.optimize_lineups(lineups, workers=2, **kwargs))
+        self.lineup_optimizer.set_profiler(None)
+        self.assertEqual(len(generated_lineups), len(lineups))
+        for lineup in generated_lineups:
+            self._assert_players_kept(self.lineup, lineup)
+        return [event.details for event in profiler.events if event.name == 'late_swap_round']
+
+    def test_late_swap_lineups_with_same_players_share_model(self):
+        self._load_extra_players()
+        rounds = self._get_late_swap_rounds([self.lineup] * 4)
+        self.assertEqual(rounds, [{'models': 1, 'lineups': 4}])
+
+    def test_late_swap_with_random_strategy_doesnt_share_model(self):
+        self._load_extra_players()
+        self.lineup_optimizer.set_fantasy_points_strategy(RandomFantasyPointsStrategy(0.1, 0.2, seed=1))
+        rounds = self._get_late_swap_rounds([self.lineup] * 4)
+        self.assertEqual(rounds, [{'models': 2, 'lineups': 2}, {'models': 2, 'lineups': 2}])
+
+    def test_late_swap_executor_isnt_created_without_rounds(self):
+        with patch('pydfs_lineup_optimizer.player.Player.is_game_started', new_callable=PropertyMock) as \
+                mock_is_game_started, \
+                patch('pydfs_lineup_optimizer.lineup_optimizer.ProcessPoolExecutor') as mock_executor:
+            mock_is_game_started.return_value = True
+            generated_lineups = list(self.lineup_optimizer.optimize_lineups([self.lineup] * 2, workers=2))
+        self.assertEqual(generated_lineups, [self.lineup] * 2)
+        mock_executor.assert_not_called()
+
+    def test_late_swap_with_workers_and_iteration_stacks(self):
+        self._load_extra_players()
+        extra_players = [player for player in self.lineup_optimizer.player_pool.all_players
+                         if player.first_name == 'Extra']
+        group = PlayersGroup([extra_players[4], extra_players[6]], min_from_group=2, max_exposure=1)
+        self.lineup_optimizer.add_stack(Stack([group]))
+        rounds = self._get_late_swap_rounds([self.lineup] * 2)
+        self.assertEqual(rounds, [{'models': 1, 'lineups': 2}])
+        for lineup in self.lineup_optimizer.last_context.lineups:
+            self.assertIn(extra_players[4], lineup)
+            self.assertIn(extra_players[6], lineup)
@@ -1,9 +1,13 @@
 from __future__ import absolute_import, division
 import unittest
+from unittest.mock import patch
 from pydfs_lineup_optimizer import get_optimizer, Player
 from pydfs_lineup_optimizer.constants import Site, Sport
 from pydfs_lineup_optimizer.exceptions import LineupOptimizerException, GenerateLineupException
 from pydfs_lineup_optimizer.sites.yahoo.settings import YahooFootballSettings
+from pydfs_lineup_optimizer.fantasy_points_strategy import RandomFantasyPointsStrategy
+from pydfs_lineup_optimizer.statistics import Statistic
+from pydfs_lineup_optimizer.profiler import OptimizationProfiler, ProfilePhase
 from .utils import create_players, load_players
 
 
@@ -48,6 +52,16 @@ class OptimizerMethodsTestCase(unittest.TestCase):
         optimizer.player_pool.load_players(create_players(positions))
         next(optimizer.optimize(1))
 
+    def test_iteration_is_finished_when_lineup_cant_be_generated(self):
+        optimizer = get_optimizer(Site.DRAFTKINGS, Sport.BASEBALL)
+        optimizer.player_pool.load_players(create_players(['OF', 'OF', '2B', '3B', 'SP', 'SP', 'C', 'RP']))
+        solver_class = optimizer._solver_class
+        with patch.object(solver_class, 'finish_iteration', autospec=True,
+                          side_effect=solver_class.finish_iteration) as finish_iteration:
+            with self.assertRaises(GenerateLineupException):
+                next(optimizer.optimize(1))
+        self.assertEqual(finish_iteration.call_count, 1)
+
     def test_adding_player_with_salary_bigger_than_budget(self):
         player = Player('1', '1', '1', ['PG'], 'DEN', 100000, 2)
         with self.assertRaises(LineupOptimizerException):
@@ -107,3 +121,98 @@ class OptimizerMethodsTestCase(unittest.TestCase):
         exclude_lineups = list(self.lineup_optimizer.optimize(1))
         lineups = list(self.lineup_optimizer.optimize(1, exclude_lineups=exclude_lineups))
         self.assertTrue(exclude_lineups[0] != lineups[0])
+
+    def test_exclude_lineups_with_removed_players(self):
+        exclude_lineups = list(self.lineup_optimizer.optimize(1))
+        self.player_pool.remove_player(exclude_lineups[0].players[0].id)
+        lineups = list(self.lineup_optimizer.optimize(2, exclude_lineups=exclude_lineups * 2))
+        self.assertNotIn(exclude_lineups[0], lineups)
+        self.assertEqual(len(set(lineups)), 2)
+
+    def test_statistic_max_shared_players(self):
+        lineups = list(self.lineup_optimizer.optimize(3))
+        statistic = Statistic(self.lineup_optimizer)
+        expected = [max(len(set(lineup).intersection(other)) for other in lineups if other is not lineup)
+                    for lineup in lineups]
+        self.assertEqual(statistic.get_max_shared_players(), expected)
+        self.assertEqual(sum(statistic.get_top_teams().values()), sum(len({p.team for p in l}) for l in lineups))
+
+    def test_profiler(self):
+        events = []
+        profiler = OptimizationProfiler(callback=events.append)
+        self.lineup_optimizer.set_profiler(profiler)
+        list(self.lineup_optimizer.optimize(3))
+        self.assertEqual(events, profiler.events)
+        phases = {event.phase for event in events}
+        self.assertTrue({ProfilePhase.MODEL, ProfilePhase.RULE_INIT, ProfilePhase.APPLY, ProfilePhase.SOLVE,
+                         ProfilePhase.BUILD_LINEUP, ProfilePhase.POST_OPTIMIZE}.issubset(phases))
+        solves = [event for event in events if event.phase == ProfilePhase.SOLVE]
+        self.assertEqual([event.iteration for event in solves], [0, 1, 2])
+        self.assertTrue(all(event.details['variables'] > 0 and event.details['constraints'] > 0 for event in solves))
+        report = profiler.get_report()
+        stat = next(stat for stat in report.stats if stat.name == 'UniqueLineupRule' and stat.phase == 'apply')
+        self.assertEqual(stat.count, 1)
+        self.assertAlmostEqual(sum(report.get_phases().values()), report.total_time)
+        self.lineup_optimizer.set_profiler(None)
+        list(self.lineup_optimizer.optimize(1))
+        self.assertEqual(len(profiler.events), len(events))
+
+    def test_profiler_start_iteration(self):
+        profiler = OptimizationProfiler()
+        self.lineup_optimizer.set_profiler(profiler)
+        list(self.lineup_optimizer.optimize(3))
+        self.lineup_optimizer.set_profiler(None)
+        starts = [event for event in profiler.events if event.phase == ProfilePhase.START_ITERATION]
+        self.assertEqual([event.iteration for event in starts], [0, 1, 2])
+        # solved model includes constraints added for previous lineups
+        constraints = [event.details['constraints'] for event in profiler.events if event.phase == ProfilePhase.SOLVE]
+        self.assertEqual(constraints, sorted(set(constraints)))
+
+    def test_update_players_during_optimization(self):
+        lineups = self.lineup_optimizer.optimize(5, pool_size=5)
+        first_lineup = next(lineups)
+        injured_player = self.player_pool.get_player_by_id(max(first_lineup.players, key=lambda p: p.fppg).id)
+        self.player_pool.update_player(injured_player.id, is_injured=True)
+        boosted_player = min(self.player_pool.filtered_players, key=lambda player: player.fppg)
+        self.player_pool.update_player(boosted_player, fppg=1000)
+        for lineup in lineups:
+            self.assertNotIn(injured_player, lineup.players)
+            self.assertIn(boosted_player, lineup.players)
+        self.player_pool.update_player(injured_player, is_injured=False)
+        self.player_pool.update_player(boosted_player, max_exposure=0.5, min_exposure=None)
+        self.player_pool.update_player(injured_player, min_exposure=1)
+        lineups = list(self.lineup_optimizer.optimize(4))
+        self.assertEqual(sum(boosted_player in lineup.players for lineup in lineups), 2)
+        self.assertTrue(all(injured_player in lineup.players for lineup in lineups))
+
+    def test_update_min_exposure_during_optimization(self):
+        lineups = self.lineup_optimizer.optimize(4)
+        first_lineup = next(lineups)
+        player = next(player for player in self.player_pool.filtered_players if player not in first_lineup.players)
+        self.player_pool.update_player(player, min_exposure=0.75)
+        self.assertTrue(all(player in lineup.players for lineup in lineups))
+
+    def test_optimize_with_solution_pool(self):
+        sequential_lineups = list(self.lineup_optimizer.optimize(10, max_exposure=0.5))
+        pool_lineups = list(self.lineup_optimizer.optimize(10, max_exposure=0.5, pool_size=5))
+        self.assertEqual(len(pool_lineups), 10)
+        self.assertEqual(len({frozenset(lineup.players) for lineup in pool_lineups}), 10)
+        self.assertEqual(pool_lineups[0].players, sequential_lineups[0].players)
+        for player in self.players:
+            self.assertLessEqual(sum(player in lineup.players for lineup in pool_lineups), 5)
+
+    def test_optimize_with_workers_and_deterministic_strategy(self):
+        with patch('pydfs_lineup_optimizer.lineup_optimizer.ProcessPoolExecutor') as executor_class:
+            with self.assertWarns(UserWarning):
+                lineups = list(self.lineup_optimizer.optimize(5, workers=2))
+        executor_class.assert_not_called()
+        sequential_lineups = list(self.lineup_optimizer.optimize(5))
+        self.assertEqual([lineup.players for lineup in lineups], [lineup.players for lineup in sequential_lineups])
+
+    def test_optimize_with_workers(self):
+        self.lineup_optimizer.set_fantasy_points_strategy(RandomFantasyPointsStrategy())
+        lineups = list(self.lineup_optimizer.optimize(10, max_exposure=0.5, workers=2))
+        self.assertEqual(len(lineups), 10)
+        self.assertEqual(len({frozenset(lineup.players) for lineup in lineups}), 10)
+        for player in self.players:
+            self.assertLessEqual(sum(player in lineup.players for lineup in lineups), 5)
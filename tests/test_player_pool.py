@@ -1,10 +1,11 @@
+import pickle
 import unittest
 from uuid import uuid4
 from pydfs_lineup_optimizer import PlayerFilter
 from pydfs_lineup_optimizer.sites import SitesRegistry
 from pydfs_lineup_optimizer.constants import Site, Sport
-from pydfs_lineup_optimizer.player_pool import PlayerPool
-from pydfs_lineup_optimizer.player import Player
+from pydfs_lineup_optimizer.player_pool import PlayerPool, BaseFilter
+from pydfs_lineup_optimizer.player import Player, GameInfo, LineupPlayer
 from pydfs_lineup_optimizer.exceptions import LineupOptimizerException
 from tests.utils import load_players
 
@@ -117,6 +118,16 @@ class PlayerPoolTestCase(unittest.TestCase):
         self.player_pool.add_player(self.test_player)
         self.assertIsNone(self.player_pool.get_player_by_name('Test  Tist'))
 
+    def test_search_players(self):
+        self.assertEqual(self.player_pool.search_players('Test Tist'), [])
+        self.player_pool.add_player(self.test_player)
+        second_player = Player(player_id=str(uuid4()), first_name='Test', last_name='Tist', team='Test',
+                               fppg=10, positions=['SG'], salary=100)
+        self.player_pool.add_player(second_player)
+        self.assertEqual(self.player_pool.search_players('Test Tist'), [second_player, self.test_player])
+        self.assertEqual(self.player_pool.search_players('Tist'), [second_player])
+        self.assertEqual(self.player_pool.get_player_by_name('Tast Test', position='PG'), self.test_player)
+
     def test_get_player_by_name_multiple_return_without_position(self):
         second_player = Player(player_id=str(uuid4()), first_name='Test', last_name='Test', team='Test',
                                fppg=10, positions=['SG'], salary=100)
@@ -142,3 +153,154 @@ class PlayerPoolTestCase(unittest.TestCase):
         players = self.player_pool.filtered_players
         self.assertNotIn(self.test_player, players)
         self.assertEqual(len(self.players), len(players))
+
+    def test_filtered_players_cache(self):
+        self.player_pool.add_player(self.test_player)
+        self.assertIn(self.test_player, self.player_pool.filtered_players)
+        self.player_pool.remove_player(self.test_player)
+        self.assertNotIn(self.test_player, self.player_pool.filtered_players)
+        self.player_pool.restore_player(self.test_player)
+        self.assertIn(self.test_player, self.player_pool.filtered_players)
+        self.player_pool.exclude_teams(['Test'])
+        self.assertNotIn(self.test_player, self.player_pool.filtered_players)
+        self.player_pool.exclude_teams([])
+        self.test_player.max_exposure = 0
+        self.assertNotIn(self.test_player, self.player_pool.filtered_players)
+        self.test_player.max_exposure = None
+        self.test_player.is_injured = True
+        self.assertNotIn(self.test_player, self.player_pool.filtered_players)
+        self.player_pool.with_injured = True
+        self.assertIn(self.test_player, self.player_pool.filtered_players)
+
+    def test_filtered_players_cache_with_changed_removed_players(self):
+        self.player_pool.add_player(self.test_player)
+        player = self.player_pool.get_player_by_name('Russel Westbrook')
+        self.player_pool.remove_player(player)
+        self.assertIn(self.test_player, self.player_pool.filtered_players)
+        self.player_pool.removed_players.discard(player)
+        self.player_pool.removed_players.add(self.test_player)
+        self.player_pool.invalidate_cache()
+        self.assertIn(player, self.player_pool.filtered_players)
+        self.assertNotIn(self.test_player, self.player_pool.filtered_players)
+
+    def test_filter_players_table(self):
+        self.player_pool.add_player(self.test_player)
+        players_table = self.player_pool.players_table
+        filters = [
+            PlayerFilter(from_value=20),
+            PlayerFilter(from_value=15, to_value=40, positions=['PG']),
+            PlayerFilter(teams=['Test', 'OKC'], filter_by='salary', from_value=50),
+            PlayerFilter(positions=['PG', 'SG'], filter_by='efficiency', from_value=0.005),
+            PlayerFilter(positions=['Unknown']),
+        ]
+        for player_filter in filters:
+            for include_not_matched in (True, False):
+                self.assertEqual(
+                    players_table.get_players(player_filter.filter_players(players_table, include_not_matched)),
+                    [player for player in self.player_pool.all_players
+                     if player_filter.filter(player, include_not_matched)],
+                )
+
+    def test_filters_with_changed_players_attributes(self):
+        self.player_pool.add_player(self.test_player)
+        self.player_pool.add_filters(PlayerFilter(from_value=15))
+        self.assertNotIn(self.test_player, self.player_pool.filtered_players)
+        self.test_player.fppg = 20
+        self.assertIn(self.test_player, self.player_pool.filtered_players)
+        self.player_pool.add_filters(PlayerFilter(from_value=0.1, filter_by='efficiency'))
+        self.assertIn(self.test_player, self.player_pool.filtered_players)
+        self.test_player.salary = 1000
+        self.assertNotIn(self.test_player, self.player_pool.filtered_players)
+        self.assertEqual(self.player_pool.players_table.efficiency[-1], 0.02)
+
+    def test_custom_filter_with_changed_players_attributes(self):
+        class OwnershipFilter(BaseFilter):
+            def filter(self, player, include_not_matched=True):
+                return player.projected_ownership is None or player.projected_ownership < 0.3
+
+        self.player_pool.add_player(self.test_player)
+        self.player_pool.add_filters(OwnershipFilter())
+        self.assertIn(self.test_player, self.player_pool.filtered_players)
+        self.test_player.projected_ownership = 0.5
+        self.assertNotIn(self.test_player, self.player_pool.filtered_players)
+
+    def test_players_indexes(self):
+        game_info = GameInfo('Test', 'Test2', None)
+        test_player = Player(player_id=str(uuid4()), first_name='Test', last_name='Test', team='Test', fppg=10,
+                             positions=['PG', 'SG'], salary=100, game_info=game_info, roster_order=1)
+        self.player_pool.extend_players([test_player, test_player])
+        self.assertEqual(self.player_pool.get_players_by_team('Test'), (test_player, ))
+        self.assertIn(test_player, self.player_pool.get_players_by_position('PG'))
+        self.assertIn(test_player, self.player_pool.get_players_by_position('SG'))
+        self.assertEqual(self.player_pool.get_players_by_game(game_info), (test_player, ))
+        self.assertEqual(self.player_pool.get_players_by_roster_order(1), (test_player, ))
+        self.assertEqual(self.player_pool.get_players_by_team('Unknown'), ())
+        self.player_pool.reset_players()
+        self.assertEqual(self.player_pool.get_players_by_team('Test'), ())
+
+    def test_copy_for_position(self):
+        game_info = GameInfo('A', 'B', None)
+        player = Player('1', '1', '1', ['PG', 'SG'], 'A', 5000, 20, game_info=game_info, max_exposure=0.5)
+        mvp = player.copy_for_position('MVP', 1.5)
+        self.assertEqual(mvp.positions, ('MVP', ))
+        self.assertEqual(mvp.original_positions, ('PG', 'SG'))
+        self.assertEqual(mvp.fppg, 30)
+        self.assertEqual((mvp.id, mvp.full_name, mvp.salary, mvp.max_exposure), ('1', '1 1', 5000, 0.5))
+        self.assertEqual(player.positions, ('PG', 'SG'))
+        self.assertNotEqual(mvp, player)
+        game_info.game_started = True
+        self.assertTrue(mvp.is_game_started)
+
+    def test_lineup_player_attributes_assignment(self):
+        player = Player('1', '1', '1', ['PG'], 'A', 5000, 20)
+        lineup_player = LineupPlayer(player, 'PG')
+        lineup_player.fppg = 25
+        lineup_player.notes = 'value play'
+        self.assertEqual((lineup_player.fppg, lineup_player.notes, lineup_player.salary), (25, 'value play', 5000))
+        self.assertEqual(player.fppg, 20)
+        self.assertEqual(LineupPlayer(player, 'PG').fppg, 20)
+        unpickled_player = pickle.loads(pickle.dumps(lineup_player))
+        self.assertEqual((unpickled_player.fppg, unpickled_player.notes), (25, 'value play'))
+
+    def test_copy_for_position_with_subclass_attributes(self):
+        class SlotsPlayer(Player):
+            __slots__ = ('projection_source', )
+
+        class CustomPlayer(SlotsPlayer):
+            pass
+
+        player = CustomPlayer('1', '1', '1', ['PG'], 'A', 5000, 20)
+        player.projection_source = 'model'
+        player.notes = 'value play'
+        mvp = player.copy_for_position('MVP', 2)
+        self.assertIsInstance(mvp, CustomPlayer)
+        self.assertEqual((mvp.projection_source, mvp.notes, mvp.fppg), ('model', 'value play', 40))
+        self.assertEqual(mvp.positions, ('MVP', ))
+
+    def test_update_player(self):
+        player = self.player_pool.get_player_by_name('Russel Westbrook')
+        self.assertIn(player, self.player_pool.filtered_players)
+        changed = self.player_pool.update_player(player.id, fppg=player.fppg, is_injured=True)
+        self.assertEqual(changed, frozenset(['is_injured']))
+        self.assertNotIn(player, self.player_pool.filtered_players)
+        self.assertEqual(self.player_pool.update_player(player, is_injured=True), frozenset())
+        self.assertEqual(self.player_pool.total_updates, 1)
+        with self.assertRaises(LineupOptimizerException):
+            self.player_pool.update_player(player, salary=100)
+
+    def test_update_players(self):
+        player = self.player_pool.get_player_by_name('Russel Westbrook')
+        new_player = player.copy_for_position(player.positions[0], 2)
+        other_position_player = player.copy_for_position('MVP', 3)
+        new_player.max_exposure = 0.5
+        updated_players = self.player_pool.update_players([new_player, other_position_player, self.test_player])
+        self.assertEqual(updated_players, {player: frozenset(['fppg', 'max_exposure'])})
+        self.assertEqual((player.fppg, player.max_exposure), (new_player.fppg, 0.5))
+        self.assertEqual(self.player_pool.players_table.fppg[self.players.index(player)], new_player.fppg)
+        self.player_pool.update_player(player, min_exposure=0.2)
+        self.player_pool.update_players([new_player], attributes=['fppg'])
+        self.assertEqual(self.player_pool.get_updated_players(),
+                         {player: frozenset(['fppg', 'max_exposure', 'min_exposure'])})
+        self.assertEqual(self.player_pool.get_updated_players(1), {player: frozenset(['min_exposure'])})
+        self.player_pool.reset_players()
+        self.assertEqual(self.player_pool.total_updates, 0)
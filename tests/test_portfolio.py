@@ -0,0 +1,76 @@
+import unittest
+import numpy as np
+from pydfs_lineup_optimizer.player import Player, LineupPlayer
+from pydfs_lineup_optimizer.lineup import Lineup
+from pydfs_lineup_optimizer.players_table import LineupsBitset
+from pydfs_lineup_optimizer.portfolio import PortfolioSelector
+
+
+class PortfolioSelectorTestCase(unittest.TestCase):
+    def setUp(self):
+        self.players = [Player(str(i), str(i), str(i), ['P'], 'test', 5000, 10 + i) for i in range(70)]
+
+    def create_lineup(self, *indices):
+        return Lineup([LineupPlayer(self.players[i], 'P') for i in indices])
+
+    def test_lineups_bitset(self):
+        lineups = [self.create_lineup(0, 1, 65), self.create_lineup(1, 65, 69), self.create_lineup(2, 3)]
+        bitset = LineupsBitset(lineups)
+        self.assertEqual(bitset.bits.shape, (3, 1))
+        bitset = LineupsBitset(lineups, self.players)
+        self.assertEqual(bitset.bits.shape, (3, 2))
+        np.testing.assert_array_equal(bitset.get_overlaps(0), [3, 2, 0])
+        np.testing.assert_array_equal(bitset.sizes, [3, 3, 2])
+        np.testing.assert_array_equal(bitset.get_max_overlaps([self.create_lineup(1, 2, 3), lineups[0]]), [2, 3])
+
+    def test_lineups_bitset_add_lineups(self):
+        bitset = LineupsBitset(players=self.players[:2])
+        bitset.add_lineups([self.create_lineup(0, 1, 2)], add_players=False)
+        bitset.add_lineups([self.create_lineup(0, 1), self.create_lineup(1, 0, 2)])
+        self.assertEqual(len(bitset.players), 3)
+        np.testing.assert_array_equal(bitset.sizes, [2, 2, 3])
+        keys = bitset.get_keys()
+        self.assertEqual(keys[0], keys[1])
+        self.assertNotEqual(keys[1], keys[2])
+
+    def test_lineups_bitset_add_lineups_one_by_one(self):
+        lineups = [self.create_lineup(i, (i + 1) % 70, (i * 7) % 70) for i in range(70)]
+        bitset = LineupsBitset()
+        for lineup in lineups:
+            bitset.add_lineups([lineup])
+        expected_bitset = LineupsBitset(lineups)
+        self.assertEqual(bitset.players, expected_bitset.players)
+        self.assertEqual(bitset.bits.shape, (70, 2))
+        np.testing.assert_array_equal(bitset.bits, expected_bitset.bits)
+        np.testing.assert_array_equal(bitset.incidence, expected_bitset.incidence)
+        np.testing.assert_array_equal(bitset.sizes, expected_bitset.sizes)
+        np.testing.assert_array_equal(bitset.get_overlaps(5), expected_bitset.get_overlaps(5))
+
+    def test_select_by_projection(self):
+        candidates = [
+            self.create_lineup(60, 61, 62),
+            self.create_lineup(60, 61, 62),
+            self.create_lineup(60, 61, 50),
+            self.create_lineup(60, 40, 41),
+            self.create_lineup(30, 31, 32),
+        ]
+        selector = PortfolioSelector(candidates)
+        self.assertEqual(selector.select(3), [candidates[0], candidates[2], candidates[3]])
+        self.assertEqual(selector.select(3, max_overlap=1), [candidates[0], candidates[3], candidates[4]])
+        self.assertEqual(selector.select(3, max_exposure=0.5), [candidates[0], candidates[4]])
+        self.players[60].max_exposure = 1
+        self.assertEqual(selector.select(3, max_exposure=0.5), [candidates[0], candidates[3], candidates[4]])
+        self.assertEqual(selector.select(0), [])
+
+    def test_select_by_simulation(self):
+        candidates = [self.create_lineup(0, 1), self.create_lineup(2, 3), self.create_lineup(4, 5)]
+        scores = np.array([
+            [10, 9, 0],
+            [10, 9, 0],
+            [0, 0, 8],
+            [0, 0, 8],
+        ])
+        selector = PortfolioSelector(candidates, scores=scores)
+        self.assertEqual(selector.select(2), [candidates[0], candidates[2]])
+        selector = PortfolioSelector(candidates, values=[1, 3, 2])
+        self.assertEqual(selector.select(2), [candidates[1], candidates[2]])
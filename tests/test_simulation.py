@@ -0,0 +1,39 @@
+import unittest
+import numpy as np
+from pydfs_lineup_optimizer.player import Player, LineupPlayer
+from pydfs_lineup_optimizer.lineup import Lineup
+from pydfs_lineup_optimizer.simulation import LineupsSimulation
+from pydfs_lineup_optimizer.exceptions import LineupOptimizerException
+
+
+class LineupsSimulationTestCase(unittest.TestCase):
+    def setUp(self):
+        self.players = [Player(str(i), str(i), str(i), ['P'], 'test', 5000, 10) for i in range(4)]
+        self.lineups = [
+            Lineup([LineupPlayer(self.players[0], 'P'), LineupPlayer(self.players[1], 'P')]),
+            Lineup([LineupPlayer(self.players[1], 'P'), LineupPlayer(self.players[2], 'P')]),
+        ]
+        self.field_lineups = [Lineup([LineupPlayer(self.players[2], 'P'), LineupPlayer(self.players[3], 'P')])]
+        self.scenarios = np.array([
+            [10, 5, 0, 0],
+            [0, 5, 10, 0],
+            [0, 0, 10, 20],
+            [10, 10, 10, 10],
+        ])
+
+    def test_lineups_scores(self):
+        simulation = LineupsSimulation(self.lineups, self.players, self.scenarios)
+        np.testing.assert_array_equal(simulation.scores, [[15, 5], [5, 15], [0, 10], [20, 20]])
+        np.testing.assert_array_equal(simulation.get_mean(), [10, 12.5])
+        np.testing.assert_array_equal(simulation.get_percentiles([0, 100]), [[0, 5], [20, 20]])
+
+    def test_top_rate(self):
+        simulation = LineupsSimulation(self.lineups, self.players, self.scenarios, field_lineups=self.field_lineups)
+        np.testing.assert_array_equal(simulation.get_top_rate(0.3), [0.5, 0.5])
+        np.testing.assert_array_equal(simulation.get_top_rate(1), [1, 1])
+        report = simulation.get_report(percentiles=[50], tops=[0.3])
+        self.assertEqual(report[1], {'mean': 12.5, 'std': simulation.get_std()[1], 'p50': 12.5, 'top 30%': 0.5})
+
+    def test_unknown_player(self):
+        with self.assertRaises(LineupOptimizerException):
+            LineupsSimulation(self.lineups, self.players[:2], self.scenarios[:, :2])
@@ -0,0 +1,106 @@
+import os
+from datetime import datetime, timedelta, timezone
+import unittest
+from tempfile import TemporaryDirectory
+from pytz import timezone as pytz_timezone
+from pydfs_lineup_optimizer import get_optimizer
+from pydfs_lineup_optimizer.constants import Site, Sport
+from pydfs_lineup_optimizer.player import Player, GameInfo
+from pydfs_lineup_optimizer.snapshot import save_players_snapshot, load_players_snapshot
+from pydfs_lineup_optimizer.tz import get_timezone, set_timezone
+
+
+DRAFTKINGS_CSV = '''Position,Name + ID,Name,ID,Roster Position,Salary,Game Info,TeamAbbrev,AvgPointsPerGame
+QB,Tom Brady (1),Tom Brady,1,QB,7000,TB@DAL 09/09/2021 08:20PM ET,TB,25.5
+WR,Mike Evans (2),Mike Evans,2,WR/FLEX,6500,TB@DAL 09/09/2021 08:20PM ET,TB,18.1
+RB,Ezekiel Elliott (3),Ezekiel Elliott,3,RB/FLEX,7500,TB@DAL 09/09/2021 08:20PM ET,DAL,16
+TE,Kyle Pitts (4),Kyle Pitts,4,TE/FLEX,4500,In Progress,ATL,0
+'''
+
+
+class PlayersSnapshotTestCase(unittest.TestCase):
+    def assertPlayersEqual(self, players, loaded_players):
+        self.assertEqual(len(players), len(loaded_players))
+        for player, loaded_player in zip(players, loaded_players):
+            for attribute in Player.__slots__:
+                if attribute == 'game_info':
+                    continue
+                self.assertEqual(getattr(player, attribute), getattr(loaded_player, attribute), attribute)
+            if player.game_info is None:
+                self.assertIsNone(loaded_player.game_info)
+            else:
+                for attribute in GameInfo.__slots__:
+                    self.assertEqual(getattr(player.game_info, attribute), getattr(loaded_player.game_info, attribute))
+
+    def test_snapshot_roundtrip(self):
+        game = GameInfo('A', 'B', None, game_started=True)
+        players = [
+            Player('1', 'First', 'Last', ['PG', 'SG'], 'A', 5000, 20.5, is_injured=True, game_info=game,
+                   max_exposure=0.5, roster_order=2, is_confirmed_starter=True, fppg_floor=10),
+            Player('2', 'Second', '', ['C'], 'B', 4000, 0, game_info=game, projected_ownership=0.1),
+            Player('3', 'Third', 'Last', ['SF'], 'C', 3000, 1),
+        ]
+        players.append(players[0].copy_for_position('MVP', 2))
+        with TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'players.npz')
+            save_players_snapshot(players, path)
+            loaded_players = load_players_snapshot(path)
+        self.assertPlayersEqual(players, loaded_players)
+        self.assertIs(loaded_players[0].game_info, loaded_players[1].game_info)
+        self.assertIs(loaded_players[0].game_info, loaded_players[3].game_info)
+
+    def test_snapshot_game_start_roundtrip(self):
+        starts_at = datetime(2021, 9, 9, 20, 20, 15, 500)
+        games = [
+            GameInfo('A', 'B', starts_at),
+            GameInfo('C', 'D', starts_at.replace(tzinfo=pytz_timezone('US/Eastern'))),
+            GameInfo('E', 'F', starts_at.replace(tzinfo=timezone(timedelta(hours=-5)))),
+        ]
+        players = [Player(str(i), 'First', 'Last', ['PG'], 'A', 5000, 20, game_info=game)
+                   for i, game in enumerate(games)]
+        with TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'players.npz')
+            save_players_snapshot(players, path)
+            loaded_players = load_players_snapshot(path)
+        self.assertPlayersEqual(players, loaded_players)
+        self.assertEqual(loaded_players[1].game_info.starts_at.tzinfo.zone, 'US/Eastern')
+        self.assertEqual(loaded_players[2].game_info.starts_at.utcoffset(), timedelta(hours=-5))
+
+    def test_load_players_from_csv_with_snapshot(self):
+        with TemporaryDirectory() as directory:
+            filename = os.path.join(directory, 'players.csv')
+            with open(filename, 'w') as csv_file:
+                csv_file.write(DRAFTKINGS_CSV)
+            snapshot_dir = os.path.join(directory, 'snapshots')
+            optimizer = get_optimizer(Site.DRAFTKINGS, Sport.FOOTBALL)
+            optimizer.load_players_from_csv(filename)
+            players = optimizer.player_pool.all_players
+            for _ in range(2):
+                optimizer = get_optimizer(Site.DRAFTKINGS, Sport.FOOTBALL)
+                optimizer.load_players_from_csv(filename, snapshot_dir=snapshot_dir)
+                self.assertPlayersEqual(players, optimizer.player_pool.all_players)
+                self.assertEqual(len(os.listdir(snapshot_dir)), 1)
+            optimizer = get_optimizer(Site.DRAFTKINGS, Sport.BASKETBALL)
+            optimizer.load_players_from_csv(filename, snapshot_dir=snapshot_dir)
+            self.assertEqual(len(os.listdir(snapshot_dir)), 2)
+
+    def test_snapshot_depends_on_timezone(self):
+        with TemporaryDirectory() as directory:
+            filename = os.path.join(directory, 'players.csv')
+            with open(filename, 'w') as csv_file:
+                csv_file.write(DRAFTKINGS_CSV)
+            snapshot_dir = os.path.join(directory, 'snapshots')
+            optimizer = get_optimizer(Site.DRAFTKINGS, Sport.FOOTBALL)
+            optimizer.load_players_from_csv(filename, snapshot_dir=snapshot_dir)
+            default_tz = get_timezone()
+            set_timezone('UTC')
+            try:
+                optimizer = get_optimizer(Site.DRAFTKINGS, Sport.FOOTBALL)
+                optimizer.load_players_from_csv(filename)
+                players = optimizer.player_pool.all_players
+                optimizer = get_optimizer(Site.DRAFTKINGS, Sport.FOOTBALL)
+                optimizer.load_players_from_csv(filename, snapshot_dir=snapshot_dir)
+            finally:
+                set_timezone(default_tz)
+            self.assertPlayersEqual(players, optimizer.player_pool.all_players)
+            self.assertEqual(len(os.listdir(snapshot_dir)), 2)
@@ -0,0 +1,121 @@
+import pickle
+import unittest
+import numpy as np
+from pydfs_lineup_optimizer.solvers import get_default_solver, SolverSign, ConstraintsMatrix, \
+    SolverInfeasibleSolutionException
+from pydfs_lineup_optimizer.solvers.recording import RecordingSolver, apply_operations
+
+
+class PersistentModelTestCase(unittest.TestCase):
+    def setUp(self):
+        self.solver = get_default_solver()()
+        self.solver.setup_solver()
+        self.variables = [self.solver.add_variable('var_%d' % i) for i in range(3)]
+        self.solver.add_constraint(self.variables, None, SolverSign.EQ, 2, name='total')
+
+    def solve_iteration(self, excluded_variable=None):
+        solver = self.solver.start_iteration()
+        solver.set_objective(self.variables, [3, 2, 1])
+        if excluded_variable is not None:
+            solver.add_constraint([excluded_variable], None, SolverSign.EQ, 0)
+            solver.add_variable('iteration_var')
+        result = solver.solve()
+        self.solver.finish_iteration()
+        return {variable.name for variable in result}
+
+    def test_iteration_constraints_are_discarded(self):
+        self.assertEqual(self.solve_iteration(self.variables[0]), {'var_1', 'var_2'})
+        self.assertEqual(self.solve_iteration(), {'var_0', 'var_1'})
+        self.assertEqual(self.solve_iteration(self.variables[1]), {'var_0', 'var_2'})
+
+    def test_base_model_changes_are_kept(self):
+        self.solve_iteration()
+        self.solver.add_constraint([self.variables[0]], None, SolverSign.EQ, 0)
+        self.assertEqual(self.solve_iteration(), {'var_1', 'var_2'})
+
+    def test_iteration_variables_are_discarded(self):
+        model_size = self.solver.get_model_size()
+        solver = self.solver.start_iteration()
+        solver.set_objective(self.variables, [3, 2, 1])
+        iteration_variable = solver.add_variable('iteration_var')
+        solver.add_constraint([iteration_variable, self.variables[0]], None, SolverSign.LTE, 1)
+        self.assertEqual({variable.name for variable in solver.solve()}, {'var_0', 'var_1'})
+        self.solver.finish_iteration()
+        self.assertEqual(self.solver.get_model_size(), model_size)
+
+    def test_infeasible_model_reports_named_constraints(self):
+        if get_default_solver().__name__ == 'MIPSolver':
+            self.skipTest("MIP backend doesn't report invalid constraints")
+        solver = self.solver.start_iteration()
+        solver.set_objective(self.variables, [3, 2, 1])
+        solver.add_constraint(self.variables, None, SolverSign.GTE, 3, name='at_least_three')
+        solver.add_constraint(self.variables[:1], None, SolverSign.LTE, 1)
+        with self.assertRaises(SolverInfeasibleSolutionException) as context:
+            solver.solve()
+        self.solver.finish_iteration()
+        invalid_constraints = context.exception.get_user_defined_constraints()
+        self.assertTrue(invalid_constraints)
+        self.assertLessEqual(set(invalid_constraints), {'total', 'at_least_three'})
+
+    def test_solution_pool(self):
+        solver = self.solver.start_iteration()
+        solver.set_objective(self.variables, [3, 2, 1])
+        solutions = solver.solve_pool(3)
+        self.solver.finish_iteration()
+        self.assertEqual({variable.name for variable in solutions[0]}, {'var_0', 'var_1'})
+        self.assertEqual(len(solutions), len({frozenset(solution) for solution in solutions}))
+
+    def test_constraints_matrix(self):
+        matrix = ConstraintsMatrix.from_dense(
+            np.array([[1, 1, 0], [0, 2, 1]]), [SolverSign.LTE, SolverSign.GTE], [1, 1], ['first', 'second'])
+        self.assertEqual(list(matrix), [([0, 1], [1.0, 1.0], SolverSign.LTE, 1.0, 'first'),
+                                        ([1, 2], [2.0, 1.0], SolverSign.GTE, 1.0, 'second')])
+        self.solver.add_constraints_matrix(self.variables, matrix)
+        self.assertEqual(self.solve_iteration(), {'var_0', 'var_2'})
+
+
+class RecordingSolverTestCase(unittest.TestCase):
+    def setUp(self):
+        self.solver = RecordingSolver(get_default_solver()())
+        self.solver.setup_solver()
+        self.variables = [self.solver.add_variable('var_%d' % i) for i in range(3)]
+        self.solver.add_constraint(self.variables, None, SolverSign.EQ, 2, name='total')
+
+    def solve_copy(self, model, operations, iteration_operations):
+        solver, variables = pickle.loads(model)
+        apply_operations(solver, variables, operations)
+        iteration_solver = solver.start_iteration()
+        apply_operations(iteration_solver, variables, iteration_operations)
+        result = iteration_solver.solve()
+        solver.finish_iteration()
+        return {variable.name for variable in result}
+
+    def test_model_is_restored_from_operations(self):
+        model = self.solver.dump_model()
+        self.assertEqual(self.solver.operations, [])
+        self.solver.add_constraint([self.variables[0]], None, SolverSign.EQ, 0)
+        solver = self.solver.start_iteration()
+        solver.set_objective(self.variables, [3, 2, 1])
+        new_variable = solver.add_variable('iteration_var')
+        solver.add_constraint([new_variable, self.variables[1]], [1, 1], SolverSign.LTE, 1)
+        restored_result = self.solve_copy(model, self.solver.operations, solver.operations)
+        result = {variable.name for variable in solver.solve()}
+        self.solver.finish_iteration()
+        self.assertEqual(result, {'var_1', 'var_2'})
+        self.assertEqual(restored_result, result)
+        self.assertNotIn('iteration_var', self.solver.variables)
+
+    def test_variable_rhs_is_restored_from_operations(self):
+        model = self.solver.dump_model()
+        solver = self.solver.start_iteration()
+        iteration_solver = RecordingSolver()
+        for recording_solver in (solver, iteration_solver):
+            recording_solver.set_objective(self.variables, [1, 2, 3])
+            new_variable = recording_solver.add_variable('iteration_var')
+            recording_solver.add_constraint([new_variable], None, SolverSign.EQ, 1)
+            recording_solver.add_constraint(self.variables[:2], None, SolverSign.GTE, 2 * new_variable)
+        restored_result = self.solve_copy(model, self.solver.operations, iteration_solver.operations)
+        result = {variable.name for variable in solver.solve()}
+        self.solver.finish_iteration()
+        self.assertEqual(result, {'var_0', 'var_1', 'iteration_var'})
+        self.assertEqual(restored_result, result)
@@ -8,6 +8,7 @@ from pydfs_lineup_optimizer.utils import ratio, get_positions_for_optimizer, lin
     list_intersection
 from pydfs_lineup_optimizer.sites.draftkings.classic.settings import DraftKingsBasketballSettings, \
     DraftKingsFootballSettings, DraftKingsBaseballSettings, DraftKingsHockeySettings
+from pydfs_lineup_optimizer.sites.fanduel.classic.settings import FanDuelBasketballSettings
 from pydfs_lineup_optimizer.tz import get_timezone, set_timezone
 from .utils import create_players
 
@@ -61,6 +62,14 @@ class PositionsConverterTestCase(unittest.TestCase):
         self.assertEqual(positions[('1', '3')], 2)
         self.assertEqual(positions[('1', '2', '3')], 7)
 
+    def test_optimizer_positions_processing_cache(self):
+        optimizer = LineupOptimizer(self.TestSettings)
+        multi_positions = {('1', '2'), ('2', '3'), ('1', '3')}
+        positions = get_positions_for_optimizer(optimizer.settings.positions, multi_positions)
+        positions[('1', )] = 100
+        self.assertEqual(get_positions_for_optimizer(optimizer.settings.positions, multi_positions)[('1', )], 1)
+        self.assertEqual(len(get_positions_for_optimizer(optimizer.settings.positions, {('1', '2')})), 6)
+
 
 class LineupBuildingTestCase(unittest.TestCase):
     @classmethod
@@ -85,6 +94,19 @@ class LineupBuildingTestCase(unittest.TestCase):
             # 3 C can't be linked
             self.link_nba_positions(create_players(['PG', 'SG', 'SF', 'PF', 'C', 'SG', 'C', 'C']))
 
+    def test_multi_positional_lineup_building(self):
+        link_fd_nba_positions = partial(link_players_with_positions, positions=FanDuelBasketballSettings.positions)
+        players = create_players(['PG/C', 'PG/SG', 'SG/SF', 'SG/SF', 'SF/PF', 'SF/PF', 'PF/SG', 'PF/PG', 'PG/SG'])
+        players_with_positions = link_fd_nba_positions(players)
+        self.assertEqual(len({id(position) for position in players_with_positions.values()}), len(players))
+        for player, position in players_with_positions.items():
+            self.assertTrue(list_intersection(player.positions, position.positions))
+        self.assertEqual(players_with_positions[players[0]].name, 'C')
+        with self.assertRaises(LineupOptimizerException):
+            # Nobody can play C
+            link_fd_nba_positions(create_players(['PG/SG', 'PG/SG', 'SG/SF', 'SG/SF', 'SF/PF', 'SF/PF', 'PF/SG',
+                                                  'PF/PG', 'PG/SG']))
+
     def test_football_lineup_building_correct(self):
         self.link_nfl_positions(create_players(['QB', 'WR', 'WR', 'WR', 'WR', 'RB', 'RB', 'TE', 'DST']))
 